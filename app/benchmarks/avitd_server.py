@@ -0,0 +1,142 @@
+# app/benchmarks/avitd_server.py
+"""
+Local Stand-in AVITD Server
+
+Serves recorded A View in the Dark pages from app/benchmarks/fixtures on
+127.0.0.1 so the scraper can be exercised without touching the real site.
+It behaves like a well-configured origin: keep-alive, gzip when asked,
+ETag and Last-Modified on every page, and 304 for conditional requests
+that match. Faults can be injected to exercise retries and timeouts.
+
+Use it from a script:
+    with AVITDStandInServer() as server:
+        AVITDScraper(url=server.url).scrape_guilds_and_shops()
+
+or run it by hand (Ctrl+C to stop):
+    python -m app.benchmarks.avitd_server [port] [fixture]
+"""
+
+import gzip
+import hashlib
+import os
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+DEFAULT_PAGE = 'avitd.html'
+
+
+class AVITDStandInServer:
+    """Threaded HTTP server for the recorded AVITD page, usable as a context manager."""
+
+    def __init__(self, page: str = DEFAULT_PAGE, port: int = 0, fail_first: int = 0, delay_s: float = 0.0) -> None:
+        """
+        Args:
+            page (str, optional): Fixture file served at '/' (an AVITD page or a community feed).
+            port (int, optional): Port to listen on; 0 picks a free one.
+            fail_first (int, optional): Answer this many requests with 503 before serving normally.
+            delay_s (float, optional): Sleep before answering each request (to trigger read timeouts).
+        """
+        with open(os.path.join(FIXTURES_DIR, page), 'rb') as f:
+            self.set_body(f.read())
+        self.content_type = 'application/json' if page.endswith('.json') else 'text/html; charset=utf-8'
+        self.fail_first = fail_first
+        self.delay_s = delay_s
+        self.requests = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/"
+
+    def set_body(self, body: bytes) -> None:
+        """Replace the served page (as if the site updated); refreshes ETag and Last-Modified."""
+        self.body = body
+        self.gzipped = gzip.compress(body)
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.last_modified = formatdate(time.time(), usegmt=True)
+
+    def start(self) -> 'AVITDStandInServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'AVITDStandInServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, so pooled clients reuse connections
+            # Headers and body go out in separate writes; without TCP_NODELAY, Nagle's algorithm
+            # holds the body back for the client's delayed ACK on every reused connection
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.requests += 1
+                    failing = server.fail_first > 0
+                    if failing:
+                        server.fail_first -= 1
+                if server.delay_s:
+                    time.sleep(server.delay_s)
+                if failing:
+                    self._reply(503, b'')
+                    return
+
+                if (self.headers.get('If-None-Match') == server.etag
+                        or (not self.headers.get('If-None-Match')
+                            and self.headers.get('If-Modified-Since') == server.last_modified)):
+                    with server._lock:
+                        server.not_modified += 1
+                    self._reply(304, b'')
+                    return
+
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    self._reply(200, server.gzipped, {'Content-Encoding': 'gzip'})
+                else:
+                    self._reply(200, server.body)
+
+            def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+                self.send_response(status)
+                self.send_header('ETag', server.etag)
+                self.send_header('Last-Modified', server.last_modified)
+                self.send_header('Content-Type', server.content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass  # Keep benchmark output clean
+
+        return Handler
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    fixture = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PAGE
+    with AVITDStandInServer(page=fixture, port=port) as stand_in:
+        print(f"Serving {fixture} at {stand_in.url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
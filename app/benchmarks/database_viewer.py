@@ -0,0 +1,146 @@
+# app/benchmarks/database_viewer.py
+"""
+Database Viewer Paging Benchmark
+
+Copies the bundled database and adds a multi-million-row table (coin
+history and log sized), then:
+
+- checks that paging through every table with TablePager, sorted and
+  filtered, yields exactly what a single ORDER BY query returns,
+- times what opening the viewer costs now (list tables, first page of the
+  first tab) against the old eager load (SELECT * of every table),
+- times the first page after sorting and filtering the large table.
+
+Run from the repository root:
+    python -m app.benchmarks.database_viewer [rows]
+"""
+
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+from app.database.table_pager import TablePager, quote_identifier
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+ROWS = 2_000_000
+OPEN_BUDGET_S = 1.0
+
+
+def build_database(path: str, rows: int) -> None:
+    """Copy the bundled database and add a large coin_history table."""
+    shutil.copy(os.path.join(APP_DIR, 'sessions', 'rbc_map_data.db'), path)
+    random.seed(1)
+    with sqlite3.connect(path) as conn:
+        conn.execute("""
+            CREATE TABLE coin_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                character_id INTEGER,
+                pocket INTEGER,
+                bank INTEGER,
+                note TEXT,
+                recorded_at TEXT
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO coin_history (character_id, pocket, bank, note, recorded_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                (i % 7 + 1, random.randint(0, 5000), random.choice([None, random.randint(0, 10 ** 6)]),
+                 random.choice(['deposit', 'withdraw', 'shop', None]), f"2024-01-01 00:{i % 60:02d}:{i % 60:02d}")
+                for i in range(rows)
+            )
+        )
+        conn.commit()
+
+
+def page_all(pager: TablePager) -> list[tuple]:
+    rows = []
+    while not pager.exhausted:
+        rows.extend(pager.fetch_page())
+    return rows
+
+
+def check_paging(conn: sqlite3.Connection, table: str) -> list[str]:
+    """Compare paged output with a single ordered query for each column, both directions, with and without a filter."""
+    failures = []
+    pager = TablePager(conn, table, page_size=7)
+    select = ', '.join(quote_identifier(column) for column in pager.columns)
+    for column in [None, *range(len(pager.columns))]:
+        for descending in (False, True):
+            for text in ('', 'a', '1'):
+                pager.set_sort(column, descending)
+                pager.set_filter(text)
+                direction = 'DESC' if descending else 'ASC'
+                order = f"rowid {direction}"
+                if column is not None:
+                    order = f"{quote_identifier(pager.columns[column])} {direction}, {order}"
+                where = ''
+                params = []
+                if text:
+                    where = " WHERE " + " OR ".join(f"CAST({quote_identifier(c)} AS TEXT) LIKE ?" for c in pager.columns)
+                    params = [f"%{text}%"] * len(pager.columns)
+                expected = conn.execute(f"SELECT {select} FROM {quote_identifier(table)}{where} ORDER BY {order}", params).fetchall()
+                if page_all(pager) != expected:
+                    failures.append(f"{table}: sort={column} desc={descending} filter={text!r}")
+    return failures
+
+
+def main() -> int:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    failures = []
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'viewer.db')
+        print(f"Building database with {rows:,} coin_history rows...")
+        build_database(path, rows)
+
+        with sqlite3.connect(path) as conn:
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+            for table in tables:
+                if table != 'coin_history':
+                    failures.extend(check_paging(conn, table))
+
+            # Paging correctness on a slice of the big table
+            conn.execute("CREATE TEMP TABLE coin_sample AS SELECT * FROM coin_history WHERE id <= 3000")
+            failures.extend(check_paging(conn, 'coin_sample'))
+
+        # Opening: list tables and show the first page of the big table
+        start = time.perf_counter()
+        with sqlite3.connect(path) as conn:
+            conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+            pager = TablePager(conn, 'coin_history')
+            pager.fetch_page()
+            for _ in range(5):  # scrolling a few pages
+                pager.fetch_page()
+        open_s = time.perf_counter() - start
+        print(f"Open viewer (lazy, 6 pages):   {open_s * 1000:8.1f} ms")
+
+        start = time.perf_counter()
+        with sqlite3.connect(path) as conn:
+            for table in tables:
+                conn.execute(f"SELECT * FROM {quote_identifier(table)}").fetchall()
+        print(f"Open viewer (eager SELECT *):  {(time.perf_counter() - start) * 1000:8.1f} ms (before widget items)")
+
+        with sqlite3.connect(path) as conn:
+            pager = TablePager(conn, 'coin_history')
+            for label, action in [
+                ("Sort by pocket (unindexed)", lambda: pager.set_sort(pager.columns.index('pocket'), True)),
+                ("Sort by id (rowid alias)", lambda: pager.set_sort(pager.columns.index('id'), True)),
+                ("Filter 'withdraw'", lambda: (pager.set_sort(None), pager.set_filter('withdraw'))),
+            ]:
+                start = time.perf_counter()
+                action()
+                pager.fetch_page()
+                print(f"{label + ':':<31}{(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    if open_s > OPEN_BUDGET_S:
+        failures.append(f"opening took {open_s:.2f}s, budget {OPEN_BUDGET_S:.0f}s")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# app/benchmarks/hot_log.py
+"""
+Hot-Path Logging Benchmark
+
+Times a draw_minimap-style per-cell debug message written the old way
+(eager f-string on the root logger) against HotPathLogger, with the
+logger quieted to INFO and at DEBUG (sampled and rate limited), and
+checks how many records each actually emits.
+
+Run from the repository root:
+    python -m app.benchmarks.hot_log [calls]
+"""
+
+import logging
+import sys
+import timeit
+
+from app.utils.hot_log import HotPathLogger, set_tracing
+
+CALLS = 200_000
+
+
+class CountingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+        self.count += 1
+
+
+def main() -> int:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else CALLS
+    failures = []
+    handler = CountingHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.DEBUG)
+
+    hot = HotPathLogger('bench.minimap')
+    plain = logging.getLogger('bench.plain')
+    x0, y0 = 12, 34
+
+    def eager() -> None:
+        plain.debug(f"Drawing grid cell at column_index={x0}, row_index={y0}, x0={x0 * 10}, y0={y0 * 10}")
+
+    def lazy() -> None:
+        hot.debug("Drawing grid cell at column_index=%s, row_index=%s, x0=%s, y0=%s", x0, y0, x0 * 10, y0 * 10)
+
+    print(f"{calls:,} per-cell debug calls:")
+    for label, logger, level, func in (
+        ("eager f-string, DEBUG", plain, logging.DEBUG, eager),
+        ("eager f-string, quieted to INFO", plain, logging.INFO, eager),
+        ("HotPathLogger, DEBUG (sampled)", hot.logger, logging.DEBUG, lazy),
+        ("HotPathLogger, quieted to INFO", hot.logger, logging.INFO, lazy),
+    ):
+        logger.setLevel(level)
+        handler.count = 0
+        elapsed = timeit.timeit(func, number=calls)
+        print(f"  {label:<34}{elapsed * 1e9 / calls:8.0f} ns/call  {handler.count:>8,} records")
+        if func is lazy and handler.count > 2:
+            failures.append(f"{label}: expected at most 2 records in one run, got {handler.count}")
+
+    hot.logger.setLevel(logging.INFO)
+    set_tracing(True)
+    handler.count = 0
+    for _ in range(1000):
+        lazy()
+    if handler.count != 1000:
+        failures.append(f"tracing should emit every call, got {handler.count} of 1000")
+    set_tracing(False)
+    if hot.logger.level != logging.INFO:
+        failures.append("tracing off did not restore the logger level")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# app/benchmarks/import_time.py
+"""
+Startup Import-Time Regression Check
+
+Imports the modules main() needs before the first window appears in a fresh
+interpreter under `python -X importtime`, then checks that:
+
+- the total import time stays under the budget,
+- scraper/parser-only dependencies (requests, bs4) are not imported,
+- importing creates no files or directories (no side effects).
+
+Exits non-zero when any check fails. Run from the repository root:
+    python -m app.benchmarks.import_time [budget_ms]
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Everything main() imports before constructing RBCCommunityMap
+STARTUP_IMPORTS = [
+    'app.config.dependencies',
+    'app.config.constants',
+    'app.database.schema',
+    'app.gui.mainwindow',
+]
+
+# Modules that must only be loaded by the scraper and HTML parser workers
+LAZY_ONLY = ['requests', 'bs4']
+
+IMPORT_BUDGET_MS = 1500
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def run_importtime(cwd: str) -> tuple[int, str, list[tuple[int, int, str]]]:
+    """
+    Import STARTUP_IMPORTS in a fresh interpreter.
+
+    Returns:
+        tuple: (exit code, stderr without importtime lines, [(cumulative_us, depth, module)])
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, QT_QPA_PLATFORM='offscreen')
+    code = "; ".join(f"import {module}" for module in STARTUP_IMPORTS)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    entries, errors = [], []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((int(match.group(2)), len(match.group(3)) // 2, match.group(4)))
+        elif not line.startswith('import time:'):
+            errors.append(line)
+    return result.returncode, "\n".join(errors), entries
+
+
+def main() -> int:
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else IMPORT_BUDGET_MS
+    failures = []
+
+    with tempfile.TemporaryDirectory() as cwd:
+        returncode, errors, entries = run_importtime(cwd)
+        created = os.listdir(cwd)
+
+    if returncode != 0:
+        print(f"Startup imports failed:\n{errors}")
+        return 1
+
+    loaded = {module for _, _, module in entries}
+    top_level = [(cumulative, module) for cumulative, depth, module in entries if depth == 0]
+    total_ms = sum(cumulative for cumulative, _ in top_level) / 1000
+
+    print(f"Startup imports: {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    for cumulative, module in sorted(top_level, reverse=True)[:10]:
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    if total_ms > budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget {budget_ms:.0f} ms")
+    for module in LAZY_ONLY:
+        if module in loaded:
+            failures.append(f"'{module}' is imported at startup; it should load inside its worker")
+    if created:
+        failures.append(f"importing created files in the working directory: {', '.join(sorted(created))}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# app/benchmarks/ingestion.py
+"""
+Location Ingestion Benchmark
+
+Runs the ingestion pipeline in app.core.ingestion entirely offline:
+
+- file mode: the recorded AVITD page and community feed from fixtures,
+  checking what normalize/validate/merge keep and drop,
+- conflict and freshness rules between overlapping feeds,
+- parallel vs sequential fetch of SOURCES stand-in servers that each take
+  DELAY_S to answer.
+
+Requires requests and bs4. Run from the repository root:
+    python -m app.benchmarks.ingestion [sources]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from app.benchmarks.avitd_server import FIXTURES_DIR, AVITDStandInServer
+from app.core.http_session import close_session
+from app.core.ingestion import AVITDSource, CommunityFeedSource, ingest, load_street_coordinates
+
+BUNDLED_DB = os.path.join(os.path.dirname(__file__), '..', 'sessions', 'rbc_map_data.db')
+SOURCES = 6
+DELAY_S = 0.25
+
+
+def write_feed(directory: str, name: str, locations: list[dict], age: timedelta = timedelta()) -> str:
+    """Write a community feed file whose "updated" time is age ago."""
+    path = os.path.join(directory, f"{name}.json")
+    updated = (datetime.now().astimezone() - age).isoformat()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'name': name, 'updated': updated, 'locations': locations}, f)
+    return path
+
+
+def main() -> int:
+    sources = int(sys.argv[1]) if len(sys.argv) > 1 else SOURCES
+    failures = []
+    with sqlite3.connect(f"file:{BUNDLED_DB}?mode=ro", uri=True) as conn:
+        columns, rows = load_street_coordinates(conn)
+
+    # File mode: the recorded page and feed, no network at all
+    merged = ingest([
+        AVITDSource(path=os.path.join(FIXTURES_DIR, 'avitd.html')),
+        CommunityFeedSource(path=os.path.join(FIXTURES_DIR, 'community_feed.json')),
+    ], columns, rows)
+    counts = {table: len(result['locations']) for table, result in merged.items()}
+    print(f"File mode: {counts}")
+    expected = {'guilds': 18, 'shops': 25, 'taverns': 2, 'userbuildings': 2}
+    if counts != expected:
+        failures.append(f"file mode kept {counts}, expected {expected}")
+    if not merged['guilds']['authoritative'] or merged['taverns']['authoritative']:
+        failures.append("only AVITD tables should be authoritative")
+    if ('Stand-in Feed Manor', 'Juniper', '20th') not in merged['userbuildings']['locations']:
+        failures.append("feed street coordinates were not normalized to street names")
+
+    # Conflicts: higher priority wins, then the more recent; stale feeds are ignored
+    with tempfile.TemporaryDirectory() as directory:
+        tavern = {'table': 'taverns', 'name': 'Contested Tavern'}
+        old = CommunityFeedSource(path=write_feed(directory, 'old', [{**tavern, 'column': 'Elm', 'row': '10th'}],
+                                                  timedelta(hours=1)), name='old')
+        new = CommunityFeedSource(path=write_feed(directory, 'new', [{**tavern, 'column': 'Gum', 'row': '33rd'}]),
+                                  name='new')
+        trusted = CommunityFeedSource(path=write_feed(directory, 'trusted', [{**tavern, 'column': 'Juniper',
+                                                                               'row': '20th'}], timedelta(hours=2)),
+                                      name='trusted')
+        trusted.priority = 5
+        stale = CommunityFeedSource(path=write_feed(directory, 'stale', [{**tavern, 'column': 'Elm', 'row': '20th'}],
+                                                    timedelta(days=30)), name='stale')
+        stale.priority = 50
+
+        winner = ingest([old, new], columns, rows)['taverns']['locations']
+        print(f"Conflict, equal priority: {winner}")
+        if winner != [('Contested Tavern', 'Gum', '33rd')]:
+            failures.append(f"newer feed should win a tie, got {winner}")
+        winner = ingest([old, new, trusted, stale], columns, rows)['taverns']['locations']
+        print(f"Conflict, with priority and a stale feed: {winner}")
+        if winner != [('Contested Tavern', 'Juniper', '20th')]:
+            failures.append(f"fresh higher-priority feed should win, got {winner}")
+
+    # Parallel fetch: total time tracks the slowest source, not the sum
+    servers = [AVITDStandInServer(page='community_feed.json', delay_s=DELAY_S).start() for _ in range(sources)]
+    try:
+        feeds = [CommunityFeedSource(url=server.url, name=f"feed{index}") for index, server in enumerate(servers)]
+        start = time.perf_counter()
+        for feed in feeds:
+            ingest([feed], columns, rows)
+        sequential = time.perf_counter() - start
+        for feed in feeds:
+            feed.validators = {}
+        start = time.perf_counter()
+        ingest(feeds, columns, rows)
+        parallel = time.perf_counter() - start
+        print(f"{sources} sources at {DELAY_S * 1000:.0f} ms each: sequential {sequential * 1000:.0f} ms, "
+              f"parallel {parallel * 1000:.0f} ms")
+        if parallel > sequential / 2:
+            failures.append("parallel fetch was not faster than sequential")
+
+        # Unchanged feeds revalidate to 304 and contribute nothing
+        if ingest(feeds, columns, rows):
+            failures.append("unchanged feeds should produce no locations")
+    finally:
+        for server in servers:
+            server.stop()
+        close_session()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+# app/benchmarks/log_analytics.py
+"""
+Log Analytics Benchmark
+
+Writes synthetic daily logs totalling about MEGABYTES MB (LOG_FORMAT lines
+with page loads, parse/render timings, coin events, scraper failures and
+tracebacks, plus one gzipped rollover) and measures the analytics report:
+
+- in a single process,
+- on the process pool (one task per TASK_BYTES range),
+
+then checks that both produce the same report, that the counts match what
+was written, and that the CSV export has every summary row.
+
+Run from the repository root:
+    python -m app.benchmarks.log_analytics [megabytes]
+"""
+
+import csv
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from app.logs.log_analytics import analyze_logs, summary_rows, write_csv
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'  # Same as app.config.constants (which needs PySide6)
+MEGABYTES = 300
+LINES_PER_MB = 11_000  # Roughly, at the message lengths below
+
+FILLER = [
+    ('DEBUG', "Drawing grid cell at column_index=52, row_index=87, x0=120, y0=40"),
+    ('DEBUG', "Set character coordinates to x=52, y=87"),
+    ('INFO', "Recentered minimap: x=52, y=87, col_start=49, row_start=84"),
+    ('INFO', "Loaded 3 characters from the database"),
+]
+
+
+def write_logs(log_dir: str, megabytes: int) -> Counter:
+    """Write the logs; returns the events written, for checking the report."""
+    rng = random.Random(42)
+    expected = Counter()
+    total_lines = megabytes * LINES_PER_MB
+    days = max(1, megabytes // 25)
+    first_day = datetime(2025, 1, 1)
+    for day in range(days):
+        date = first_day + timedelta(days=day)
+        lines = []
+        for n in range(total_lines // days):
+            stamp = (date + timedelta(seconds=n * 86400 // (total_lines // days))).strftime('%Y-%m-%d %H:%M:%S')
+            roll = rng.random()
+            if roll < 0.05:
+                level, message = 'INFO', "Webpage loaded successfully."
+                expected['page_load'] += 1
+            elif roll < 0.10:
+                level, message = 'INFO', f"Page parsed in {rng.uniform(2, 40):.1f} ms"
+                expected['page_parse_ms'] += 1
+            elif roll < 0.15:
+                level, message = 'INFO', f"Minimap rendered in {rng.uniform(1, 20):.1f} ms"
+                expected['minimap_render_ms'] += 1
+            elif roll < 0.16:
+                amount = rng.randint(1, 500)
+                level, message = 'INFO', f"Deposit found: {amount} coins"
+                expected['deposit'] += 1
+                expected['deposit_coins'] += amount
+            elif roll < 0.165:
+                level, message = 'ERROR', "Scrape failed: HTTPSConnectionPool(host='aviewinthedark.net'): timed out"
+                expected['scrape_failed'] += 1
+                expected['ERROR'] += 1
+            elif roll < 0.17:
+                level, message = 'WARNING', "Failed to save cookie to database: database is locked"
+                expected['WARNING'] += 1
+            else:
+                level, message = rng.choice(FILLER)
+            lines.append(f"{stamp},{n % 1000:03d} - {level} - {message}\n")
+            if level == 'ERROR':
+                lines.append('Traceback (most recent call last):\n  File "app/core/avitd_scraper.py", line 60\n'
+                             'TimeoutError: timed out\n')
+        text = ''.join(lines)
+        name = date.strftime('rbc_%Y-%m-%d.log')
+        if day == 0:
+            with gzip.open(os.path.join(log_dir, name + '.1.gz'), 'wt', encoding='utf-8') as f:
+                f.write(text)
+        else:
+            with open(os.path.join(log_dir, name), 'w', encoding='utf-8') as f:
+                f.write(text)
+    return expected
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<40}{(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main() -> int:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else MEGABYTES
+    failures = []
+    with tempfile.TemporaryDirectory() as log_dir:
+        expected = write_logs(log_dir, megabytes)
+        size_mb = sum(os.path.getsize(os.path.join(log_dir, name)) for name in os.listdir(log_dir)) / 1e6
+        print(f"{len(os.listdir(log_dir))} logs, {size_mb:.1f} MB on disk, {os.cpu_count()} CPUs")
+
+        single = timed("single process", lambda: analyze_logs(log_dir, LOG_FORMAT, max_workers=1))
+        pooled = timed("process pool", lambda: analyze_logs(log_dir, LOG_FORMAT))
+
+        if summary_rows(single) != summary_rows(pooled):
+            failures.append("process pool report differs from the single-process report")
+        counts = {
+            'page_load': sum(pooled['page_loads_by_hour'].values()),
+            'page_parse_ms': len(pooled['timings']['page_parse_ms']),
+            'minimap_render_ms': len(pooled['timings']['minimap_render_ms']),
+            'deposit': pooled['coin_events']['deposit'],
+            'deposit_coins': pooled['coin_amounts']['deposit'],
+            'scrape_failed': sum(pooled['scraper_failures'].values()),
+            'ERROR': pooled['levels']['ERROR'],
+            'WARNING': pooled['levels']['WARNING'],
+        }
+        for key, count in counts.items():
+            if count != expected[key]:
+                failures.append(f"{key}: expected {expected[key]}, got {count}")
+        if pooled['problems'][('cookies', 'WARNING')] != expected['WARNING']:
+            failures.append("cookie warnings not attributed to the cookies component")
+
+        csv_path = os.path.join(log_dir, 'report.csv')
+        write_csv(pooled, csv_path)
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            if len(list(csv.reader(f))) != len(summary_rows(pooled)) + 1:
+                failures.append("CSV export is missing rows")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# app/benchmarks/log_search.py
+"""
+Log Search Benchmark
+
+Writes DAYS synthetic daily logs (LINES_PER_DAY records each, with
+tracebacks after errors) to a temporary directory and measures:
+
+- the first full ingestion into the FTS5 index,
+- an incremental pass with nothing new (offsets only),
+- ranked searches with and without time-range and level filters,
+
+then checks, via the background indexer, that appended lines, partial
+lines and a log that rolled over are indexed exactly once: the rolled-over
+lines are found in the .gz backup, still once (under its new name) after
+the backup is renumbered, and no longer once it is deleted.
+
+Run from the repository root:
+    python -m app.benchmarks.log_search [days]
+"""
+
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from app.logs.log_search import LogSearchIndexer, connect_log_search, ingest_directory, search_logs
+
+DAYS = 60
+LINES_PER_DAY = 10_000
+WORDS = ("minimap scrape cookie login tavern guild shop bank database coordinates timeout render profile "
+         "character destination theme keybind webview").split()
+
+
+def write_logs(log_dir: str, days: int) -> None:
+    rng = random.Random(41)
+    levels = ['DEBUG'] * 6 + ['INFO'] * 3 + ['WARNING', 'ERROR']
+    first_day = datetime.now() - timedelta(days=days - 1)
+    for day in range(days):
+        date = (first_day + timedelta(days=day)).replace(hour=0, minute=0, second=0, microsecond=0)
+        with open(os.path.join(log_dir, date.strftime('rbc_%Y-%m-%d.log')), 'w', encoding='utf-8') as f:
+            for n in range(LINES_PER_DAY):
+                stamp = (date + timedelta(seconds=n * 86400 // LINES_PER_DAY)).strftime('%Y-%m-%d %H:%M:%S')
+                level = rng.choice(levels)
+                f.write(f"{stamp},{n % 1000:03d} - {level} - {' '.join(rng.choices(WORDS, k=5))} id={n}\n")
+                if level == 'ERROR':
+                    f.write('Traceback (most recent call last):\n  File "app/gui/minimap.py", line 53\n'
+                            'ZeroDivisionError: division by zero\n')
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<46}{(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main() -> int:
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else DAYS
+    failures = []
+    with tempfile.TemporaryDirectory() as log_dir:
+        write_logs(log_dir, days)
+        size_mb = sum(os.path.getsize(os.path.join(log_dir, name)) for name in os.listdir(log_dir)) / 1e6
+        db_path = os.path.join(log_dir, 'log_search.db')
+        conn = connect_log_search(db_path)
+        print(f"{days} daily logs, {size_mb:.1f} MB")
+
+        indexed = timed("first ingestion", lambda: ingest_directory(conn, log_dir))
+        print(f"  ({indexed:,} lines indexed)")
+        if timed("incremental pass, nothing new", lambda: ingest_directory(conn, log_dir)):
+            failures.append("unchanged logs were indexed again")
+
+        since_day = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')
+        for label, text, kwargs in (
+            ("rare term", "id=4242", {}),
+            ("common terms", "timeout login", {}),
+            ("prefix, last 24 hours", "scrape cook*", {'since': since_day}),
+            ("traceback, ERROR only", "ZeroDivisionError", {'levels': {'ERROR'}}),
+        ):
+            results = timed(f"search: {label}", lambda: search_logs(conn, text, **kwargs))
+            if not results:
+                failures.append(f"search '{text}' found nothing")
+            if 'since' in kwargs and any(logged_at < kwargs['since'] for logged_at, *_ in results):
+                failures.append(f"search '{text}' returned lines outside the time range")
+
+        # Background indexer: appended lines once, partial lines only when complete, shrunk logs again
+        newest = sorted(name for name in os.listdir(log_dir) if name.endswith('.log'))[-1]
+        stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        indexer = LogSearchIndexer(log_dir, db_path, interval_s=3600)
+        indexer.start()
+        indexer.wait_idle(30)
+        with open(os.path.join(log_dir, newest), 'a', encoding='utf-8') as f:
+            f.write(f"{stamp},000 - INFO - appended needle\n{stamp},001 - INFO - partial hay")
+        indexer.request()
+        indexer.wait_idle(30)
+        if [r[4] for r in search_logs(conn, 'needle')] != ['appended [needle]'] or search_logs(conn, 'hay'):
+            failures.append("appended/partial lines not indexed exactly once")
+
+        def needle_files() -> list[str]:
+            indexer.request()
+            indexer.wait_idle(30)
+            return [file for _, _, file, *_ in search_logs(conn, 'needle')]
+
+        # Rollover as CompressedRotatingFileHandler does it: gzip to .1.gz, start an empty log
+        live = os.path.join(log_dir, newest)
+        with open(live, 'rb') as f_in, gzip.open(f"{live}.1.gz", 'wb') as f_out:
+            f_out.write(f_in.read())
+        with open(live, 'w', encoding='utf-8') as f:
+            f.write(f"{stamp},002 - INFO - after rollover haystack\n")
+        if needle_files() != [f"{newest}.1.gz"] or len(search_logs(conn, 'haystack')) != 1:
+            failures.append("rolled-over lines not found exactly once in the backup")
+        os.rename(f"{live}.1.gz", f"{live}.2.gz")
+        if needle_files() != [f"{newest}.2.gz"]:
+            failures.append("renumbered backup not followed to its new name")
+        os.remove(f"{live}.2.gz")
+        if needle_files():
+            failures.append("deleted backup still in the index")
+        indexer.stop()
+        conn.close()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
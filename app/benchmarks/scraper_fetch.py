@@ -0,0 +1,83 @@
+# app/benchmarks/scraper_fetch.py
+"""
+Scraper Fetch Benchmark
+
+Fetches the AVITD page from the local stand-in server (no real network)
+and compares:
+
+- a bare requests.get per fetch (the scraper's old behaviour),
+- the shared pooled session,
+- the pooled session revalidating with ETag (304, no body),
+
+then checks that 503s are retried and that a hung server hits the read
+timeout instead of blocking forever.
+
+Requires requests. Run from the repository root:
+    python -m app.benchmarks.scraper_fetch [fetches]
+"""
+
+import sys
+import time
+
+import requests
+
+from app.benchmarks.avitd_server import AVITDStandInServer
+from app.core.http_session import HTTP_RETRIES, close_session, conditional_get, response_validators
+
+FETCHES = 200
+
+
+def throughput(label: str, fetch, count: int) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        fetch()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34}{count / elapsed:8.0f} fetches/s  ({elapsed * 1000 / count:6.2f} ms each)")
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else FETCHES
+    failures = []
+
+    with AVITDStandInServer() as server:
+        print(f"Fetching {server.url} {count} times per mode")
+        throughput("requests.get (no session)", lambda: requests.get(server.url, timeout=10).raise_for_status(), count)
+        throughput("pooled session", lambda: conditional_get(server.url).raise_for_status(), count)
+
+        validators = response_validators(conditional_get(server.url))
+        before = server.not_modified
+        throughput("pooled session + ETag (304)", lambda: conditional_get(server.url, validators), count)
+        if server.not_modified - before != count:
+            failures.append(f"expected {count} 304 responses, got {server.not_modified - before}")
+
+        response = conditional_get(server.url)
+        if response.headers.get('Content-Encoding') != 'gzip':
+            failures.append("page was not served gzipped")
+        print(f"  gzip: {len(server.gzipped):,} bytes on the wire for a {len(server.body):,} byte page")
+
+    # 503s are retried with backoff
+    with AVITDStandInServer(fail_first=2) as server:
+        response = conditional_get(server.url)
+        print(f"Retry: status {response.status_code} after {server.requests} attempts")
+        if response.status_code != 200 or server.requests != 3:
+            failures.append(f"503 retry: status {response.status_code} after {server.requests} attempts")
+
+    # A hung server raises after the read timeout (and retries) instead of blocking the worker
+    with AVITDStandInServer(delay_s=1.0) as server:
+        start = time.perf_counter()
+        try:
+            conditional_get(server.url, timeout=(1, 0.2))
+            failures.append("hung server did not time out")
+        except requests.RequestException as e:
+            print(f"Timeout: {type(e).__name__} after {time.perf_counter() - start:.1f}s and {server.requests} attempts")
+            if server.requests != HTTP_RETRIES + 1:
+                failures.append(f"expected {HTTP_RETRIES + 1} attempts before giving up, got {server.requests}")
+
+    close_session()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
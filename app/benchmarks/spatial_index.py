@@ -0,0 +1,99 @@
+# app/benchmarks/spatial_index.py
+"""
+Spatial Index Benchmark
+
+Compares the R*Tree query API in app.database.spatial against the in-memory
+dictionary scans done by draw_minimap and find_nearest_location, with the
+location catalog inflated to SCALE times the bundled POI count.
+
+Run from the repository root:
+    python -m app.benchmarks.spatial_index [scale]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import timeit
+
+from app.database.spatial import LOCATION_TABLES, find_nearest, query_viewport, rebuild_spatial_index
+
+BUNDLED_DB = os.path.join(os.path.dirname(__file__), '..', 'sessions', 'rbc_map_data.db')
+SCALE = 10
+ZOOM_LEVEL = 7
+REPEAT = 2000
+
+
+def build_catalog(scale: int) -> tuple[sqlite3.Connection, dict[str, dict[str, tuple[int, int]]]]:
+    """
+    Copy the bundled database into memory and add (scale - 1) synthetic copies of every location.
+
+    Returns:
+        tuple: (in-memory connection with a populated spatial index, kind -> {name: (x, y)} dicts)
+    """
+    conn = sqlite3.connect(':memory:')
+    with sqlite3.connect(f"file:{BUNDLED_DB}?mode=ro", uri=True) as source:
+        source.backup(conn)
+
+    rng = random.Random(26)
+    column_names = [name for (name,) in conn.execute("SELECT Name FROM `columns`")]
+    row_names = [name for (name,) in conn.execute("SELECT Name FROM `rows`")]
+    for table in LOCATION_TABLES.values():
+        names = [name for (name,) in conn.execute(f"SELECT Name FROM `{table}`")]
+        for copy in range(1, scale):
+            conn.executemany(
+                f"INSERT INTO `{table}` (Name, `Column`, `Row`) VALUES (?, ?, ?)",
+                [(f"{name} #{copy}", rng.choice(column_names), rng.choice(row_names)) for name in names]
+            )
+    rebuild_spatial_index(conn)
+
+    catalog = {kind: {} for kind in LOCATION_TABLES}
+    for location_id, kind, name, x, y in conn.execute("SELECT id, kind, name, min_x, min_y FROM location_index"):
+        catalog[kind][f"{name} [{location_id}]"] = (int(x), int(y))  # Banks share a name
+    return conn, catalog
+
+
+def dict_viewport(catalog: dict, column_start: int, row_start: int) -> list:
+    """Mirror draw_minimap: walk every coordinate dict and keep what falls inside the view."""
+    visible = []
+    for kind, locations in catalog.items():
+        for name, (column_index, row_index) in locations.items():
+            if column_start <= column_index < column_start + ZOOM_LEVEL and \
+                    row_start <= row_index < row_start + ZOOM_LEVEL:
+                visible.append((kind, name, column_index, row_index))
+    return visible
+
+
+def dict_nearest(locations: dict, x: int, y: int) -> list:
+    """Mirror find_nearest_location: score and sort every location."""
+    distances = [(max(abs(lx - x), abs(ly - y)), (lx, ly)) for lx, ly in locations.values()]
+    distances.sort()
+    return distances
+
+
+def main() -> None:
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else SCALE
+    conn, catalog = build_catalog(scale)
+    total = sum(len(locations) for locations in catalog.values())
+    rng = random.Random(7)
+    points = [(rng.randint(1, 200), rng.randint(1, 200)) for _ in range(REPEAT)]
+
+    def run(func) -> float:
+        iterator = iter(points * 2)
+        return timeit.timeit(lambda: func(*next(iterator)), number=REPEAT) / REPEAT * 1e6
+
+    results = [
+        ("viewport: dict scan", run(lambda x, y: dict_viewport(catalog, x, y))),
+        ("viewport: R*Tree", run(lambda x, y: query_viewport(conn, x, y, x + ZOOM_LEVEL - 1, y + ZOOM_LEVEL - 1))),
+        ("nearest tavern: dict scan", run(lambda x, y: dict_nearest(catalog['tavern'], x, y)[0])),
+        ("nearest tavern: R*Tree", run(lambda x, y: find_nearest(conn, x, y, 'tavern'))),
+    ]
+
+    print(f"{total} locations ({scale}x bundled catalog), {ZOOM_LEVEL}x{ZOOM_LEVEL} view, {REPEAT} queries each")
+    for label, micros in results:
+        print(f"  {label:<28} {micros:8.1f} us/query")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
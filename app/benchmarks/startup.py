@@ -0,0 +1,61 @@
+# app/benchmarks/startup.py
+"""
+Headless Startup Harness
+
+Launches the application with --profile-startup on an offscreen Qt platform
+against a throwaway copy of the bundled database, once cold (fresh sessions
+directory: no catalog snapshot, no web cache) and then several times warm,
+and prints the startup_metrics summary for both.
+
+Run from the repository root:
+    python -m app.benchmarks.startup [warm_runs]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from app.utils.startup_timeline import STARTUP_LABEL_ENV, summarize_startup_metrics
+
+APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+REPO_ROOT = os.path.dirname(APP_DIR)
+WARM_RUNS = 3
+RUN_TIMEOUT_S = 120
+
+
+def launch(workdir: str, label: str) -> int:
+    """Run one profiled startup in workdir and return the exit code."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, QT_QPA_PLATFORM='offscreen')
+    env[STARTUP_LABEL_ENV] = label
+    try:
+        result = subprocess.run(
+            [sys.executable, '-m', 'app.main', '--profile-startup'],
+            cwd=workdir, env=env, capture_output=True, text=True, timeout=RUN_TIMEOUT_S
+        )
+    except subprocess.TimeoutExpired:
+        print(f"{label} start timed out after {RUN_TIMEOUT_S}s")
+        return 1
+    if result.returncode != 0:
+        print(f"{label} start exited with {result.returncode}:\n{result.stderr[-2000:]}")
+    return result.returncode
+
+
+def main() -> int:
+    warm_runs = int(sys.argv[1]) if len(sys.argv) > 1 else WARM_RUNS
+    with tempfile.TemporaryDirectory() as workdir:
+        shutil.copytree(os.path.join(APP_DIR, 'images'), os.path.join(workdir, 'images'))
+        os.makedirs(os.path.join(workdir, 'sessions'))
+        shutil.copy(os.path.join(APP_DIR, 'sessions', 'rbc_map_data.db'), os.path.join(workdir, 'sessions'))
+
+        failures = launch(workdir, 'cold') != 0
+        for _ in range(warm_runs):
+            failures |= launch(workdir, 'warm') != 0
+
+        print(summarize_startup_metrics(os.path.join(workdir, 'sessions', 'rbc_map_data.db'), runs=warm_runs))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,18 +10,49 @@ environment setup, logging, theming defaults, and file path resolution.
 See LICENSE for usage restrictions.
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
 import logging.handlers
+import queue
+import shutil
+
+from app.utils.hot_log import HotPathLogger, set_tracing, tracing_enabled
 # -----------------------
 # Global Constants
 # -----------------------
 # Database Path
 DB_PATH = 'sessions/rbc_map_data.db'
 
+# Binary snapshot of fetch_catalog output for fast warm startup
+SNAPSHOT_PATH = 'sessions/catalog.snapshot'
+
 # Logging Configuration
 LOG_DIR = 'logs'
 DEFAULT_LOG_LEVEL = logging.DEBUG
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Full-text search index over the daily logs (see app/logs/log_search.py)
+LOG_SEARCH_DB = 'logs/log_search.db'
+
+# A day's log rolls over to a gzipped backup (rbc_YYYY-MM-DD.log.1.gz, ...) at this size
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Named loggers for hot paths, so they can be quieted apart from the root level.
+# The per-frame ones are rate limited and sampled (see app/utils/hot_log.py).
+MINIMAP_LOG = HotPathLogger('rbc.minimap')  # draw_minimap, once per grid cell
+COORDINATES_LOG = HotPathLogger('rbc.coordinates')  # Coordinate extraction, on every page load
+SCRAPER_LOG = logging.getLogger('rbc.scraper')  # Scraper and location ingestion
+
+# Default per-logger levels; 'log_level:<logger>' settings override them. Warnings and errors still pass.
+LOGGER_LEVELS = {
+    'rbc.minimap': logging.INFO,
+    'rbc.coordinates': logging.INFO,
+}
+
 def get_logging_level_from_db(default=logging.INFO) -> int:
     try:
         with sqlite3.connect(DB_PATH) as conn:
@@ -34,8 +65,62 @@ def get_logging_level_from_db(default=logging.INFO) -> int:
         print(f"Failed to load log level from DB: {e}", file=sys.stderr)
     return default
 
+def get_logger_levels_from_db() -> dict[str, int]:
+    """
+    Per-logger levels: LOGGER_LEVELS overridden by 'log_level:<logger>' settings.
+
+    Returns:
+        dict[str, int]: Logger name to level.
+    """
+    levels = dict(LOGGER_LEVELS)
+    try:
+        with sqlite3.connect(DB_PATH) as conn:
+            cursor = conn.execute("SELECT setting_name, setting_value FROM settings WHERE setting_name LIKE 'log_level:%'")
+            for name, value in cursor.fetchall():
+                levels[name.split(':', 1)[1]] = int(value)
+    except Exception as e:
+        print(f"Failed to load logger levels from DB: {e}", file=sys.stderr)
+    return levels
+
 VERSION_NUMBER = "0.12.0"
 
+# Longest time --profile-startup waits for the first page load before reporting
+STARTUP_PROFILE_TIMEOUT_MS = 30000
+
+# Guild and shop locations are scraped from this page
+AVITD_URL = "https://aviewinthedark.net/"
+
+# Community location feeds (JSON, see CommunityFeedSource) ingested alongside AVITD; URLs or local file paths
+COMMUNITY_FEEDS: list[str] = []
+
+# Changed cookies are written to the database in one batch this long after the last change
+COOKIE_FLUSH_DELAY_MS = 2000
+
+# How often cookies past their expiration date are deleted from the database
+COOKIE_SWEEP_INTERVAL_MS = 60 * 60 * 1000
+
+# Each character's web profile (cookies, storage) lives in its own directory under this one
+CHARACTER_PROFILES_DIR = 'sessions/profiles'
+
+# Character pages kept warm (logged in) for instant switching, including the one on screen
+CHARACTER_POOL_SIZE = 3
+
+# Hidden character pages are frozen at once and discarded (memory freed) after this long
+CHARACTER_PAGE_DISCARD_MS = 5 * 60 * 1000
+
+# HTTP disk cache of each web profile (in a subdirectory per profile) and its size cap
+HTTP_CACHE_DIR = 'sessions/cache'
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Name of the web profile script that injects the active CSS profile's stylesheet
+CUSTOM_CSS_SCRIPT_NAME = 'rbc_custom_css'
+
+# Name of the web profile script that defines the movement helper (window.rbcMove)
+MOVE_HELPER_SCRIPT_NAME = 'rbc_move_helper'
+
+# How often the session's page load histograms are saved (also saved on quit)
+PAGE_LOAD_METRICS_SAVE_MS = 5 * 60 * 1000
+
 # Keybinding Defaults
 DEFAULT_KEYBINDS = {
     "move_up": "W",
@@ -57,114 +142,14 @@ REQUIRED_DIRECTORIES = ['logs', 'sessions', 'images']
 
 import math
 import os
-import subprocess
 import sys
+import time
 
-# List of required modules with pip package names (some differ from import names)
-required_modules = {
-    'requests': 'requests',
-    're': 're',  # Built-in, no pip install needed
-    'time': 'time',  # Built-in
-    'sqlite3': 'sqlite3',  # Built-in
-    'webbrowser': 'webbrowser',  # Built-in
-    'datetime': 'datetime',  # Built-in
-    'bs4': 'beautifulsoup4',
-    'PySide6.QtWidgets': 'PySide6',
-    'PySide6.QtGui': 'PySide6',
-    'PySide6.QtCore': 'PySide6',
-    'PySide6.QtWebEngineWidgets': 'PySide6',
-    'PySide6.QtWebChannel': 'PySide6',
-    'PySide6.QtNetwork': 'PySide6'
-}
-
-def check_and_install_modules(modules: dict[str, str]) -> bool:
-    """
-    Check if required modules are installed, prompt user to install missing ones, and attempt installation.
-
-    Args:
-        modules (dict): Dictionary mapping module names to their pip package names.
-
-    Returns:
-        bool: True if all modules are available after checking/installing, False otherwise.
-    """
-    missing_modules = []
-    pip_installable = []
-
-    # Check each module
-    for module, pip_name in modules.items():
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
-            if pip_name not in ('re', 'time', 'sqlite3', 'webbrowser', 'datetime'):  # Skip built-ins
-                pip_installable.append(pip_name)
-
-    if not missing_modules:
-        return True
-
-    # Inform user of missing modules
-    print("The following modules are missing:")
-    for mod in missing_modules:
-        print(f"- {mod}")
-
-    if not pip_installable:
-        print("All missing modules are built-ins that should come with Python. Please check your Python installation.")
-        return False
-
-    # Prompt user for installation
-    try:
-        from PySide6.QtWidgets import QMessageBox  # Early import for GUI prompt
-    except ImportError:
-        # Fallback to console prompt if PySide6 isn't available yet
-        response = input(f"\nWould you like to install missing modules ({', '.join(set(pip_installable))}) with pip? (y/n): ").strip().lower()
-        if response != 'y':
-            print("Please install the missing modules manually with:")
-            print(f"pip install {' '.join(set(pip_installable))}")
-            return False
-    else:
-        # Use GUI prompt if PySide6 is partially available
-        app = QApplication(sys.argv)  # Minimal app for QMessageBox
-        response = QMessageBox.question(None, "Missing Modules",f"Missing modules: {', '.join(missing_modules)}\n\nInstall with pip ({', '.join(set(pip_installable))})?",
-                                        QMessageBox.Yes | QMessageBox.No)
-        if response == QMessageBox.No:
-            print("Please install the missing modules manually with:")
-            print(f"pip install {' '.join(set(pip_installable))}")
-            return False
-
-    # Attempt to install missing modules
-    print(f"Installing missing modules: {', '.join(set(pip_installable))}...")
-    try:
-        # Use sys.executable to ensure the correct Python environment
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + list(set(pip_installable)))
-        print("Installation successful! Please restart the application.")
-
-        # Re-check modules after installation
-        for module in missing_modules:
-            try:
-                __import__(module)
-            except ImportError:
-                print(f"Failed to import {module} even after installation. Please check your environment.")
-                return False
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Failed to install modules: {e}")
-        print("Please install them manually with:")
-        print(f"pip install {' '.join(set(pip_installable))}")
-        return False
-    except Exception as e:
-        print(f"An unexpected error occurred during installation: {e}")
-        return False
-
-# Check and attempt to install required modules
-if not check_and_install_modules(required_modules):
-    sys.exit("Missing required modules. Please resolve the issues and try again.")
-
-# Proceed with the rest of the imports and program setup
-import requests
+# Dependency checks live in app.config.dependencies and run from main() before this module is imported.
+# requests and bs4 are imported lazily by the scraper and HTML parser workers that use them.
 import re
 import webbrowser
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
 from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QComboBox, \
     QLabel, QFrame, QSizePolicy, QLineEdit, QDialog, QFormLayout, QListWidget, QListWidgetItem, QFileDialog, \
     QColorDialog, QTabWidget, QScrollArea, QTableWidget, QTableWidgetItem, QInputDialog, QTextEdit, QSplashScreen, \
@@ -176,7 +161,7 @@ from PySide6.QtCore import Slot as pyqtSlot
 from PySide6.QtWidgets import QMainWindow, QMessageBox
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebChannel import QWebChannel
-from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile
+from PySide6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage, QWebEngineScript
 from PySide6.QtNetwork import QNetworkCookie
 from typing import List, Tuple
 from collections.abc import KeysView
@@ -253,24 +238,69 @@ def ensure_directories_exist(directories: list[str] = REQUIRED_DIRECTORIES) -> b
             success = False
     return success
 
-# Example usage at startup (optional, depending on your flow)
-if not ensure_directories_exist():
-    logging.warning("Some directories could not be created. Application may encounter issues.")
 
 # -----------------------
 # Logging Setup
 # -----------------------
-def setup_logging(log_dir: str = LOG_DIR, log_level: int = DEFAULT_LOG_LEVEL, log_format: str = LOG_FORMAT) -> bool:
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that gzips each file it rolls over (name.log.1.gz, name.log.2.gz, ...)."""
+
+    def __init__(self, filename: str, max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT) -> None:
+        super().__init__(filename, mode='a', maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self.compress
+
+    @staticmethod
+    def compress(source: str, dest: str) -> None:
+        """Gzip the rolled-over file to dest and remove it."""
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that only merges the message arguments on the logging thread.
+
+    The stock handler formats the whole line (timestamp, tracebacks) before queueing;
+    here that is left to the listener's handlers on the background thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()  # Args may be mutated after the call returns
+        record.args = None
+        return record
+
+
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def stop_logging() -> None:
+    """Stop the background log writer, flushing every queued record to disk."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+def setup_logging(log_dir: str = LOG_DIR, log_level: int = DEFAULT_LOG_LEVEL, log_format: str = LOG_FORMAT,
+                  logger_levels: dict[str, int] | None = None) -> bool:
     """
-    Set up logging configuration to save logs in the specified directory with daily rotation.
+    Set up queue-based logging to a size-rotated, compressed file per day.
 
-    Configures the root logger to write logs to a file named 'rbc_YYYY-MM-DD.log' in the given directory.
-    Logs are appended to the file for the current day, effectively rotating daily by filename.
+    The root logger gets a QueueHandler, so logging calls on the UI thread only enqueue the
+    record; a QueueListener thread formats it and writes it to 'rbc_YYYY-MM-DD.log' in the
+    given directory. The file rolls over to gzipped backups at LOG_MAX_BYTES. The queue is
+    flushed when the application exits.
 
     Args:
         log_dir (str, optional): Directory to store log files. Defaults to LOG_DIR ('logs').
-        log_level (int, optional): Logging level (e.g., logging.debug). Defaults to LOG_LEVEL.
+        log_level (int, optional): Root logging level (e.g., logging.DEBUG). Defaults to DEFAULT_LOG_LEVEL.
         log_format (str, optional): Log message format. Defaults to LOG_FORMAT.
+        logger_levels (dict[str, int], optional): Levels for named loggers. Defaults to LOGGER_LEVELS.
 
     Returns:
         bool: True if logging was set up successfully, False if an error occurred.
@@ -278,23 +308,31 @@ def setup_logging(log_dir: str = LOG_DIR, log_level: int = DEFAULT_LOG_LEVEL, lo
     Raises:
         OSError: If the log file cannot be created or written to (logged to stderr if possible).
     """
+    global _log_listener
     try:
         # Ensure log directory exists (assuming ensure_directories_exist is called earlier)
         log_filename = datetime.now().strftime(f'{log_dir}/rbc_%Y-%m-%d.log')
 
-        # Clear any existing handlers to avoid duplication if called multiple times
+        # Clear any existing handlers (and writer thread) to avoid duplication if called multiple times
         logger = logging.getLogger()
         if logger.handlers:
             logger.handlers.clear()
+        stop_logging()
 
-        # Set up file handler
-        handler = logging.FileHandler(log_filename, mode='a', encoding='utf-8')
+        # File handler runs on the listener thread; the root level decides what is queued
+        handler = CompressedRotatingFileHandler(log_filename)
         handler.setFormatter(logging.Formatter(log_format))
-        handler.setLevel(log_level)
+
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(stop_logging)
 
         # Configure root logger
         logger.setLevel(log_level)
-        logger.addHandler(handler)
+        logger.addHandler(DeferredFormatQueueHandler(log_queue))
+        for name, level in (LOGGER_LEVELS if logger_levels is None else logger_levels).items():
+            logging.getLogger(name).setLevel(level)
 
         logger.info(f"Logging initialized. Logs will be written to {log_filename}")
         return True
@@ -306,14 +344,6 @@ def setup_logging(log_dir: str = LOG_DIR, log_level: int = DEFAULT_LOG_LEVEL, lo
         print(f"Unexpected error during logging setup: {e}", file=sys.stderr)
         return False
 
-# Initialize logging at startup
-if not setup_logging(log_level=get_logging_level_from_db()):
-    print("Logging setup failed. Continuing without file logging.", file=sys.stderr)
-    logging.basicConfig(level=DEFAULT_LOG_LEVEL, format=LOG_FORMAT, stream=sys.stderr)  # Fallback to console
-
-# Log app version
-logging.info(f"Launching app version {VERSION_NUMBER}")
-
 def save_logging_level_to_db(level: int) -> bool:
     try:
         with sqlite3.connect(DB_PATH) as conn:
@@ -349,14 +379,14 @@ def save_cookie_to_db(cookie: QNetworkCookie) -> bool:
         with sqlite3.connect(DB_PATH) as conn:
             cursor = conn.cursor()
             name = cookie.name().data().decode('utf-8', errors='replace')
-            domain = cookie.domain()
+            domain = cookie.domain().lstrip('.')  # Same key as the cookie cache and the unique index
             path = cookie.path()
             value = cookie.value().data().decode('utf-8', errors='replace')
             expiration = cookie.expirationDate().toString(Qt.ISODate) if not cookie.isSessionCookie() else None
             secure = int(cookie.isSecure())
             httponly = int(cookie.isHttpOnly())
 
-            # Use UPSERT (INSERT OR REPLACE) to overwrite existing cookies based on name, domain, and path
+            # Overwrites the existing row through the unique (name, domain, path) index
             cursor.execute('''
                 INSERT OR REPLACE INTO cookies (name, value, domain, path, expiration, secure, httponly)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -398,6 +428,35 @@ def load_cookies_from_db() -> List[QNetworkCookie]:
         logging.error(f"Failed to load cookies: {e}")
     return cookies
 
+def delete_expired_cookies(db_path: str = DB_PATH) -> list[tuple[str, str, str]]:
+    """
+    Delete cookies whose expiration date has passed; session cookies (no expiration) are kept.
+
+    Expirations are ISO dates (with or without a UTC offset) or epoch seconds.
+
+    Args:
+        db_path (str, optional): Path to the SQLite database file. Defaults to DB_PATH.
+
+    Returns:
+        list[tuple[str, str, str]]: (name, domain, path) of the deleted cookies.
+    """
+    expired_sql = """
+        expiration IS NOT NULL AND expiration != '' AND CASE
+            WHEN expiration NOT GLOB '*[^0-9]*' THEN CAST(expiration AS INTEGER) < CAST(strftime('%s', 'now') AS INTEGER)
+            ELSE julianday(expiration) < julianday('now')
+        END
+    """
+    try:
+        with sqlite3.connect(db_path) as conn:
+            expired = conn.execute(f"SELECT name, domain, path FROM cookies WHERE {expired_sql}").fetchall()
+            if expired:
+                conn.execute(f"DELETE FROM cookies WHERE {expired_sql}")
+                logging.info(f"Deleted {len(expired)} expired cookies")
+            return expired
+    except sqlite3.Error as e:
+        logging.error(f"Failed to delete expired cookies: {e}")
+        return []
+
 def clear_cookie_db() -> bool:
     """
     Clear all cookies from the SQLite database.
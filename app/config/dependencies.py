@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# Filename: dependencies.py
+
+"""
+RBCMap Dependency Check
+
+Verifies that required modules are installed before the GUI modules are
+imported, and offers to install missing ones with pip. Availability is
+checked with importlib.util.find_spec so nothing is actually imported.
+
+See LICENSE for usage restrictions.
+"""
+
+import importlib.util
+import subprocess
+import sys
+
+# List of required modules with pip package names (some differ from import names)
+REQUIRED_MODULES = {
+    'requests': 'requests',
+    're': 're',  # Built-in, no pip install needed
+    'time': 'time',  # Built-in
+    'sqlite3': 'sqlite3',  # Built-in
+    'webbrowser': 'webbrowser',  # Built-in
+    'datetime': 'datetime',  # Built-in
+    'bs4': 'beautifulsoup4',
+    'PySide6.QtWidgets': 'PySide6',
+    'PySide6.QtGui': 'PySide6',
+    'PySide6.QtCore': 'PySide6',
+    'PySide6.QtWebEngineWidgets': 'PySide6',
+    'PySide6.QtWebChannel': 'PySide6',
+    'PySide6.QtNetwork': 'PySide6'
+}
+
+def is_module_available(module: str) -> bool:
+    """
+    Check whether a module can be imported without importing it.
+
+    Args:
+        module (str): Dotted module name.
+
+    Returns:
+        bool: True if an import spec is found, False otherwise.
+    """
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        # Raised when a parent package of a dotted name is missing
+        return False
+
+def check_and_install_modules(modules: dict[str, str] = REQUIRED_MODULES) -> bool:
+    """
+    Check if required modules are installed, prompt user to install missing ones, and attempt installation.
+
+    Args:
+        modules (dict): Dictionary mapping module names to their pip package names.
+
+    Returns:
+        bool: True if all modules are available after checking/installing, False otherwise.
+    """
+    missing_modules = []
+    pip_installable = []
+
+    # Check each module
+    for module, pip_name in modules.items():
+        if not is_module_available(module):
+            missing_modules.append(module)
+            if pip_name not in ('re', 'time', 'sqlite3', 'webbrowser', 'datetime'):  # Skip built-ins
+                pip_installable.append(pip_name)
+
+    if not missing_modules:
+        return True
+
+    # Inform user of missing modules
+    print("The following modules are missing:")
+    for mod in missing_modules:
+        print(f"- {mod}")
+
+    if not pip_installable:
+        print("All missing modules are built-ins that should come with Python. Please check your Python installation.")
+        return False
+
+    # Prompt user for installation
+    try:
+        from PySide6.QtWidgets import QApplication, QMessageBox  # Early import for GUI prompt
+    except ImportError:
+        # Fallback to console prompt if PySide6 isn't available yet
+        response = input(f"\nWould you like to install missing modules ({', '.join(set(pip_installable))}) with pip? (y/n): ").strip().lower()
+        if response != 'y':
+            print("Please install the missing modules manually with:")
+            print(f"pip install {' '.join(set(pip_installable))}")
+            return False
+    else:
+        # Use GUI prompt if PySide6 is partially available
+        app = QApplication(sys.argv)  # Minimal app for QMessageBox
+        response = QMessageBox.question(None, "Missing Modules",f"Missing modules: {', '.join(missing_modules)}\n\nInstall with pip ({', '.join(set(pip_installable))})?",
+                                        QMessageBox.Yes | QMessageBox.No)
+        if response == QMessageBox.No:
+            print("Please install the missing modules manually with:")
+            print(f"pip install {' '.join(set(pip_installable))}")
+            return False
+
+    # Attempt to install missing modules
+    print(f"Installing missing modules: {', '.join(set(pip_installable))}...")
+    try:
+        # Use sys.executable to ensure the correct Python environment
+        subprocess.check_call([sys.executable, "-m", "pip", "install"] + list(set(pip_installable)))
+        print("Installation successful! Please restart the application.")
+
+        # Re-check modules after installation
+        importlib.invalidate_caches()
+        for module in missing_modules:
+            if not is_module_available(module):
+                print(f"Failed to import {module} even after installation. Please check your environment.")
+                return False
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Failed to install modules: {e}")
+        print("Please install them manually with:")
+        print(f"pip install {' '.join(set(pip_installable))}")
+        return False
+    except Exception as e:
+        print(f"An unexpected error occurred during installation: {e}")
+        return False
@@ -1,27 +1,43 @@
     # -----------------------
     # Load and Apply Customized UI Theme
     # -----------------------
-    def load_theme_settings(self) -> None:
+    def read_theme_settings(self) -> dict[str, str]:
         """
-        Load theme settings from the SQLite database (settings table).
+        Read theme settings from the SQLite database (settings table).
 
-        Updates self.color_mappings using settings from the database,
-        preserving any other existing color mappings.
+        Touches no Qt objects, so it is safe to run on a startup worker thread.
+
+        Returns:
+            dict[str, str]: Setting name (with 'theme_' prefix) to color string.
         """
         try:
             with sqlite3.connect(DB_PATH) as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT setting_name, setting_value FROM settings WHERE setting_name LIKE 'theme_%'")
-                settings = dict(cursor.fetchall())
-
-                # Update existing mappings only for theme-specific keys
-                for key_with_prefix, value in settings.items():
-                    key = key_with_prefix.replace("theme_", "", 1)
-                    self.color_mappings[key] = QColor(value)
-
-                logging.debug(f"Theme settings loaded from DB and applied. Keys updated: {list(settings.keys())}")
+                return dict(cursor.fetchall())
         except sqlite3.Error as e:
             logging.error(f"Failed to load theme settings: {e}")
+            return {}
+
+    def load_theme_settings(self, settings: dict[str, str] | None = None) -> None:
+        """
+        Load theme settings into self.color_mappings.
+
+        Updates self.color_mappings using settings from the database,
+        preserving any other existing color mappings.
+
+        Args:
+            settings (dict[str, str], optional): Rows from read_theme_settings; read from the database when omitted.
+        """
+        if settings is None:
+            settings = self.read_theme_settings()
+
+        # Update existing mappings only for theme-specific keys
+        for key_with_prefix, value in settings.items():
+            key = key_with_prefix.replace("theme_", "", 1)
+            self.color_mappings[key] = QColor(value)
+
+        logging.debug(f"Theme settings loaded from DB and applied. Keys updated: {list(settings.keys())}")
 
     def save_theme_settings(self) -> bool:
         """
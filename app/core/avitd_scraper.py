@@ -6,219 +6,222 @@ class AVITDScraper:
     A scraper class for 'A View in the Dark' to update guilds and shops data in the SQLite database.
     """
 
-    def __init__(self):
+    # Peacekeeper's Missions never move and are not listed with the guilds on the site
+    PEACEKEEPER_MISSIONS = {
+        "Peacekeepers Mission 1": ("Emerald", "67th"),
+        "Peacekeepers Mission 2": ("Unicorn", "33rd"),
+        "Peacekeepers Mission 3": ("Emerald", "33rd"),
+    }
+
+    def __init__(self, url: str = AVITD_URL, sources: list | None = None):
         """
         Initialize the scraper with the required headers and database connection.
+
+        The connection belongs to the creating thread, so create the scraper on the thread
+        that runs the scrape (ScrapeWorker does) and close it there.
+
+        Args:
+            url (str, optional): AVITD page to scrape; overridden to point at a local stand-in server.
+            sources (list[LocationSource], optional): Sources to ingest instead of AVITD plus
+                COMMUNITY_FEEDS, e.g. file-backed sources for offline runs.
         """
-        self.url = "https://aviewinthedark.net/"
+        self.url = url
         self.connection = sqlite3.connect(DB_PATH)  # SQLite connection
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         }
+        if sources is None:
+            sources = [AVITDSource(url, headers=self.headers)] + [
+                CommunityFeedSource(url=feed, name=f"feed:{feed}", headers=self.headers)
+                if feed.startswith(('http://', 'https://')) else CommunityFeedSource(path=feed, name=f"feed:{feed}")
+                for feed in COMMUNITY_FEEDS
+            ]
+        self.sources = sources
 
-        # Set up logging
-        logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
-        logging.info("AVITDScraper initialized.")
+        SCRAPER_LOG.info("AVITDScraper initialized.")
 
-    def scrape_guilds_and_shops(self):
+    def scrape_guilds_and_shops(self, progress=None) -> dict[str, dict[str, list]]:
         """
-        Scrape the guilds and shops data from the website and update the SQLite database.
-        """
-        logging.info("Starting to scrape guilds and shops.")
-        response = requests.get(self.url, headers=self.headers)
-        logging.debug(f"Received response: {response.status_code}")
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        Ingest every location source and update the SQLite database.
 
-        guilds = self.scrape_section(soup, "the guilds")
-        shops = self.scrape_section(soup, "the shops")
-        guilds_next_update = self.extract_next_update_time(soup, 'Guilds')
-        shops_next_update = self.extract_next_update_time(soup, 'Shops')
-
-        # Display results in the console (for debugging purposes)
-        self.display_results(guilds, shops, guilds_next_update, shops_next_update)
-
-        # Update the SQLite database with scraped data
-        self.update_database(guilds, "guilds", guilds_next_update)
-        self.update_database(shops, "shops", shops_next_update)
-        logging.info("Finished scraping and updating the database.")
-
-    def scrape_section(self, soup, section_image_alt):
-        """
-        Scrape a specific section (guilds or shops) from the website.
+        Sources (A View in the Dark plus any community feeds) are fetched in parallel on the
+        shared pooled session, each revalidated with the ETag / Last-Modified of the last
+        copy stored, then parsed, normalized, validated and merged (see app/core/ingestion.py).
+        Each table the merge produced is then applied as a diff.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content.
-            section_image_alt (str): The alt text of the section image to locate the section.
+            progress (Callable[[str], None], optional): Receives a message as each step starts.
 
         Returns:
-            list: A list of tuples containing the name, column, and row of each entry.
-        """
-        logging.debug(f"Scraping section: {section_image_alt}")
-        data = []
-        section_image = soup.find('img', alt=section_image_alt)
-        if not section_image:
-            logging.warning(f"No data found for {section_image_alt}.")
-            return data
-
-        table = section_image.find_next('table')
-        rows = table.find_all('tr', class_=['odd', 'even'])
-
-        for row in rows:
-            columns = row.find_all('td')
-            if len(columns) < 2:
-                logging.debug(f"Skipping row due to insufficient columns: {row}")
-                continue
-
-            name = columns[0].text.strip()
-            location = columns[1].text.strip().replace("SE of ", "").strip()
-
-            try:
-                column, row = location.split(" and ")
-                data.append((name, column, row))
-                logging.debug(f"Extracted data - Name: {name}, Column: {column}, Row: {row}")
-            except ValueError:
-                logging.warning(f"Location format unexpected for {name}: {location}")
+            dict[str, dict[str, list]]: Changes per table ('guilds', 'shops', ...) as returned by
+            update_database, for the tables that were stored; empty if every source was unchanged.
 
-        logging.info(f"Scraped {len(data)} entries from {section_image_alt}.")
-        return data
-
-    def extract_next_update_time(self, soup, section_name):
+        Raises:
+            requests.RequestException: If no source could be fetched.
+        """
+        report = progress or (lambda message: None)
+
+        SCRAPER_LOG.info(f"Starting to ingest {len(self.sources)} location source(s).")
+        loaded = {}
+        for source in self.sources:
+            loaded[source.name] = source.validators = self.load_validators(source.name)
+
+        merged = ingest(self.sources, *load_street_coordinates(self.connection), progress=report)
+        if not merged:
+            SCRAPER_LOG.info("Location sources unchanged since the last scrape; keeping stored data.")
+            return {}
+
+        report("Saving locations...")
+        changes = {}
+        failed = []
+        for table, result in merged.items():
+            if result['next_update'] is not None:
+                SCRAPER_LOG.info(f"{table} next update: {result['next_update']}")
+            table_changes = self.update_database(
+                result['locations'], table, result['next_update'], result['authoritative']
+            )
+            if table_changes is None:
+                failed.append(table)
+            else:
+                changes[table] = table_changes
+
+        # Validators are saved only once every table is stored; otherwise the next scrape
+        # would get a 304 and the failed tables would keep their old data
+        if failed:
+            SCRAPER_LOG.error(f"Not saving cache validators: failed to update {', '.join(failed)}.")
+            return changes
+        for source in self.sources:
+            if source.validators != loaded[source.name]:
+                self.save_validators(source.name, source.validators)
+        SCRAPER_LOG.info("Finished scraping and updating the database.")
+        return changes
+
+    def load_validators(self, source: str = 'avitd') -> dict[str, str]:
         """
-        Extract the next update time for a specific section (guilds or shops).
+        Load the ETag / Last-Modified of the last copy of a source stored.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content.
-            section_name (str): The name of the section (e.g., 'Guilds', 'Shops').
+            source (str, optional): Source name; validators are stored as '<source>_etag' etc.
 
         Returns:
-            str: The next update time in 'YYYY-MM-DD HH:MM:SS' format or 'NA' if not found.
+            dict[str, str]: 'etag' / 'last_modified' values; empty if none are stored.
         """
-        logging.debug(f"Extracting next update time for section: {section_name}")
-
-        # Find all divs with the 'next_change' class
-        section_divs = soup.find_all('div', class_='next_change')
-
-        # Iterate through the divs to find the matching section
-        for div in section_divs:
-            if section_name in div.text:
-                # Search for the time pattern
-                match = re.search(r'(\d+)\s+days?,\s+(\d+)h\s+(\d+)m\s+(\d+)s', div.text)
-                if match:
-                    # Parse time components
-                    days = int(match.group(1))
-                    hours = int(match.group(2))
-                    minutes = int(match.group(3))
-                    seconds = int(match.group(4))
-
-                    # Calculate the next update time
-                    next_update = datetime.now() + timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
-                    logging.debug(f"Next update time for {section_name}: {next_update}")
-
-                    # Return the formatted date-time string
-                    return next_update.strftime('%Y-%m-%d %H:%M:%S')
-
-        # Return 'NA' if no match is found
-        logging.warning(f"No next update time found for {section_name}.")
-        return 'NA'
-
-    def display_results(self, guilds, shops, guilds_next_update, shops_next_update):
+        try:
+            cursor = self.connection.execute(
+                "SELECT setting_name, setting_value FROM settings WHERE setting_name IN (?, ?)",
+                (f"{source}_etag", f"{source}_last_modified")
+            )
+            return {name.replace(f"{source}_", '', 1): value for name, value in cursor.fetchall()}
+        except sqlite3.Error as e:
+            SCRAPER_LOG.warning(f"Failed to load {source} cache validators: {e}")
+            return {}
+
+    def save_validators(self, source: str, validators: dict[str, str]) -> None:
         """
-        Display the results of the scraping in the console for debugging purposes.
+        Store the ETag / Last-Modified of the copy of a source just stored.
 
         Args:
-            guilds (list): List of scraped guild data.
-            shops (list): List of scraped shop data.
-            guilds_next_update (str): The next update time for guilds.
-            shops_next_update (str): The next update time for shops.
+            source (str): Source name.
+            validators (dict[str, str]): From response_validators.
         """
-        logging.info(f"Guilds Next Update: {guilds_next_update}")
-        logging.info(f"Shops Next Update: {shops_next_update}")
-
-        logging.info("Guilds Data:")
-        for guild in guilds:
-            logging.info(f"Name: {guild[0]}, Column: {guild[1]}, Row: {guild[2]}")
-
-        logging.info("Shops Data:")
-        for shop in shops:
-            logging.info(f"Name: {shop[0]}, Column: {shop[1]}, Row: {shop[2]}")
+        try:
+            self.connection.executemany(
+                """
+                INSERT INTO settings (setting_name, setting_value) VALUES (?, ?)
+                ON CONFLICT(setting_name) DO UPDATE SET setting_value = excluded.setting_value
+                """,
+                [(f"{source}_{key}", value) for key, value in validators.items()]
+            )
+            self.connection.commit()
+        except sqlite3.Error as e:
+            SCRAPER_LOG.warning(f"Failed to save {source} cache validators: {e}")
 
-    def update_database(self, data, table, next_update):
+    def update_database(self, data, table, next_update=None, authoritative=True) -> dict[str, list] | None:
         """
         Update the SQLite database with the scraped data.
 
+        Only rows whose location changed are written, together with the new next_update,
+        in a single transaction, so readers see either the old or the new locations and
+        never a half-applied (or all 'NA') table.
+
         Args:
             data (list): List of tuples containing the name, column, and row of each entry.
-            table (str): The table name ('guilds' or 'shops') to update.
-            next_update (str): The next update time to be stored in the database.
+            table (str): The table name ('guilds', 'shops', 'taverns', ...) to update.
+            next_update (str, optional): The next update time to store; None for tables without one.
+            authoritative (bool, optional): data lists every entry, so entries no longer listed
+                are set to 'NA'; otherwise entries are only added and moved.
+
+        Returns:
+            dict[str, list] | None: 'added' and 'moved' as (name, column, row) tuples and 'removed' as names,
+            all empty if nothing changed; None if the update failed and nothing was written.
         """
+        changes = {'added': [], 'moved': [], 'removed': []}
         if not self.connection:
-            logging.error("Failed to connect to the database.")
-            return
-
-        cursor = self.connection.cursor()
+            SCRAPER_LOG.error("Failed to connect to the database.")
+            return None
 
-        # Step 1: Set all entries' Row and Column to 'NA', except Peacekeeper's Missions for guilds
-        try:
-            logging.debug(
-                f"Setting all {table} entries' Row and Column to 'NA', except Peacekeeper's Missions for guilds.")
-            if table == "guilds":
-                cursor.execute(f"""
-                    UPDATE {table}
-                    SET `Column`='NA', `Row`='NA', `next_update`=?
-                    WHERE Name NOT LIKE 'Peacekeepers Mission%'
-                """, (next_update,))
-            else:  # If updating 'shops', clear all without exception
-                cursor.execute(f"""
-                    UPDATE {table}
-                    SET `Column`='NA', `Row`='NA', `next_update`=?
-                """, (next_update,))
-        except sqlite3.Error as e:
-            logging.error(f"Failed to reset {table} entries to 'NA': {e}")
-            return
-
-        # Step 2: Insert or update entries, excluding Peacekeeper's Missions in shops
+        # Desired state; Peacekeeper's Missions are fixed and belong in guilds only
+        desired = {}
         for name, column, row in data:
             if table == "shops" and "Peacekeepers Mission" in name:
-                logging.warning(f"Skipping {name} as it belongs in guilds, not shops.")
-                continue  # Skip Peacekeeper's Missions when updating shops
-
-            try:
-                logging.debug(
-                    f"Updating {table} entry: Name={name}, Column={column}, Row={row}, Next Update={next_update}")
-                cursor.execute(f"""
-                    INSERT INTO {table} (Name, `Column`, `Row`, `next_update`)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(Name) DO UPDATE SET
-                        `Column`=excluded.`Column`,
-                        `Row`=excluded.`Row`,
-                        `next_update`=excluded.`next_update`
-                """, (name, column, row, next_update))
-            except sqlite3.Error as e:
-                logging.error(f"Failed to update {table} entry '{name}': {e}")
-
-        # Step 3: Ensure Peacekeeper’s Missions Always Remain in Guilds Table Only
+                SCRAPER_LOG.warning(f"Skipping {name} as it belongs in guilds, not shops.")
+                continue
+            desired[name] = (column, row)
         if table == "guilds":
+            desired.update(self.PEACEKEEPER_MISSIONS)
+
+        try:
+            stored = {
+                name: (column, row)
+                for name, column, row in self.connection.execute(f"SELECT Name, `Column`, `Row` FROM {table}")
+            }
+            for name, (column, row) in desired.items():
+                if stored.get(name, ('NA', 'NA')) == ('NA', 'NA'):
+                    changes['added'].append((name, column, row))
+                elif stored[name] != (column, row):
+                    changes['moved'].append((name, column, row))
+            if authoritative:
+                changes['removed'] = [
+                    name for name, location in stored.items() if name not in desired and location != ('NA', 'NA')
+                ]
+
+            # Not every table has a UNIQUE Name to upsert on, so update known names and insert new ones
+            written = changes['added'] + changes['moved']
+            with self.connection:  # One transaction: commit on success, roll back on error
+                self.connection.executemany(
+                    f"UPDATE {table} SET `Column`=?, `Row`=? WHERE Name = ?",
+                    [(column, row, name) for name, column, row in written if name in stored]
+                )
+                self.connection.executemany(
+                    f"INSERT INTO {table} (Name, `Column`, `Row`) VALUES (?, ?, ?)",
+                    [entry for entry in written if entry[0] not in stored]
+                )
+                self.connection.executemany(
+                    f"UPDATE {table} SET `Column`='NA', `Row`='NA' WHERE Name = ?",
+                    [(name,) for name in changes['removed']]
+                )
+                if next_update is not None:
+                    self.connection.execute(
+                        f"UPDATE {table} SET `next_update`=? WHERE `next_update` IS NOT ?", (next_update, next_update)
+                    )
+        except sqlite3.Error as e:
+            SCRAPER_LOG.error(f"Failed to update {table}: {e}")
+            return None
+
+        for kind, entries in changes.items():
+            for entry in entries:
+                SCRAPER_LOG.debug(f"{table} {kind}: {entry}")
+        SCRAPER_LOG.info(
+            f"Database updated for {table}: {len(changes['added'])} added, "
+            f"{len(changes['moved'])} moved, {len(changes['removed'])} removed."
+        )
+
+        if any(changes.values()):
             try:
-                logging.debug("Ensuring Peacekeeper's Mission locations remain constant in guilds table.")
-                cursor.executemany("""
-                    INSERT INTO guilds (Name, `Column`, `Row`, `next_update`)
-                    VALUES (?, ?, ?, ?)
-                    ON CONFLICT(Name) DO UPDATE SET
-                        `Column`=excluded.`Column`,
-                        `Row`=excluded.`Row`,
-                        `next_update`=excluded.`next_update`
-                """, [
-                    ("Peacekeepers Mission 1", "Emerald", "67th", next_update),
-                    ("Peacekeepers Mission 2", "Unicorn", "33rd", next_update),
-                    ("Peacekeepers Mission 3", "Emerald", "33rd", next_update),
-                ])
-            except sqlite3.Error as e:
-                logging.error(f"Failed to persist Peacekeeper's Missions in guilds: {e}")
-
-        self.connection.commit()
-        cursor.close()
-        logging.info(f"Database updated for {table}.")
+                rebuild_spatial_index(self.connection)
+            except sqlite3.Error:
+                SCRAPER_LOG.warning(f"Spatial index not refreshed after {table} update.")
+        return changes
 
     def close_connection(self):
         """
@@ -226,4 +229,4 @@ class AVITDScraper:
         """
         if self.connection:
             self.connection.close()
-            logging.info("Database connection closed.")
+            SCRAPER_LOG.info("Database connection closed.")
@@ -2,23 +2,37 @@
 # Character Management
 # -----------------------
 
-    def load_characters(self):
+    def read_characters(self) -> list[dict]:
         """
-        Load characters from the SQLite database, including IDs for reference.
-        Only populate the list, do not auto-select.
-        """
-        try:
-            connection = sqlite3.connect(DB_PATH)
-            cursor = connection.cursor()
+        Read characters from the SQLite database, including IDs for reference.
+
+        Touches no widgets, so it is safe to run on a startup worker thread.
+
+        Returns:
+            list[dict]: Characters as {'id', 'name', 'password'} dicts.
 
-            # Fetch characters from the database including id
+        Raises:
+            sqlite3.Error: If the characters cannot be read.
+        """
+        with sqlite3.connect(DB_PATH) as conn:
+            cursor = conn.cursor()
             cursor.execute("SELECT id, name, password FROM characters")
-            character_data = cursor.fetchall()
-            self.characters = [
+            return [
                 {'id': char_id, 'name': name, 'password': password}
-                for char_id, name, password in character_data
+                for char_id, name, password in cursor.fetchall()
             ]
 
+    def load_characters(self, characters: list[dict] | None = None):
+        """
+        Load characters from the SQLite database, including IDs for reference.
+        Only populate the list, do not auto-select.
+
+        Args:
+            characters (list[dict], optional): Rows from read_characters; read from the database when omitted.
+        """
+        try:
+            self.characters = self.read_characters() if characters is None else characters
+
             # Populate characters list without selecting
             self.character_list.clear()
             for character in self.characters:
@@ -35,8 +49,6 @@
             QMessageBox.critical(self, "Error", f"Failed to load characters: {e}")
             self.characters = []
             self.selected_character = None
-        finally:
-            connection.close()
 
     def save_characters(self):
         """
@@ -65,8 +77,8 @@
         Args:
             item (QListWidgetItem): The selected item in the list.
 
-        Logs the selected character, saves the last active character,
-        logs out the current character, and then logs in the selected one.
+        Logs the selected character, saves the last active character, and
+        swaps the view to the character's own session (see switch_character_page).
         """
         character_name = item.text()
         selected_character = next((char for char in self.characters if char['name'] == character_name), None)
@@ -98,9 +110,8 @@
             else:
                 logging.error(f"Cannot save last active character: ID missing for '{character_name}'.")
 
-            # Logout current character and login the selected one
-            self.logout_current_character()
-            QTimer.singleShot(1000, self.login_selected_character)
+            # Show the character's own session; no logout needed
+            self.switch_character_page(self.selected_character)
         else:
             logging.error(f"Character '{character_name}' selection failed.")
 
@@ -110,24 +121,27 @@
         """
         logging.debug("Logging out current character.")
         self.website_frame.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl?action=logout'))
-        QTimer.singleShot(1000, self.login_selected_character)
 
     def login_selected_character(self):
-        """Log in the selected character using JavaScript."""
+        """
+        Submit the login form for the selected character using JavaScript.
+
+        Called by the login state machine (run_login_action), which submits once per page load.
+        """
         if not self.selected_character:
             logging.warning("No character selected for login.")
             return
         logging.debug(f"Logging in character: {self.selected_character['name']} with ID: {self.selected_character.get('id')}")
         name = self.selected_character['name']
         password = self.selected_character['password']
+        # Only the login form has an 'iam' field; a session that is already logged in is left alone
         login_script = f"""
-            var loginForm = document.querySelector('form');
-            if (loginForm) {{
+            var loginField = document.querySelector('form input[name="iam"]');
+            if (loginField) {{
+                var loginForm = loginField.form;
                 loginForm.iam.value = '{name}';
                 loginForm.passwd.value = '{password}';
                 loginForm.submit();
-            }} else {{
-                console.error('Login form not found.');
             }}
         """
         self.website_frame.page().runJavaScript(login_script)
@@ -216,6 +230,9 @@
             return
 
         name = current_item.text()
+        deleted = next((char for char in self.characters if char['name'] == name), None)
+        if deleted and 'id' in deleted:
+            self.close_character_page(deleted['id'])
         self.characters = [char for char in self.characters if char['name'] != name]
         self.save_characters()
         self.character_list.takeItem(self.character_list.row(current_item))
@@ -256,9 +273,7 @@
                                 self.character_list.setCurrentRow(i)
                                 break
                         logging.debug(f"Last active character loaded and selected: {self.selected_character['name']}")
-                        if len(self.characters) > 1:  # Trigger login only if multiple characters exist
-                            self.login_needed = True
-                            self.website_frame.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl'))
+                        self.request_login()
                     else:
                         logging.warning(f"Last active character ID '{character_id}' not found in character list.")
                         self.set_default_character()
@@ -279,8 +294,27 @@
             self.character_list.setCurrentRow(0)
             logging.debug(f"No valid last active character; defaulting to: {self.selected_character['name']}")
             self.save_last_active_character(self.selected_character['id'])
-            self.login_needed = True
-            self.website_frame.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl'))
+            self.request_login()
         else:
             self.selected_character = None
             logging.warning("No characters available to set as default.")
+
+    def request_login(self, started: float | None = None):
+        """
+        Log in the selected character on the page on screen, without navigating again.
+
+        The startup navigation is already in flight by the time characters are loaded;
+        the login state machine acts when the page is checked, now if it has loaded
+        and otherwise on its loadFinished. The first login claims the startup page.
+
+        Args:
+            started (float, optional): time.perf_counter() when the switch began, for its latency.
+        """
+        if not self.selected_character or 'id' not in self.selected_character:
+            logging.warning("No character selected for login.")
+            return
+        if self.page_character_id is None:
+            self.page_character_id = self.selected_character['id']
+            self.character_pages[self.page_character_id] = self.website_frame.page()
+        self.login_machine(self.page_character_id).request(started)
+        self.check_login_page()
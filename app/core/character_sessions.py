@@ -0,0 +1,203 @@
+    # -----------------------
+    # Character Sessions
+    # -----------------------
+
+    def init_character_sessions(self) -> None:
+        """
+        Set up the warm pool of per-character pages.
+
+        Each character gets its own QWebEngineProfile (own storage path and cookie
+        store) and one page on it. Switching characters swaps the view to that page;
+        a warm page is still logged in, so nothing has to load. The startup page,
+        on the default profile, belongs to the first character logged in on it.
+        Each session has its own LoginStateMachine (self.login_machines).
+
+        Hidden pages are frozen at once, discarded after CHARACTER_PAGE_DISCARD_MS
+        (their session survives in the profile), and closed when more than
+        CHARACTER_POOL_SIZE pages are open.
+        """
+        self.character_profiles: dict[int, QWebEngineProfile] = {}
+        self.character_pages: dict[int, QWebEnginePage] = {}  # character id -> page, least recently shown first
+        self.character_page_hidden_at: dict[int, float] = {}  # character id -> monotonic time it was hidden
+        self.login_machines: dict[int, LoginStateMachine] = {}
+        self.page_character_id = None  # Claimed by the first login on the startup page
+        self.website_frame.urlChanged.connect(self.on_webview_url_changed)
+
+        self.character_page_timer = QTimer(self)
+        self.character_page_timer.setInterval(60 * 1000)
+        self.character_page_timer.timeout.connect(self.discard_idle_character_pages)
+        self.character_page_timer.start()
+
+    def configure_page(self, page: QWebEnginePage) -> None:
+        """Apply the web settings every page in the window uses."""
+        settings = page.settings()
+        settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, False)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, False)
+        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)  # Keep JS enabled
+
+    def character_profile(self, character_id: int) -> QWebEngineProfile:
+        """
+        The character's persistent profile, created on first use.
+
+        Profiles are never deleted while the app runs: a page must not outlive its profile.
+        """
+        profile = self.character_profiles.get(character_id)
+        if profile is None:
+            storage_path = os.path.join(os.getcwd(), CHARACTER_PROFILES_DIR, str(character_id))
+            try:
+                os.makedirs(storage_path, exist_ok=True)
+            except OSError as e:
+                logging.error(f"Failed to create profile storage at {storage_path}: {e}")
+            profile = QWebEngineProfile(f"character_{character_id}", self)
+            profile.setPersistentStoragePath(storage_path)
+            profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
+            self.configure_profile(profile, f"character_{character_id}")
+            self.character_profiles[character_id] = profile
+        return profile
+
+    def switch_character_page(self, character: dict) -> None:
+        """
+        Show the character's page, opening one (which logs in once loaded) if none is warm.
+
+        Args:
+            character (dict): The selected character; must have an 'id'.
+        """
+        character_id = character.get('id')
+        if character_id is None:
+            logging.error(f"Cannot switch to '{character['name']}': character ID missing.")
+            return
+        started = time.perf_counter()
+        if self.page_character_id is None or character_id == self.page_character_id:
+            self.request_login(started)  # Startup page not claimed yet, or the same session
+            return
+
+        old_page = self.website_frame.page()
+        old_character_id = self.page_character_id
+
+        page = self.character_pages.pop(character_id, None)
+        state = page.lifecycleState() if page else None
+        if page is None:
+            page = QWebEnginePage(self.character_profile(character_id), self)
+            self.configure_page(page)
+            if getattr(self, 'web_channel', None):
+                page.setWebChannel(self.web_channel)
+        self.character_pages[character_id] = page  # Most recently shown last
+        self.character_page_hidden_at.pop(character_id, None)
+
+        self.website_frame.setPage(page)
+        self.page_character_id = character_id
+        self.move_queue.clear()  # Moves were meant for the page just hidden
+        if old_character_id is not None and old_page is not page:
+            old_page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+            self.character_page_hidden_at[old_character_id] = time.monotonic()
+
+        machine = self.login_machine(character_id)
+        machine.request(started)
+        if state is None or state == QWebEnginePage.LifecycleState.Discarded:
+            # New or discarded: load the game page instead of replaying the last (possibly POSTed) navigation.
+            # The profile usually keeps the session; the check after loading submits the form only if it is shown.
+            page.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl'))
+        else:
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+            page.toHtml(self.process_html)  # Minimap and coins follow the character on screen
+            self.check_login_page()  # Still logged in: completes the switch at once
+
+        self.evict_character_pages()
+        kind = {None: "new", QWebEnginePage.LifecycleState.Discarded: "discarded"}.get(state, "warm")
+        logging.info(f"Switched view to '{character['name']}' ({kind} page) in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def evict_character_pages(self) -> None:
+        """Close the least recently shown pages beyond CHARACTER_POOL_SIZE."""
+        while len(self.character_pages) > CHARACTER_POOL_SIZE:
+            character_id = next(iter(self.character_pages))
+            if character_id == self.page_character_id:
+                break
+            page = self.character_pages.pop(character_id)
+            self.character_page_hidden_at.pop(character_id, None)
+            page.deleteLater()
+            logging.debug(f"Closed page of character ID {character_id} (pool full)")
+
+    def discard_idle_character_pages(self) -> None:
+        """Discard pages hidden longer than CHARACTER_PAGE_DISCARD_MS; they stay in the pool."""
+        now = time.monotonic()
+        for character_id, hidden_at in self.character_page_hidden_at.items():
+            page = self.character_pages.get(character_id)
+            if (page and (now - hidden_at) * 1000 >= CHARACTER_PAGE_DISCARD_MS
+                    and page.lifecycleState() != QWebEnginePage.LifecycleState.Discarded):
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+                logging.debug(f"Discarded idle page of character ID {character_id}")
+
+    def close_character_page(self, character_id: int) -> None:
+        """Close a deleted character's page, unless it is on screen."""
+        if character_id != self.page_character_id and character_id in self.character_pages:
+            self.character_pages.pop(character_id).deleteLater()
+            self.character_page_hidden_at.pop(character_id, None)
+            self.login_machines.pop(character_id, None)
+
+    # -----------------------
+    # Login State
+    # -----------------------
+
+    # Result of checking a page: 'form' (login form shown), 'in' (game page without it) or 'pending'
+    LOGIN_PAGE_CHECK = """
+        (function() {
+            if (location.hostname !== 'quiz.ravenblack.net' || document.readyState !== 'complete') {
+                return 'pending';
+            }
+            return document.querySelector('form input[name="iam"]') ? 'form' : 'in';
+        })();
+    """
+
+    def login_machine(self, character_id: int) -> LoginStateMachine:
+        """The login state machine of a character's session, created on first use."""
+        machine = self.login_machines.get(character_id)
+        if machine is None:
+            name = next((char['name'] for char in self.characters if char.get('id') == character_id), str(character_id))
+            machine = self.login_machines[character_id] = LoginStateMachine(name)
+        return machine
+
+    def check_login_page(self) -> None:
+        """Check the page on screen for the login form; the answer drives the login state."""
+        character_id = self.page_character_id
+        if character_id is None:
+            return
+        self.website_frame.page().runJavaScript(
+            self.LOGIN_PAGE_CHECK, lambda result: self.on_login_page_checked(character_id, result)
+        )
+
+    def on_login_page_checked(self, character_id: int, result: str) -> None:
+        if character_id != self.page_character_id or result not in ('form', 'in'):
+            return  # Switched away meanwhile, or the page isn't ready; its loadFinished checks again
+        machine = self.login_machine(character_id)
+        self.run_login_action(character_id, machine.page_checked(result == 'form'))
+
+    def on_login_load_finished(self, success: bool) -> None:
+        """Feed a finished page load to the login state of the session on screen."""
+        if self.page_character_id is None:
+            return
+        self.run_login_action(self.page_character_id, self.login_machine(self.page_character_id).page_loaded(success))
+        if success:
+            self.check_login_page()
+
+    def on_webview_url_changed(self, url: QUrl) -> None:
+        """Opening the logout URL logs the session out; it stays out until a login is requested."""
+        if self.page_character_id is not None and 'action=logout' in url.query():
+            self.login_machine(self.page_character_id).logged_out()
+
+    def on_login_timeout(self, character_id: int, attempt: int) -> None:
+        machine = self.login_machines.get(character_id)
+        if machine and character_id == self.page_character_id:
+            self.run_login_action(character_id, machine.timed_out(attempt))
+
+    def run_login_action(self, character_id: int, action: str | None) -> None:
+        """Perform what the login state machine asked for."""
+        machine = self.login_machines[character_id]
+        if action == SUBMIT:
+            self.login_selected_character()
+            attempt = machine.attempts
+            QTimer.singleShot(LOGIN_TIMEOUT_MS, lambda: self.on_login_timeout(character_id, attempt))
+        elif action == RELOAD:
+            self.website_frame.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl'))
+        elif machine.state == FAILED:
+            QMessageBox.warning(self, "Login Failed",
+                                f"Could not log in '{machine.name}'. Check the password and select the character again.")
@@ -0,0 +1,108 @@
+# app/core/http_session.py
+"""
+RBCMap HTTP Session
+
+One shared requests.Session for the scrapers, with pooled keep-alive
+connections, connect/read timeouts, retry with exponential backoff on
+connection errors and 5xx/429 responses, gzip, and conditional GET
+(ETag / Last-Modified) so unchanged pages come back as a 304 with no body.
+
+requests is imported on first use so it stays off the startup path.
+
+See LICENSE for usage restrictions.
+"""
+
+import threading
+
+# (connect, read) timeouts in seconds; no request may block a worker forever
+HTTP_TIMEOUT = (5, 20)
+
+# Retries after the first attempt; sleeps HTTP_BACKOFF_FACTOR * 2^(n-1) s between them
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Keep-alive connections kept per host
+HTTP_POOL_SIZE = 4
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the shared session, creating it on first use.
+
+    Returns:
+        requests.Session: Session with retrying, pooled adapters mounted for http and https.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset({'GET', 'HEAD'}),
+                respect_retry_after_header=True,
+                raise_on_status=False  # Hand the last response back; callers use raise_for_status()
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['Accept-Encoding'] = 'gzip, deflate'
+            _session = session
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session's pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def conditional_get(url: str, validators: dict[str, str] | None = None, headers: dict[str, str] | None = None,
+                    timeout: tuple[float, float] = HTTP_TIMEOUT):
+    """
+    GET url on the shared session, revalidating against a previous response.
+
+    Args:
+        url (str): URL to fetch.
+        validators (dict[str, str], optional): 'etag' / 'last_modified' from response_validators.
+        headers (dict[str, str], optional): Extra request headers.
+        timeout (tuple[float, float], optional): (connect, read) timeouts in seconds.
+
+    Returns:
+        requests.Response: The response; status 304 means the page is unchanged.
+
+    Raises:
+        requests.RequestException: On connection failure or timeout once retries are used up.
+    """
+    request_headers = dict(headers or {})
+    if validators:
+        if validators.get('etag'):
+            request_headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            request_headers['If-Modified-Since'] = validators['last_modified']
+    return get_session().get(url, headers=request_headers, timeout=timeout)
+
+
+def response_validators(response) -> dict[str, str]:
+    """
+    Cache validators from a response, for the next conditional_get.
+
+    Returns:
+        dict[str, str]: 'etag' and 'last_modified' (empty strings if the server sent none).
+    """
+    return {
+        'etag': response.headers.get('ETag', ''),
+        'last_modified': response.headers.get('Last-Modified', ''),
+    }
@@ -0,0 +1,404 @@
+# app/core/ingestion.py
+"""
+RBCMap Location Ingestion
+
+Pipeline that brings location data (guilds, shops, taverns, user
+buildings, ...) in from any number of sources:
+
+    fetch -> parse -> normalize -> validate -> merge
+
+Each source is an adapter (LocationSource subclass) that knows how to
+fetch its page or feed and parse it into (name, column, row) entries per
+table. Sources are fetched and parsed concurrently; the results are then
+normalized to integer street coordinates, validated against the map, and
+merged with per-source priority and freshness rules. Writing the merged
+result to the database is left to the caller (AVITDScraper.update_database).
+
+Freshness is judged by when the data was published: a feed's own "updated"
+timestamp if it has one, else the Last-Modified of the response, else the
+time it was fetched.
+
+Every source can read from a local file instead of its URL, and URLs can
+point at the stand-in server in app/benchmarks, so the whole pipeline
+runs offline.
+
+See LICENSE for usage restrictions.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+from app.core.http_session import conditional_get, response_validators
+
+# Tables a source may feed; entries are keyed by Name
+INGEST_TABLES = ('guilds', 'shops', 'taverns', 'userbuildings', 'placesofinterest')
+
+logger = logging.getLogger('rbc.scraper')
+
+# Most sources fetched at once
+MAX_PARALLEL_FETCHES = 8
+
+
+def local_time(value: datetime) -> datetime:
+    """A timezone-aware time as naive local time, like datetime.now(); naive times are returned as is."""
+    return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+
+class LocationSource(ABC):
+    """
+    Base adapter for one location source; subclasses implement parse.
+
+    Attributes:
+        name (str): Short identifier, also the prefix of its stored cache validators.
+        tables (tuple[str, ...]): Tables the source may provide.
+        authoritative (bool): The source lists every entry of its tables, so entries it
+            doesn't list are removed (set to 'NA'); otherwise it only adds and moves.
+        priority (int): Wins conflicting locations against lower-priority sources.
+        max_age (timedelta): Data published longer ago than this is ignored.
+    """
+
+    name = 'source'
+    tables: tuple[str, ...] = ()
+    authoritative = False
+    priority = 0
+    max_age = timedelta(days=2)
+
+    def __init__(self, url: str | None = None, path: str | None = None,
+                 headers: dict[str, str] | None = None) -> None:
+        """
+        Args:
+            url (str, optional): Page or feed URL (the real site or a stand-in server).
+            path (str, optional): Local file to read instead of fetching (offline mode).
+            headers (dict[str, str], optional): Extra HTTP request headers.
+        """
+        self.url = url
+        self.path = path
+        self.headers = headers or {}
+        self.validators: dict[str, str] = {}  # ETag / Last-Modified of the last page stored
+
+    def fetch(self) -> tuple[str | None, datetime]:
+        """
+        Fetch the raw page or feed.
+
+        Returns:
+            tuple: (text, or None if unchanged since self.validators; time the data was published,
+            from Last-Modified, or now if the response has none or it came from a local file).
+
+        Raises:
+            OSError: If the local file can't be read.
+            requests.RequestException: If the URL can't be fetched.
+        """
+        if self.path:
+            # Not the file's mtime: a fixture or offline copy must not age out of max_age
+            with open(self.path, encoding='utf-8') as f:
+                return f.read(), datetime.now()
+        response = conditional_get(self.url, self.validators, self.headers)
+        response.raise_for_status()
+        if response.status_code == 304:
+            return None, datetime.now()
+        self.validators = response_validators(response)
+        try:
+            published = local_time(parsedate_to_datetime(self.validators['last_modified']))
+        except (TypeError, ValueError):
+            published = datetime.now()  # No or malformed Last-Modified
+        return response.text, published
+
+    @abstractmethod
+    def parse(self, text: str) -> dict:
+        """
+        Parse fetched text.
+
+        Returns:
+            dict: {'locations': {table: [(name, column, row)]}, 'next_update': {table: 'YYYY-MM-DD HH:MM:SS'}},
+            plus 'observed_at' (datetime) if the data carries its own publication time.
+        """
+
+
+class AVITDSource(LocationSource):
+    """A View in the Dark: every guild and shop, in HTML tables keyed by section image alt text."""
+
+    name = 'avitd'
+    tables = ('guilds', 'shops')
+    authoritative = True
+    priority = 10
+    max_age = timedelta(days=1)
+
+    SECTIONS = {'guilds': ('the guilds', 'Guilds'), 'shops': ('the shops', 'Shops')}
+
+    def parse(self, text: str) -> dict:
+        # Imported here so only the scraper worker pays for bs4
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(text, 'html.parser')
+        locations, next_update = {}, {}
+        for table, (image_alt, section_name) in self.SECTIONS.items():
+            locations[table] = self.scrape_section(soup, image_alt)
+            next_update[table] = self.extract_next_update_time(soup, section_name)
+        return {'locations': locations, 'next_update': next_update}
+
+    def scrape_section(self, soup, section_image_alt: str) -> list[tuple[str, str, str]]:
+        """
+        Scrape a specific section (guilds or shops) from the page.
+
+        Args:
+            soup (BeautifulSoup): Parsed HTML content.
+            section_image_alt (str): The alt text of the section image to locate the section.
+
+        Returns:
+            list: A list of tuples containing the name, column, and row of each entry.
+        """
+        data = []
+        section_image = soup.find('img', alt=section_image_alt)
+        if not section_image:
+            logger.warning(f"No data found for {section_image_alt}.")
+            return data
+
+        table = section_image.find_next('table')
+        for row in table.find_all('tr', class_=['odd', 'even']):
+            columns = row.find_all('td')
+            if len(columns) < 2:
+                logger.debug(f"Skipping row due to insufficient columns: {row}")
+                continue
+
+            name = columns[0].text.strip()
+            location = columns[1].text.strip().replace("SE of ", "").strip()
+            try:
+                column, street_row = location.split(" and ")
+                data.append((name, column, street_row))
+            except ValueError:
+                logger.warning(f"Location format unexpected for {name}: {location}")
+
+        logger.info(f"Scraped {len(data)} entries from {section_image_alt}.")
+        return data
+
+    def extract_next_update_time(self, soup, section_name: str) -> str:
+        """
+        Extract the next update time for a specific section (guilds or shops).
+
+        Returns:
+            str: The next update time in 'YYYY-MM-DD HH:MM:SS' format or 'NA' if not found.
+        """
+        for div in soup.find_all('div', class_='next_change'):
+            if section_name in div.text:
+                match = re.search(r'(\d+)\s+days?,\s+(\d+)h\s+(\d+)m\s+(\d+)s', div.text)
+                if match:
+                    days, hours, minutes, seconds = (int(group) for group in match.groups())
+                    next_update = datetime.now() + timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+                    logger.debug(f"Next update time for {section_name}: {next_update}")
+                    return next_update.strftime('%Y-%m-%d %H:%M:%S')
+
+        logger.warning(f"No next update time found for {section_name}.")
+        return 'NA'
+
+
+class CommunityFeedSource(LocationSource):
+    """
+    A community JSON feed, e.g. user buildings or taverns maintained by players:
+
+        {"name": "...", "tables": ["taverns"], "updated": "2024-05-01T12:00:00+00:00",
+         "locations": [{"table": "taverns", "name": "...", "column": "Emerald", "row": "67th"}]}
+
+    Column and row may be street names or street coordinates. "updated" (ISO 8601, optional)
+    is when the feed was last edited and takes precedence over the fetch's time for max_age.
+    Feeds only add and move entries.
+    """
+
+    name = 'community'
+    tables = ('taverns', 'userbuildings', 'placesofinterest')
+    priority = 0
+
+    def __init__(self, url: str | None = None, path: str | None = None, name: str | None = None,
+                 tables: tuple[str, ...] | None = None, headers: dict[str, str] | None = None) -> None:
+        super().__init__(url, path, headers)
+        if name:
+            self.name = name
+        if tables:
+            self.tables = tuple(tables)
+
+    def parse(self, text: str) -> dict:
+        feed = json.loads(text)
+        locations: dict[str, list] = {}
+        for entry in feed.get('locations', []):
+            try:
+                locations.setdefault(entry['table'], []).append((entry['name'], entry['column'], entry['row']))
+            except (KeyError, TypeError):
+                logger.warning(f"{self.name}: skipping malformed feed entry {entry!r}")
+        parsed = {'locations': locations, 'next_update': {}}
+        if feed.get('updated'):
+            try:
+                parsed['observed_at'] = local_time(datetime.fromisoformat(feed['updated']))
+            except (TypeError, ValueError):
+                logger.warning(f"{self.name}: ignoring malformed updated time {feed['updated']!r}")
+        return parsed
+
+
+# -----------------------
+# Pipeline Steps
+# -----------------------
+
+def load_street_coordinates(conn: sqlite3.Connection) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    Street name to coordinate maps for columns and rows.
+
+    Returns:
+        tuple: (columns, rows) as {name: coordinate}.
+    """
+    columns = dict(conn.execute("SELECT Name, Coordinate FROM `columns`"))
+    rows = dict(conn.execute("SELECT Name, Coordinate FROM `rows`"))
+    return columns, rows
+
+
+def normalize(entries: list[tuple], columns: dict[str, int], rows: dict[str, int]) -> list[tuple]:
+    """
+    Resolve each entry's streets to integer coordinates.
+
+    Streets may be given by name or by coordinate; coordinates are mapped back to the
+    first street name with that coordinate so the stored form stays consistent.
+
+    Returns:
+        list[tuple]: (name, column, row, x, y), with x/y None where a street is unknown.
+    """
+    column_names = {coordinate: name for name, coordinate in reversed(list(columns.items()))}
+    row_names = {coordinate: name for name, coordinate in reversed(list(rows.items()))}
+
+    def resolve(street, streets: dict[str, int], names: dict[int, str]) -> tuple[str, int | None]:
+        if isinstance(street, int) or (isinstance(street, str) and street.isdigit() and street not in streets):
+            coordinate = int(street)
+            return names.get(coordinate, str(street)), coordinate if coordinate in names else None
+        street = str(street).strip()
+        return street, streets.get(street)
+
+    normalized = []
+    for name, column, row in entries:
+        column, x = resolve(column, columns, column_names)
+        row, y = resolve(row, rows, row_names)
+        normalized.append((str(name).strip(), column, row, x, y))
+    return normalized
+
+
+def validate(entries: list[tuple], source: str, table: str) -> list[tuple]:
+    """
+    Drop entries without a name or with streets that aren't on the map.
+
+    Returns:
+        list[tuple]: The valid (name, column, row, x, y) entries.
+    """
+    valid = []
+    for entry in entries:
+        name, column, row, x, y = entry
+        if not name or x is None or y is None:
+            logger.warning(f"{source}: dropping invalid {table} entry {name!r} at {column!r}/{row!r}")
+            continue
+        valid.append(entry)
+    return valid
+
+
+def merge(batches: list[dict], now: datetime | None = None) -> dict[str, dict]:
+    """
+    Merge validated batches from several sources into one location list per table.
+
+    Batches published longer ago than their source's max_age are ignored. When sources
+    disagree about an entry, the higher priority wins, then the more recently published.
+
+    Args:
+        batches (list[dict]): {'source': LocationSource, 'observed_at': datetime (published),
+            'locations': {table: [(name, column, row, x, y)]}, 'next_update': {table: str}}.
+        now (datetime, optional): Current time, for freshness checks.
+
+    Returns:
+        dict[str, dict]: {table: {'locations': [(name, column, row)], 'authoritative': bool,
+            'next_update': str | None}}.
+    """
+    now = now or datetime.now()
+    winners: dict[str, dict[str, tuple]] = {}
+    merged: dict[str, dict] = {}
+    for batch in batches:
+        source = batch['source']
+        if now - batch['observed_at'] > source.max_age:
+            logger.warning(f"{source.name}: data from {batch['observed_at']} is older than {source.max_age}; ignoring it")
+            continue
+        rank = (source.priority, batch['observed_at'])
+        for table, entries in batch['locations'].items():
+            result = merged.setdefault(table, {'locations': [], 'authoritative': False, 'next_update': None})
+            # An authoritative source that lists nothing more likely failed to parse than emptied the table
+            result['authoritative'] |= source.authoritative and bool(entries)
+            if table in batch['next_update']:
+                result['next_update'] = batch['next_update'][table]
+            table_winners = winners.setdefault(table, {})
+            for name, column, row, _, _ in entries:
+                current = table_winners.get(name)
+                if current and current[0] >= rank:
+                    if (current[1], current[2]) != (column, row):
+                        logger.debug(f"{table} '{name}': keeping {current[3]} over {source.name}")
+                    continue
+                table_winners[name] = (rank, column, row, source.name)
+
+    for table, table_winners in winners.items():
+        merged[table]['locations'] = [(name, column, row) for name, (_, column, row, _) in table_winners.items()]
+    return merged
+
+
+def ingest(sources: list[LocationSource], columns: dict[str, int], rows: dict[str, int],
+           progress: Callable[[str], None] | None = None) -> dict[str, dict]:
+    """
+    Run the pipeline over every source and return the merged locations per table.
+
+    Sources are fetched and parsed concurrently. A failing source is logged and skipped;
+    if every source that had new data failed, the first error is raised. Sources whose
+    data is unchanged since their validators contribute nothing.
+
+    Args:
+        sources (list[LocationSource]): Sources to ingest.
+        columns (dict[str, int]): Column street name to coordinate.
+        rows (dict[str, int]): Row street name to coordinate.
+        progress (Callable[[str], None], optional): Receives progress messages.
+
+    Returns:
+        dict[str, dict]: As returned by merge().
+
+    Raises:
+        Exception: The first source error, if no source produced data.
+    """
+    report = progress or (lambda message: None)
+
+    def fetch_and_parse(source: LocationSource) -> dict | None:
+        text, observed_at = source.fetch()
+        if text is None:
+            logger.info(f"{source.name}: unchanged since the last fetch")
+            return None
+        report(f"Reading {source.name}...")
+        parsed = source.parse(text)
+        return {'source': source, 'observed_at': parsed.pop('observed_at', observed_at), **parsed}
+
+    report(f"Fetching {len(sources)} location source(s)...")
+    batches, errors = [], []
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FETCHES, len(sources) or 1),
+                            thread_name_prefix='ingest') as executor:
+        futures = [(source, executor.submit(fetch_and_parse, source)) for source in sources]
+        for source, future in futures:
+            try:
+                batch = future.result()
+            except Exception as e:
+                logger.error(f"{source.name}: fetch failed: {e}")
+                errors.append(e)
+                continue
+            if batch:
+                batches.append(batch)
+    if errors and not batches:
+        raise errors[0]
+
+    for batch in batches:
+        source = batch['source']
+        batch['locations'] = {
+            table: validate(normalize(entries, columns, rows), source.name, table)
+            for table, entries in batch['locations'].items()
+            if table in source.tables and table in INGEST_TABLES
+        }
+    return merge(batches)
@@ -0,0 +1,148 @@
+# app/core/login_state.py
+"""
+RBCMap Login State Machine
+
+Tracks the login of one character session through four states:
+
+    logged_out --request + login form shown--> logging_in --page without form--> logged_in
+                                                    |
+                   form shown again / load failed / timeout: retry, then failed
+
+The window feeds it page events (a load finished or failed, the page was
+checked for the login form, the logout URL was opened, the login timed out)
+and performs the action it returns: submit the login form, or reload the game
+page. The form is submitted at most once per page load, so duplicate events
+for the same document can't log in twice.
+
+The time from a login request (a character switch) to the logged-in page is
+logged as "Character switch to '<name>' logged in after X ms", which the log
+analytics report summarizes.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import time
+from typing import Callable
+
+LOGGED_OUT = 'logged_out'
+LOGGING_IN = 'logging_in'
+LOGGED_IN = 'logged_in'
+FAILED = 'failed'
+
+# Actions for the window
+SUBMIT = 'submit'  # Fill in and submit the login form on the current page
+RELOAD = 'reload'  # Load the game page again (it shows the form if the session is gone)
+
+# How long a submitted login may take before it is retried
+LOGIN_TIMEOUT_MS = 15000
+
+# Submissions per login request before giving up
+LOGIN_MAX_ATTEMPTS = 3
+
+
+class LoginStateMachine:
+    """Login state of one character session."""
+
+    def __init__(self, name: str, max_attempts: int = LOGIN_MAX_ATTEMPTS,
+                 clock: Callable[[], float] = time.perf_counter) -> None:
+        self.name = name
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self.state = LOGGED_OUT
+        self.wanted = False  # A login was requested and hasn't succeeded or failed yet
+        self.attempts = 0
+        self.loads = 0  # Page loads seen
+        self.submitted_load = -1  # Load the form was last submitted on
+        self.requested_at: float | None = None
+        self.latencies: list[float] = []  # ms from each request to logged in
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            logging.debug(f"Login state of '{self.name}': {self.state} -> {state}")
+            self.state = state
+
+    def _submit(self) -> str:
+        self.attempts += 1
+        self.submitted_load = self.loads
+        self._set_state(LOGGING_IN)
+        return SUBMIT
+
+    def _retry(self, form_shown: bool) -> str | None:
+        if self.attempts >= self.max_attempts:
+            logging.error(f"Login of '{self.name}' failed after {self.attempts} attempts")
+            self.wanted = False
+            self._set_state(FAILED)
+            return None
+        logging.warning(f"Login of '{self.name}' attempt {self.attempts} did not succeed; retrying")
+        if form_shown:
+            return self._submit()
+        self._set_state(LOGGED_OUT)
+        return RELOAD
+
+    def _logged_in(self) -> None:
+        if self.wanted and self.requested_at is not None:
+            latency = (self.clock() - self.requested_at) * 1000
+            self.latencies.append(latency)
+            logging.info(f"Character switch to '{self.name}' logged in after {latency:.1f} ms")
+        self.wanted = False
+        self.attempts = 0
+        self.requested_at = None
+        self._set_state(LOGGED_IN)
+
+    def request(self, started: float | None = None) -> None:
+        """
+        Ask for this session to be logged in; the next page check acts on it.
+
+        A login left failed or in progress (e.g. its timeout fired while another session was
+        on screen, so it was never retried) starts over.
+
+        Args:
+            started (float, optional): clock() time the switch began, for the latency; defaults to now.
+        """
+        self.requested_at = self.clock() if started is None else started
+        self.wanted = True
+        self.attempts = 0
+        if self.state in (FAILED, LOGGING_IN):
+            self._set_state(LOGGED_OUT)
+
+    def page_loaded(self, ok: bool) -> str | None:
+        """A page load finished; a failed load during a login is retried."""
+        self.loads += 1
+        if not ok and self.state == LOGGING_IN:
+            return self._retry(form_shown=False)
+        return None
+
+    def page_checked(self, form_shown: bool) -> str | None:
+        """
+        The current page was checked for the login form.
+
+        Returns:
+            str | None: SUBMIT, RELOAD or None.
+        """
+        if not form_shown:
+            if self.state != LOGGED_IN or self.wanted:
+                self._logged_in()
+            return None
+
+        if self.state == LOGGED_IN:
+            self._set_state(LOGGED_OUT)  # Session expired or logged out elsewhere
+        if self.state == LOGGING_IN:
+            if self.submitted_load == self.loads:
+                return None  # Same document the form was submitted on; the response is still coming
+            return self._retry(form_shown=True)  # The login came back to the form: rejected
+        if self.state == LOGGED_OUT and self.wanted:
+            return self._submit()
+        return None
+
+    def timed_out(self, attempt: int) -> str | None:
+        """The login timer of an attempt fired; ignored if that attempt already finished."""
+        if self.state == LOGGING_IN and attempt == self.attempts:
+            return self._retry(form_shown=False)
+        return None
+
+    def logged_out(self) -> None:
+        """The user logged out; don't log back in until asked."""
+        self.wanted = False
+        self.attempts = 0
+        self._set_state(LOGGED_OUT)
@@ -0,0 +1,129 @@
+# app/core/move_queue.py
+"""
+RBCMap Move Queue
+
+Every move submits a form on blood.pl and loads a new page. A move sent while
+a page is still loading races that load (and the forms it submits belong to
+the page being replaced), so the queue lets one move through per page load:
+
+    idle --press--> send the move, in flight --load finished--> next queued move, or idle
+
+Keypresses that arrive while a move or any other page load is in progress
+wait in a small queue. A press opposite the last queued one (up then down)
+cancels it, and presses beyond MOVE_QUEUE_SIZE are dropped, so holding a key
+down can't pile up moves that run long after it is released. A load that
+hasn't finished after MOVE_TIMEOUT_MS is given up on, together with the
+moves queued behind it, which were pressed for a position it never reached.
+
+Each move's latency, from its keypress (including time spent queued) to the
+load finished, is logged as "Move N completed in X ms", which the log
+analytics report summarizes.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Callable
+
+# Moves that may wait behind the one in flight
+MOVE_QUEUE_SIZE = 2
+
+# A move or page load that hasn't finished after this long no longer holds up new moves
+MOVE_TIMEOUT_MS = 10000
+
+
+def opposite(move_index: int) -> int:
+    """The move in the opposite direction in the 3x3 grid (its mirror through the center, 4)."""
+    return 8 - move_index
+
+
+class MoveQueue:
+    """Movement keypresses of the window, one move in flight per page load."""
+
+    def __init__(self, max_pending: int = MOVE_QUEUE_SIZE, timeout_ms: float = MOVE_TIMEOUT_MS,
+                 clock: Callable[[], float] = time.perf_counter) -> None:
+        self.max_pending = max_pending
+        self.timeout_ms = timeout_ms
+        self.clock = clock
+        self.pending: deque[tuple[int, float]] = deque()  # (move index, pressed at)
+        self.in_flight: tuple[int, float] | None = None
+        self.loading = False  # A page load (from a move or not) is in progress
+        self.busy_since: float | None = None
+        self.latencies: list[float] = []  # ms from each completed move's keypress to its page load
+
+    def _busy(self) -> bool:
+        if self.in_flight is None and not self.loading:
+            return False
+        if (self.clock() - self.busy_since) * 1000 < self.timeout_ms:
+            return True
+        logging.warning(f"Move or page load pending for over {self.timeout_ms} ms; no longer waiting for it"
+                        + (f", dropping {len(self.pending)} queued moves" if self.pending else ""))
+        self.clear()
+        return False
+
+    def _send(self, move: tuple[int, float]) -> int:
+        self.in_flight = move
+        self.busy_since = self.clock()
+        return move[0]
+
+    def press(self, move_index: int) -> int | None:
+        """
+        A movement key was pressed.
+
+        Returns:
+            int | None: Move to submit now, or None if it was queued, merged or dropped.
+        """
+        move = (move_index, self.clock())
+        if not self._busy():
+            return self._send(move)
+        if self.pending and self.pending[-1][0] == opposite(move_index) != move_index:
+            self.pending.pop()
+            logging.debug(f"Move {move_index} cancelled queued move {opposite(move_index)}")
+        elif len(self.pending) < self.max_pending:
+            self.pending.append(move)
+            logging.debug(f"Move {move_index} queued behind the current page load")
+        else:
+            logging.debug(f"Move {move_index} dropped: {len(self.pending)} moves already queued")
+        return None
+
+    def not_submitted(self) -> None:
+        """The page had no form for the move in flight; queued moves can't be made either."""
+        self.in_flight = None
+        self.pending.clear()
+
+    def load_started(self) -> None:
+        """A page load started."""
+        if not self.loading:
+            self.loading = True
+            self.busy_since = self.clock()
+
+    def load_finished(self, ok: bool) -> int | None:
+        """
+        A page load finished.
+
+        Args:
+            ok (bool): The load succeeded.
+
+        Returns:
+            int | None: Next queued move to submit now, if any.
+        """
+        self.loading = False
+        if self.in_flight is not None:
+            move_index, pressed_at = self.in_flight
+            self.in_flight = None
+            if ok:
+                latency = (self.clock() - pressed_at) * 1000
+                self.latencies.append(latency)
+                logging.info("Move %d completed in %.1f ms", move_index, latency)
+        if not ok:
+            self.pending.clear()
+            return None
+        return self._send(self.pending.popleft()) if self.pending else None
+
+    def clear(self) -> None:
+        """Forget the move in flight and every queued move (e.g. the view switched pages)."""
+        self.in_flight = None
+        self.pending.clear()
+        self.loading = False
@@ -0,0 +1,114 @@
+# app/core/request_filter.py
+"""
+RBCMap Request Filter
+
+A QWebEngineUrlRequestInterceptor for the game's web profiles. Every move
+reloads blood.pl with all of its subresources; the interceptor drops the
+ones that match block rules (ads and tracking by default) and, optionally,
+every image, so each page load fetches less.
+
+Rules are one per line:
+
+    block doubleclick.net        host, or any subdomain of it
+    allow quiz.ravenblack.net/images/map   URL substring (contains '/')
+    # comment
+
+Allow rules win over block rules and over image blocking. Top-level page
+loads are never blocked.
+
+interceptRequest runs on the web engine's IO thread for every request, so
+rules are compiled once into immutable tuples and swapped in as a whole.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+
+from PySide6.QtWebEngineCore import QWebEngineUrlRequestInfo, QWebEngineUrlRequestInterceptor
+
+DEFAULT_REQUEST_RULES = """\
+# Ads and tracking
+block doubleclick.net
+block googlesyndication.com
+block googleadservices.com
+block adservice.google.com
+block google-analytics.com
+block googletagmanager.com
+block amazon-adsystem.com
+block facebook.net
+block scorecardresearch.com
+block quantserve.com
+block adnxs.com
+block criteo.com
+"""
+
+
+class RequestRules:
+    """Compiled allow/block rules."""
+
+    def __init__(self, text: str = DEFAULT_REQUEST_RULES, block_images: bool = False) -> None:
+        """
+        Args:
+            text (str, optional): Rules, one per line (see module docstring).
+            block_images (bool, optional): Also block every image not allowed by a rule.
+        """
+        allow, block = [], []
+        for number, line in enumerate(text.splitlines(), 1):
+            line = line.split('#', 1)[0].strip().lower()
+            if not line:
+                continue
+            action, _, pattern = line.partition(' ')
+            pattern = pattern.strip()
+            if action not in ('allow', 'block') or not pattern:
+                logging.warning(f"Ignoring request rule {number}: {line!r}")
+                continue
+            (allow if action == 'allow' else block).append(pattern)
+        self.text = text
+        self.block_images = block_images
+        self.allow_hosts, self.allow_urls = self._split(allow)
+        self.block_hosts, self.block_urls = self._split(block)
+
+    @staticmethod
+    def _split(patterns: list[str]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """(host suffixes, URL substrings); hosts are stored as '.host' to match on label boundaries."""
+        return (tuple('.' + p.lstrip('.') for p in patterns if '/' not in p),
+                tuple(p for p in patterns if '/' in p))
+
+    @staticmethod
+    def _matches(hosts: tuple[str, ...], urls: tuple[str, ...], host: str, url: str) -> bool:
+        return ('.' + host).endswith(hosts) or any(pattern in url for pattern in urls)
+
+    def should_block(self, host: str, url: str, is_image: bool = False) -> bool:
+        """
+        Whether a request should be blocked.
+
+        Args:
+            host (str): Lower-cased request host.
+            url (str): Lower-cased request URL.
+            is_image (bool, optional): The request is for an image.
+        """
+        if self._matches(self.allow_hosts, self.allow_urls, host, url):
+            return False
+        if is_image and self.block_images:
+            return True
+        return self._matches(self.block_hosts, self.block_urls, host, url)
+
+
+class RequestInterceptor(QWebEngineUrlRequestInterceptor):
+    """Blocks requests matching the current RequestRules while enabled."""
+
+    def __init__(self, rules: RequestRules, enabled: bool = True, parent=None) -> None:
+        super().__init__(parent)
+        self.rules = rules
+        self.enabled = enabled
+        self.blocked = 0  # Requests blocked so far; read by the page load timing
+
+    def interceptRequest(self, info: QWebEngineUrlRequestInfo) -> None:
+        if not self.enabled or info.resourceType() == QWebEngineUrlRequestInfo.ResourceType.ResourceTypeMainFrame:
+            return
+        rules = self.rules  # One read: rules may be replaced from the GUI thread
+        url = info.requestUrl()
+        is_image = info.resourceType() == QWebEngineUrlRequestInfo.ResourceType.ResourceTypeImage
+        if rules.should_block(url.host().lower(), url.toString().lower(), is_image):
+            info.block(True)
+            self.blocked += 1
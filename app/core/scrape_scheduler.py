@@ -0,0 +1,317 @@
+# app/core/scrape_scheduler.py
+"""
+RBCMap Scrape Scheduler
+
+Decides when to scrape A View in the Dark for guild and shop locations.
+The scraper stores the site's own `next_update` time for each row; while
+the stored data is still current nothing is fetched, and a single QTimer
+is armed for the earliest `next_update` plus jitter. Failed scrapes back
+off exponentially. Every scrape that changes stored locations emits
+`data_refreshed` with the change list, so views update only what moved.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+
+from app.config.constants import DB_PATH
+
+# Format AVITDScraper stores next_update in (local time)
+NEXT_UPDATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Random delay added after the due time, so clients don't all hit the site the same second
+SCRAPE_JITTER_S = (5, 60)
+
+# Don't scrape again sooner than this after a success, even if the site gave no next update time
+MIN_SCRAPE_INTERVAL_S = 600
+
+# Wait between checks once the data has been checked after its next update time and was unchanged
+STALE_RECHECK_S = 3600
+
+# Setting holding the time of the last successful scrape (changed or not), in NEXT_UPDATE_FORMAT
+LAST_CHECKED_SETTING = 'avitd_last_checked'
+
+# Retry delay after the first failure; doubles per consecutive failure up to the maximum
+BACKOFF_BASE_S = 60
+BACKOFF_MAX_S = 3600
+
+# Longest single timer interval; the due time is re-checked when it fires
+MAX_TIMER_S = 6 * 3600
+
+
+def read_next_update(db_path: str = DB_PATH) -> datetime | None:
+    """
+    Return the earliest stored next_update over guilds and shops.
+
+    Args:
+        db_path (str, optional): Path to the SQLite database file.
+
+    Returns:
+        datetime | None: The earliest next update, or None if any row has no usable time (data must be fetched).
+    """
+    try:
+        with sqlite3.connect(db_path) as conn:
+            values = [row[0] for row in conn.execute(
+                "SELECT next_update FROM guilds UNION ALL SELECT next_update FROM shops"
+            )]
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read next update times: {e}")
+        return None
+
+    times = []
+    for value in values:
+        try:
+            times.append(datetime.strptime(value, NEXT_UPDATE_FORMAT))
+        except (TypeError, ValueError):
+            return None  # NULL, '' or 'NA': never scraped or the site gave no time
+    return min(times) if times else None
+
+
+def read_last_checked(db_path: str = DB_PATH) -> datetime | None:
+    """
+    Return the time of the last successful scrape.
+
+    Args:
+        db_path (str, optional): Path to the SQLite database file.
+
+    Returns:
+        datetime | None: The last check, or None if none is stored.
+    """
+    try:
+        with sqlite3.connect(db_path) as conn:
+            row = conn.execute(
+                "SELECT setting_value FROM settings WHERE setting_name = ?", (LAST_CHECKED_SETTING,)
+            ).fetchone()
+        return datetime.strptime(row[0], NEXT_UPDATE_FORMAT) if row else None
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        logging.error(f"Failed to read last scrape check time: {e}")
+        return None
+
+
+def save_last_checked(when: datetime, db_path: str = DB_PATH) -> None:
+    """
+    Store the time of a successful scrape.
+
+    Args:
+        when (datetime): Local time the scrape finished.
+        db_path (str, optional): Path to the SQLite database file.
+    """
+    try:
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO settings (setting_name, setting_value) VALUES (?, ?)
+                ON CONFLICT(setting_name) DO UPDATE SET setting_value = excluded.setting_value
+                """,
+                (LAST_CHECKED_SETTING, when.strftime(NEXT_UPDATE_FORMAT))
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logging.error(f"Failed to save last scrape check time: {e}")
+
+
+def due_time(next_update: datetime | None, last_checked: datetime | None) -> datetime | None:
+    """
+    When the data should next be fetched.
+
+    That is the stored next update, unless the data was already checked at or after it
+    (the site hadn't updated yet, e.g. a 304): then it's STALE_RECHECK_S after that check,
+    so stale data isn't re-fetched on every timer and every launch.
+
+    Args:
+        next_update (datetime | None): Earliest stored next update (None if unknown).
+        last_checked (datetime | None): Last successful scrape (None if never).
+
+    Returns:
+        datetime | None: Due time, or None if the data must be fetched now.
+    """
+    if last_checked is not None and (next_update is None or last_checked >= next_update):
+        return last_checked + timedelta(seconds=STALE_RECHECK_S)
+    return next_update
+
+
+def scrape_delay_s(next_update: datetime | None, now: datetime, failures: int = 0,
+                   after_success: bool = False) -> float:
+    """
+    Seconds until the next scrape attempt.
+
+    Args:
+        next_update (datetime | None): When the data is due (from due_time; None means due now).
+        now (datetime): Current local time.
+        failures (int, optional): Consecutive failed scrapes.
+        after_success (bool, optional): A scrape just succeeded.
+
+    Returns:
+        float: Delay in seconds, including jitter.
+    """
+    jitter = random.uniform(*SCRAPE_JITTER_S)
+    if failures:
+        return min(BACKOFF_BASE_S * 2 ** (failures - 1), BACKOFF_MAX_S) + jitter
+    delay = max((next_update - now).total_seconds(), 0.0) if next_update else 0.0
+    if after_success:
+        delay = max(delay, MIN_SCRAPE_INTERVAL_S)
+    return delay + jitter
+
+
+def has_changes(changes: dict | None) -> bool:
+    """True if a scrape's per-table change lists contain anything."""
+    return any(any(table_changes.values()) for table_changes in (changes or {}).values())
+
+
+class ScrapeWorkerSignals(QObject):
+    """
+    Signals emitted by ScrapeWorker; queued to the receivers' (GUI) thread.
+    """
+    progress = Signal(str)
+    finished = Signal(dict)  # changes per table
+    failed = Signal(str)
+
+
+class ScrapeWorker(QRunnable):
+    """
+    Runs one scrape on a thread pool thread.
+
+    The scrape callable creates the scraper, and with it the SQLite connection, on the
+    worker thread and closes it before returning, so no connection crosses threads.
+    Results and errors are delivered only through signals.
+    """
+
+    def __init__(self, scrape: Callable[[Callable[[str], None]], dict]) -> None:
+        """
+        Args:
+            scrape (Callable): Takes a progress callback and returns the per-table change lists; raises on failure.
+        """
+        super().__init__()
+        self.scrape = scrape
+        self.signals = ScrapeWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            changes = self.scrape(self.signals.progress.emit) or {}
+        except Exception as e:
+            logging.error(f"Scrape failed: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(changes)
+
+
+class ScrapeScheduler(QObject):
+    """
+    Schedules guild/shop scrapes from the stored next_update times.
+
+    All scrapes, scheduled or requested, run on a ScrapeWorker; nothing here blocks on the network.
+
+    Signals:
+        scrape_started: A background scrape started.
+        scrape_progress(str): Progress message from the running scrape.
+        data_refreshed(dict): After a scrape that changed stored locations, with
+            {'guilds'|'shops': {'added', 'moved', 'removed'}}; emitted before scrape_finished.
+        scrape_finished(bool): The scrape ended; True on success (including an unchanged page).
+    """
+
+    scrape_started = Signal()
+    scrape_progress = Signal(str)
+    data_refreshed = Signal(dict)
+    scrape_finished = Signal(bool)
+
+    def __init__(self, scrape: Callable[[Callable[[str], None]], dict], db_path: str = DB_PATH,
+                 parent: QObject | None = None) -> None:
+        """
+        Args:
+            scrape (Callable): Takes a progress callback, fetches and stores the data, and returns
+                the per-table change lists; raises on failure. Runs on a worker thread, so it must
+                open its own database connection.
+            db_path (str, optional): Database holding the next_update times.
+            parent (QObject, optional): Parent object.
+        """
+        super().__init__(parent)
+        self.scrape = scrape
+        self.db_path = db_path
+        self.failures = 0
+        self.running = False
+        self._worker = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_timer)
+
+    def start(self) -> None:
+        """Arm the timer from the stored data; fetches nothing at this point."""
+        self.schedule()
+
+    def due(self) -> datetime | None:
+        """When the stored data is next due (None if it must be fetched now)."""
+        return due_time(read_next_update(self.db_path), read_last_checked(self.db_path))
+
+    def is_due(self) -> bool:
+        """True if the stored data is missing or past its due time."""
+        due = self.due()
+        return due is None or due <= datetime.now()
+
+    def schedule(self, after_success: bool = False) -> None:
+        """(Re)arm the single timer for the next attempt."""
+        due = self.due()
+        delay = scrape_delay_s(due, datetime.now(), self.failures, after_success)
+        self.timer.start(int(min(delay, MAX_TIMER_S) * 1000))
+        logging.info(
+            f"Next shop/guild scrape check in {delay:.0f}s "
+            f"(data due {due or 'now'}, failures {self.failures})"
+        )
+
+    def on_timer(self) -> None:
+        """Scrape in the background if due; otherwise just re-arm (long waits are split into MAX_TIMER_S steps)."""
+        if self.failures == 0 and not self.is_due():
+            self.schedule()
+            return
+        self.run_in_background()
+
+    def run_in_background(self) -> None:
+        """Start a scrape on the global thread pool unless one is already running."""
+        if self.running:
+            return
+        self.running = True
+        self._worker = ScrapeWorker(self.scrape)
+        self._worker.signals.progress.connect(self.scrape_progress)
+        self._worker.signals.finished.connect(self.on_scrape_finished)
+        self._worker.signals.failed.connect(self.on_scrape_failed)
+        QThreadPool.globalInstance().start(self._worker)
+        self.scrape_started.emit()
+
+    def request_scrape(self) -> bool:
+        """
+        Scrape in the background now if the data is due (used by the manual update button).
+
+        Returns:
+            bool: True if a scrape is now running; wait for scrape_finished. False if the data is current.
+        """
+        if self.running:
+            return True
+        if not self.is_due():
+            return False
+        self.run_in_background()
+        return True
+
+    def on_scrape_finished(self, changes: dict) -> None:
+        """Record the check, reset backoff, re-arm the timer and publish refreshed data."""
+        self.running = False
+        self._worker = None
+        self.failures = 0
+        save_last_checked(datetime.now(), self.db_path)
+        self.schedule(after_success=True)
+        if has_changes(changes):
+            self.data_refreshed.emit(changes)
+        self.scrape_finished.emit(True)
+
+    def on_scrape_failed(self, message: str) -> None:
+        """Back off and re-arm the timer."""
+        self.running = False
+        self._worker = None
+        self.failures += 1
+        self.schedule()
+        self.scrape_finished.emit(False)
@@ -0,0 +1,64 @@
+# app/core/startup_graph.py
+"""
+RBCMap Startup Graph
+
+Runs independent startup tasks (database reads for the catalog, theme,
+characters and cookies) on worker threads so they overlap with web engine
+boot on the GUI thread. Each GUI-thread stage waits only on the tasks it
+depends on, via result().
+
+Tasks must not touch widgets or other GUI-thread-only Qt objects; they
+return plain data that the GUI thread applies once it needs it.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.utils.startup_timeline import startup_timeline
+
+
+class StartupGraph:
+    """Startup tasks running on a thread pool, awaited by name from the GUI thread."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='startup')
+        self._tasks: dict[str, Future] = {}
+
+    def add(self, name: str, func: Callable[[], Any]) -> Future:
+        """
+        Start a task on a worker thread.
+
+        Args:
+            name (str): Task name; also used as its startup timeline stage.
+            func (Callable): Function to run; must not touch widgets.
+
+        Returns:
+            Future: The task's future.
+        """
+        def run():
+            with startup_timeline.stage(name):
+                return func()
+
+        self._tasks[name] = self._executor.submit(run)
+        return self._tasks[name]
+
+    def result(self, name: str, default: Any = None) -> Any:
+        """
+        Wait for a task on the calling thread and return its result.
+
+        The wait is recorded on the startup timeline as 'wait_<name>' so time the GUI
+        thread spends blocked is visible. A failed task is logged and yields `default`.
+        """
+        with startup_timeline.stage(f'wait_{name}'):
+            try:
+                return self._tasks[name].result()
+            except Exception as e:
+                logging.error(f"Startup task '{name}' failed: {e}")
+                return default
+
+    def shutdown(self) -> None:
+        """Release the worker threads once startup is done."""
+        self._executor.shutdown(wait=False)
@@ -6,76 +6,176 @@
         """Refresh the webview content."""
         self.website_frame.reload()
 
-    def apply_custom_css(self, css: str):
-        cursor = sqlite3.connect(DB_PATH).cursor()
-        cursor.execute("SELECT element, value FROM custom_css WHERE profile_name = ?", (self.current_css_profile,))
-        css_rules = cursor.fetchall()
+    def custom_css(self) -> str:
+        """
+        The active CSS profile's stylesheet.
+
+        Compiled from the database on first use and cached; only update_custom_css
+        (called when the CSS dialog saves) replaces it.
+        """
+        if self.compiled_css is None:
+            self.compiled_css = self.load_current_css(getattr(self, 'current_css_profile', None))
+        return self.compiled_css
+
+    def install_custom_css(self, profile: QWebEngineProfile) -> None:
+        """
+        Install the cached stylesheet on a web profile as a script run at DocumentCreation.
+
+        The style element is in place before the first paint, so pages never show
+        unstyled, and it is moved to the end of <head> once the document is parsed so
+        it still overrides the game's own styles. Replaces any stylesheet installed earlier.
 
-        if not css_rules:
-            logging.warning(f"No CSS rules found for profile '{self.current_css_profile}'")
+        Args:
+            profile (QWebEngineProfile): Profile whose pages get the stylesheet.
+        """
+        scripts = profile.scripts()
+        for script in scripts.find(CUSTOM_CSS_SCRIPT_NAME):
+            scripts.remove(script)
+        css = self.custom_css()
+        if not css:
             return
+        script = QWebEngineScript()
+        script.setName(CUSTOM_CSS_SCRIPT_NAME)
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        script.setRunsOnSubFrames(False)
+        script.setSourceCode(f"""
+            (function() {{
+                var style = document.createElement('style');
+                style.id = '{CUSTOM_CSS_SCRIPT_NAME}';
+                style.textContent = {json.dumps(css)};
+                function attach() {{
+                    (document.head || document.documentElement).appendChild(style);
+                }}
+                if (document.documentElement) {{
+                    attach();
+                }} else {{
+                    new MutationObserver(function(mutations, observer) {{
+                        if (document.documentElement) {{
+                            observer.disconnect();
+                            attach();
+                        }}
+                    }}).observe(document, {{childList: true}});
+                }}
+                document.addEventListener('DOMContentLoaded', attach);
+            }})();
+        """)
+        scripts.insert(script)
+
+    def update_custom_css(self, profile_name: str, css: str | None = None) -> None:
+        """
+        Switch the stylesheet to a CSS profile and reinstall it on every web profile.
 
-        css = ""
-        for element, value in css_rules:
-            css += f"{element} {{{value}}}\n"
+        Takes effect on the next page load.
 
-        script = f"""
-            var style = document.createElement('style');
-            style.type = 'text/css';
-            style.innerHTML = `{css}`;
-            document.head.appendChild(style);
+        Args:
+            profile_name (str): CSS profile to use.
+            css (str, optional): The profile's compiled stylesheet; read from the database if None.
+        """
+        self.current_css_profile = profile_name
+        self.compiled_css = css
+        profiles = [self.web_profile, *getattr(self, 'character_profiles', {}).values()]
+        for profile in profiles:
+            self.install_custom_css(profile)
+        logging.debug(f"Installed CSS profile '{profile_name}' on {len(profiles)} web profile(s)")
+
+    def on_webview_load_started(self) -> None:
+        """Start timing a page load."""
+        self.page_load_started = time.perf_counter()
+        self.page_load_blocked = self.request_interceptor.blocked
+        move = self.move_queue.in_flight
+        page_load_telemetry.navigation_started(move[1] if move else None)  # Traced from the keypress of a move
+        self.move_queue.load_started()
+
+    def log_page_load_time(self) -> None:
         """
-        self.website_frame.page().runJavaScript(script)
+        Log how long the page load took, tagged with whether the request filter was on,
+        so the log analytics report can compare the two.
+        """
+        started = getattr(self, 'page_load_started', None)
+        if started is None:
+            return
+        self.page_load_started = None
+        blocked = self.request_interceptor.blocked - self.page_load_blocked
+        filter_state = 'on' if self.request_interceptor.enabled else 'off'
+        logging.info(f"Page loaded in {(time.perf_counter() - started) * 1000:.1f} ms "
+                     f"(request filter {filter_state}, {blocked} requests blocked)")
 
     def on_webview_load_finished(self, success):
         if not success:
+            page_load_telemetry.cancel()
             logging.error("Failed to load the webpage.")
             QMessageBox.critical(self, "Error", "Failed to load the webpage. Check your network or try again.")
         else:
+            page_load_telemetry.mark('navigation')
             logging.info("Webpage loaded successfully.")
-            self.website_frame.page().toHtml(self.process_html)
-            css = self.load_current_css()
-            self.apply_custom_css(css)
-            if self.login_needed:
-                logging.debug("Logging in last active character.")
-                self.login_selected_character()
-                self.login_needed = False
-
-    def process_html(self, html):
+            self.log_page_load_time()
+            self.webview_loaded = True
+            if startup_timeline.mark_once('first_load_finished'):
+                self.finish_startup_timeline()
+            page_load_telemetry.mark('load_finished')
+            self.website_frame.page().toHtml(lambda html: self.process_html(html, traced=True))
+        self.on_login_load_finished(success)
+        self.on_move_load_finished(success)
+
+    def process_html(self, html, traced: bool = False):
         """
         Process the HTML content of the webview to extract coordinates and coin information.
 
         Args:
             html (str): The HTML content of the page as a string.
+            traced (bool, optional): The HTML belongs to the page load being traced by
+                page_load_telemetry, whose stages are then recorded and the trace finished.
 
         This method calls both the extract_coordinates_from_html and extract_coins_from_html methods.
         """
+        mark = page_load_telemetry.mark if traced else (lambda stage: None)
+        mark('to_html')
+        started = time.perf_counter()
         try:
             # Extract coordinates for the minimap
             x_coord, y_coord = self.extract_coordinates_from_html(html)
+            mark('parse')
             if x_coord is not None and y_coord is not None:
                 # Set character coordinates directly
                 self.character_x, self.character_y = x_coord, y_coord
-                logging.debug(f"Set character coordinates to x={self.character_x}, y={self.character_y}")
+                COORDINATES_LOG.debug("Set character coordinates to x=%s, y=%s", self.character_x, self.character_y)
 
                 # Call recenter_minimap to update the minimap based on character's position
                 self.recenter_minimap()
+                mark('minimap_render')
 
             # Call the method to extract bank coins and pocket changes from the HTML
             self.extract_coins_from_html(html)
-            logging.debug("HTML processed successfully for coordinates and coin count.")
+            mark('db_write')
+            COORDINATES_LOG.debug("HTML processed successfully for coordinates and coin count.")
+            COORDINATES_LOG.info("Page parsed in %.1f ms", (time.perf_counter() - started) * 1000)
         except Exception as e:
             logging.error(f"Unexpected error in process_html: {e}")
+        if traced:
+            page_load_telemetry.finish()
+
+    def init_page_load_telemetry(self) -> None:
+        """Save the session's page load histograms periodically and on quit."""
+        self.page_load_metrics_timer = QTimer(self)
+        self.page_load_metrics_timer.setInterval(PAGE_LOAD_METRICS_SAVE_MS)
+        self.page_load_metrics_timer.timeout.connect(self.save_page_load_metrics)
+        self.page_load_metrics_timer.start()
+        QApplication.instance().aboutToQuit.connect(self.save_page_load_metrics)
+
+    def save_page_load_metrics(self) -> None:
+        page_load_telemetry.save(DB_PATH)
 
     def extract_coordinates_from_html(self, html):
+        from bs4 import BeautifulSoup  # Deferred until the first page is parsed
 
         soup = BeautifulSoup(html, 'html.parser')
-        # logging.debug("Extracting coordinates from HTML...")
+        # COORDINATES_LOG.debug("Extracting coordinates from HTML...")
 
         # Try to extract the intersection label (like "Aardvark and 1st")
         intersect_span = soup.find('span', class_='intersect')
         text = intersect_span.text.strip() if intersect_span else ""
-        # logging.debug(f"Intersection label found: {text}")
+        # COORDINATES_LOG.debug(f"Intersection label found: {text}")
 
         # Check for city limits
         city_limit_cells = soup.find_all('td', class_='cityblock')
@@ -95,11 +195,11 @@
         first_x = int(first_x_input['value']) if first_x_input else None
         first_y = int(first_y_input['value']) if first_y_input else None
 
-        logging.debug(f"First detected coordinate: x={first_x}, y={first_y}")
-        logging.debug(f"Last detected coordinate: x={last_x}, y={last_y}")
+        COORDINATES_LOG.debug("First detected coordinate: x=%s, y=%s", first_x, first_y)
+        COORDINATES_LOG.debug("Last detected coordinate: x=%s, y=%s", last_x, last_y)
 
         if city_limit_cells:
-            logging.debug(f"Found {len(city_limit_cells)} city limit blocks.")
+            COORDINATES_LOG.debug("Found %s city limit blocks.", len(city_limit_cells))
 
             # Check for first available coordinates
             first_x_input = soup.find('input', {'name': 'x'})
@@ -108,48 +208,48 @@
             first_x = int(first_x_input['value']) if first_x_input else None
             first_y = int(first_y_input['value']) if first_y_input else None
 
-            logging.debug(f"First detected coordinate: x={first_x}, y={first_y}")
+            COORDINATES_LOG.debug("First detected coordinate: x=%s, y=%s", first_x, first_y)
 
             if self.zoom_level == 3:
                 if text == "Aardvark and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
+                    COORDINATES_LOG.debug("Top-left corner detected with full border row: Aardvark and 1st")
                     return -1, -1
 
                 if text == "Zestless and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-right corner detected: Zestless and 1st")
+                    COORDINATES_LOG.debug("Top-right corner detected: Zestless and 1st")
                     return 198, -1
 
                 if text == "Aardvark and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
+                    COORDINATES_LOG.debug("Bottom-left corner detected: Aardvark and 100th")
                     return -1, 198
 
                 if text == "Zestless and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-right corner detected: Zestless and 100th")
+                    COORDINATES_LOG.debug("Bottom-right corner detected: Zestless and 100th")
                     return 198, 198
 
                 # Adjust for Aardvark and NCL
                 if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
-                    logging.debug(f"Detected Cell 0,1.")
+                    COORDINATES_LOG.debug("Detected Cell 0,1.")
                     return 0, -1
 
                 # Adjust for WCL and 1st (0,1)
                 if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0:
-                    logging.debug(f"Detected Cell 0,1.")
+                    COORDINATES_LOG.debug("Detected Cell 0,1.")
                     return -1, 0
 
                 # Adjust for ON Zestless and 1st (198,1)
                 if len(city_limit_cells) == 3 and first_x == 198 and first_y == 0:
-                    logging.debug("Detected special case: on Zestless and 1st")
+                    COORDINATES_LOG.debug("Detected special case: on Zestless and 1st")
                     return first_x, first_y
 
                 # Adjust for Northern Edge (Y=0)
                 if len(city_limit_cells) == 3 and first_y == 0:
-                    logging.debug(f"Detected Northern City Limit at y={first_y}")
+                    COORDINATES_LOG.debug("Detected Northern City Limit at y=%s", first_y)
                     return first_x, -1
 
                 # Adjust for Western Edge (X=0)
                 if len(city_limit_cells) == 3 and first_x == 0:
-                    logging.debug(f"Detected Western City Limit at x={first_x}")
+                    COORDINATES_LOG.debug("Detected Western City Limit at x=%s", first_x)
                     return -1, first_y
 
                 # If no adjustments, return detected values
@@ -157,93 +257,93 @@
 
             if self.zoom_level == 5:
                 if text == "Aardvark and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
+                    COORDINATES_LOG.debug("Top-left corner detected with full border row: Aardvark and 1st")
                     return -2, -2
 
                 if text == "Zestless and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-right corner detected: Zestless and 1st")
+                    COORDINATES_LOG.debug("Top-right corner detected: Zestless and 1st")
                     return 197, -2
 
                 if text == "Aardvark and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
+                    COORDINATES_LOG.debug("Bottom-left corner detected: Aardvark and 100th")
                     return -2, 197
 
                 if text == "Zestless and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-right corner detected: Zestless and 100th")
+                    COORDINATES_LOG.debug("Bottom-right corner detected: Zestless and 100th")
                     return 197, 197
 
                 # Adjust for Aardvark and NCL (1,0)
                 if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
-                    logging.debug(f"Detected Cell 1,0.")
+                    COORDINATES_LOG.debug("Detected Cell 1,0.")
                     return -1, -2
 
                 # Adjust for WCL and 1st (0,1)
                 if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0:
-                    logging.debug(f"Detected Cell 0,1.")
+                    COORDINATES_LOG.debug("Detected Cell 0,1.")
                     return -2, -1
 
                 # Adjust for ON Zestless and 1st (198,1)
                 if len(city_limit_cells) == 3 and first_x == 198 and first_y == 0:
-                    logging.debug("Detected special case: on Zestless and 1st")
+                    COORDINATES_LOG.debug("Detected special case: on Zestless and 1st")
                     return first_x - 1, first_y - 1
 
                 # Adjust for Northern Edge (Y=0)
                 if len(city_limit_cells) == 3 and first_y == 0:
-                    logging.debug(f"Detected Northern City Limit at y={first_y}")
+                    COORDINATES_LOG.debug("Detected Northern City Limit at y=%s", first_y)
                     return first_x - 1, -2
 
                 # Adjust for Western Edge (X=0)
                 if len(city_limit_cells) == 3 and first_x == 0:
-                    logging.debug(f"Detected Western City Limit at x={first_x}")
+                    COORDINATES_LOG.debug("Detected Western City Limit at x=%s", first_x)
                     return -2, first_y - 1
 
                 return first_x - 1, first_y - 1
 
             if self.zoom_level == 7:
                 if text == "Aardvark and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-left corner detected with full border row: Aardvark and 1st")
+                    COORDINATES_LOG.debug("Top-left corner detected with full border row: Aardvark and 1st")
                     return -3, -3
 
                 if text == "Zestless and 1st" and len(city_limit_cells) == 5:
-                    logging.debug("Top-right corner detected: Zestless and 1st")
+                    COORDINATES_LOG.debug("Top-right corner detected: Zestless and 1st")
                     return 196, -3
 
                 if text == "Aardvark and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-left corner detected: Aardvark and 100th")
+                    COORDINATES_LOG.debug("Bottom-left corner detected: Aardvark and 100th")
                     return -3, 196
 
                 if text == "Zestless and 100th" and len(city_limit_cells) == 5:
-                    logging.debug("Bottom-right corner detected: Zestless and 100th")
+                    COORDINATES_LOG.debug("Bottom-right corner detected: Zestless and 100th")
                     return 196, 196
 
                 # Adjust for Aardvark and NCL (1,0)
                 if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0 and last_x == 2 and last_y == 1:
-                    logging.debug(f"Detected Cell 1,0.")
+                    COORDINATES_LOG.debug("Detected Cell 1,0.")
                     return -2, -3
 
                 # Adjust for WCL and 1st (0,1)
                 if len(city_limit_cells) == 3 and first_y == 0 and first_x == 0:
-                    logging.debug(f"Detected Cell 0,1.")
+                    COORDINATES_LOG.debug("Detected Cell 0,1.")
                     return -3, -2
 
                 # Adjust for ON Zestless and 1st (198,1)
                 if len(city_limit_cells) == 3 and first_x == 198 and first_y == 0:
-                    logging.debug("Detected special case: on Zestless and 1st")
+                    COORDINATES_LOG.debug("Detected special case: on Zestless and 1st")
                     return first_x - 2, first_y - 2
 
                 # Adjust for Northern Edge (Y=0)
                 if len(city_limit_cells) == 3 and first_y == 0:
-                    logging.debug(f"Detected Northern City Limit at y={first_y}")
+                    COORDINATES_LOG.debug("Detected Northern City Limit at y=%s", first_y)
                     return first_x - 2, -3
 
                 # Adjust for Western Edge (X=0)
                 if len(city_limit_cells) == 3 and first_x == 0:
-                    logging.debug(f"Detected Western City Limit at x={first_x}")
+                    COORDINATES_LOG.debug("Detected Western City Limit at x=%s", first_x)
                     return -3, first_y - 2
 
                 return first_x - 2, first_y - 2
 
-        logging.debug(f"Safe Fallback: x={first_x}, y={first_y}")
+        COORDINATES_LOG.debug("Safe Fallback: x=%s, y=%s", first_x, first_y)
         return first_x, first_y
 
     def extract_coins_from_html(self, html):
@@ -323,6 +423,62 @@
             logging.info(f"Updated coins for character ID {character_id}.")
 
     def switch_css_profile(self, profile_name: str) -> None:
-        self.current_css_profile = profile_name
-        self.apply_custom_css()
+        self.update_custom_css(profile_name)
+        self.website_frame.reload()
         logging.info(f"Switched to profile: {profile_name} and applied CSS")
+
+    # -----------------------
+    # Request Filtering
+    # -----------------------
+
+    def read_request_filter_settings(self) -> tuple[bool, bool, str]:
+        """
+        Read the request filter settings.
+
+        Returns:
+            tuple[bool, bool, str]: (filter enabled, block images, rules text); defaults when unset.
+        """
+        settings = {}
+        try:
+            with sqlite3.connect(DB_PATH) as conn:
+                settings = dict(conn.execute(
+                    "SELECT setting_name, setting_value FROM settings "
+                    "WHERE setting_name IN ('request_filter', 'block_images', 'request_rules')"
+                ).fetchall())
+        except sqlite3.Error as e:
+            logging.error(f"Failed to load request filter settings: {e}")
+        return (settings.get('request_filter', '1') == '1', settings.get('block_images', '0') == '1',
+                settings.get('request_rules') or DEFAULT_REQUEST_RULES)
+
+    def save_request_filter_setting(self, name: str, value: str) -> None:
+        try:
+            with sqlite3.connect(DB_PATH) as conn:
+                conn.execute("""
+                    INSERT INTO settings (setting_name, setting_value)
+                    VALUES (?, ?)
+                    ON CONFLICT(setting_name) DO UPDATE SET setting_value = excluded.setting_value
+                """, (name, value))
+        except sqlite3.Error as e:
+            logging.error(f"Failed to save setting '{name}': {e}")
+
+    def setup_request_filter(self) -> None:
+        """Create the request interceptor shared by every web profile, from the saved settings."""
+        enabled, block_images, rules_text = self.read_request_filter_settings()
+        self.request_interceptor = RequestInterceptor(RequestRules(rules_text, block_images), enabled, self)
+        logging.debug(f"Request filter {'enabled' if enabled else 'disabled'} (block images: {block_images})")
+
+    def configure_profile(self, profile: QWebEngineProfile, cache_name: str) -> None:
+        """
+        Install the request interceptor, the movement helper, the custom stylesheet and a size-capped
+        HTTP disk cache on a web profile.
+
+        Args:
+            profile (QWebEngineProfile): Profile to configure.
+            cache_name (str): Cache subdirectory of HTTP_CACHE_DIR for this profile.
+        """
+        profile.setUrlRequestInterceptor(self.request_interceptor)
+        self.install_move_helper(profile)
+        self.install_custom_css(profile)
+        profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        profile.setCachePath(os.path.join(os.getcwd(), HTTP_CACHE_DIR, cache_name))
+        profile.setHttpCacheMaximumSize(HTTP_CACHE_MAX_BYTES)
@@ -0,0 +1,193 @@
+# app/database/query_console.py
+"""
+RBCMap Query Console
+
+Helpers behind the database viewer's SQL console: a read-only connection,
+chunked query execution with timing and cancellation, the EXPLAIN QUERY
+PLAN tree, and index suggestions for full scans of large tables.
+
+Everything here is plain sqlite3 and meant to run on a worker thread
+that owns its own connection.
+
+See LICENSE for usage restrictions.
+"""
+
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable
+
+# Rows handed to the UI per chunk
+CHUNK_SIZE = 500
+
+# Stop reading results after this many rows
+MAX_RESULT_ROWS = 100_000
+
+# Full scans of tables at least this big get an index suggestion
+LARGE_TABLE_ROWS = 1_000
+
+# The progress handler runs every this many VM instructions (used for cancel and work counting)
+PROGRESS_INTERVAL = 1_000
+
+SCAN_DETAIL = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(.*)$')
+PREDICATE_CLAUSE = re.compile(r'\b(?:WHERE|ON|ORDER\s+BY|GROUP\s+BY)\b', re.IGNORECASE)
+TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN)\s+["`\[]?(\w+)["`\]]?(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+NOT_ALIASES = {'where', 'on', 'join', 'left', 'right', 'inner', 'outer', 'cross', 'natural', 'full',
+               'group', 'order', 'limit', 'union', 'using', 'having', 'window', 'except', 'intersect'}
+
+
+def connect_readonly(db_path: str) -> sqlite3.Connection:
+    """
+    Open db_path so that no statement can modify it.
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened.
+    """
+    conn = sqlite3.connect(Path(os.path.abspath(db_path)).as_uri() + '?mode=ro', uri=True)
+    conn.execute("PRAGMA query_only = ON")  # Also covers ATTACHed databases
+    return conn
+
+
+def execute_query(
+    conn: sqlite3.Connection,
+    sql: str,
+    on_columns: Callable[[list[str]], None],
+    on_rows: Callable[[list[tuple]], None],
+    is_cancelled: Callable[[], bool] = lambda: False,
+    chunk_size: int = CHUNK_SIZE,
+    max_rows: int = MAX_RESULT_ROWS
+) -> dict:
+    """
+    Run one statement and hand its results over in chunks.
+
+    Args:
+        conn (sqlite3.Connection): Connection from connect_readonly.
+        sql (str): A single SQL statement.
+        on_columns (Callable): Called once with the result column names.
+        on_rows (Callable): Called with each chunk of rows.
+        is_cancelled (Callable, optional): Polled while SQLite works; returning True interrupts the query.
+        chunk_size (int, optional): Rows per chunk. Defaults to CHUNK_SIZE.
+        max_rows (int, optional): Stop after this many rows. Defaults to MAX_RESULT_ROWS.
+
+    Returns:
+        dict: elapsed_ms, rows, vm_steps (approximate, to PROGRESS_INTERVAL), truncated, cancelled.
+
+    Raises:
+        sqlite3.Error: If the statement fails (including write attempts).
+    """
+    stats = {'elapsed_ms': 0.0, 'rows': 0, 'vm_steps': 0, 'truncated': False, 'cancelled': False}
+
+    def progress() -> int:
+        stats['vm_steps'] += PROGRESS_INTERVAL
+        return 1 if is_cancelled() else 0
+
+    conn.set_progress_handler(progress, PROGRESS_INTERVAL)
+    start = time.perf_counter()
+    try:
+        cursor = conn.execute(sql)
+        on_columns([description[0] for description in cursor.description or []])
+        while True:
+            rows = cursor.fetchmany(min(chunk_size, max_rows - stats['rows']))
+            if not rows:
+                break
+            stats['rows'] += len(rows)
+            on_rows(rows)
+            if stats['rows'] >= max_rows:
+                stats['truncated'] = cursor.fetchone() is not None
+                break
+    except sqlite3.OperationalError:
+        if not is_cancelled():
+            raise
+        stats['cancelled'] = True
+    finally:
+        stats['elapsed_ms'] = (time.perf_counter() - start) * 1000
+        conn.set_progress_handler(None, 0)
+    return stats
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str) -> list[tuple[int, str]]:
+    """
+    Return the EXPLAIN QUERY PLAN for sql as (depth, detail) rows in display order.
+
+    Raises:
+        sqlite3.Error: If the statement cannot be planned.
+    """
+    depths: dict[int, int] = {}
+    plan = []
+    for node_id, parent, _, detail in conn.execute(f"EXPLAIN QUERY PLAN {sql}"):
+        depths[node_id] = depths[parent] + 1 if parent in depths else 0
+        plan.append((depths[node_id], detail))
+    return plan
+
+
+def table_aliases(sql: str) -> dict[str, str]:
+    """Map each table name and alias in the FROM/JOIN clauses of sql (lowercased) to its table name."""
+    aliases = {}
+    for table, alias in TABLE_REFERENCE.findall(sql):
+        aliases[table.lower()] = table
+        if alias and alias.lower() not in NOT_ALIASES:
+            aliases[alias.lower()] = table
+    return aliases
+
+
+def full_scans(conn: sqlite3.Connection, sql: str, plan: list[tuple[int, str]]) -> dict[str, int]:
+    """
+    Tables the plan reads in full without an index, with their row counts.
+
+    Plans name tables by their alias when the query uses one, so aliases are resolved against sql.
+
+    Returns:
+        dict[str, int]: Table name to row count.
+    """
+    tables = {name.lower(): name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    aliases = table_aliases(sql)
+    scans = {}
+    for _, detail in plan:
+        match = SCAN_DETAIL.match(detail)
+        if not match or 'INDEX' in match.group(2):
+            continue
+        name = aliases.get(match.group(1).lower(), match.group(1)).lower()
+        if name in tables and tables[name] not in scans:
+            scans[tables[name]] = conn.execute(f'SELECT COUNT(*) FROM "{tables[name]}"').fetchone()[0]
+    return scans
+
+
+def suggest_indexes(conn: sqlite3.Connection, sql: str, plan: list[tuple[int, str]],
+                    min_rows: int = LARGE_TABLE_ROWS) -> list[str]:
+    """
+    Suggest CREATE INDEX statements for large tables the plan scans in full.
+
+    A table only gets a suggestion if some of its columns appear in a WHERE,
+    ON, ORDER BY or GROUP BY clause, either unqualified or qualified by the
+    table or its alias; they are indexed in order of appearance. This is a
+    heuristic: check the plan again after creating the index.
+
+    Returns:
+        list[str]: Suggested statements, each with a trailing comment giving the table size.
+    """
+    clause = PREDICATE_CLAUSE.search(sql)
+    if not clause:
+        return []
+    predicates = sql[clause.start():]
+    aliases = table_aliases(sql)
+
+    suggestions = []
+    for table, row_count in full_scans(conn, sql, plan).items():
+        if row_count < min_rows:
+            continue
+        names = {name for name, target in aliases.items() if target.lower() == table.lower()}
+        positions = {}
+        for _, column, *_ in conn.execute(f'PRAGMA table_info("{table}")'):
+            for match in re.finditer(rf'(?<![\w.])(?:(\w+)\.)?{re.escape(column)}\b', predicates, re.IGNORECASE):
+                if match.group(1) is None or match.group(1).lower() in names:
+                    positions[column] = match.start()
+                    break
+        columns = sorted(positions, key=positions.get)
+        if columns:
+            suggestions.append(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(columns)} "
+                f"ON {table}({', '.join(columns)});  -- full scan of {row_count:,} rows"
+            )
+    return suggestions
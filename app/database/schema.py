@@ -4,8 +4,18 @@ import sqlite3
 from typing import Tuple
 from PySide6.QtGui import QColor
 
-from app.config.constants import DB_PATH, DEFAULT_LOG_LEVEL
-from app.config.constants import ensure_directories_exist
+from app.config.constants import DB_PATH, DEFAULT_LOG_LEVEL, SNAPSHOT_PATH
+from app.database.snapshot import read_snapshot, write_snapshot
+from app.database.spatial import rebuild_spatial_index
+
+# Stored in PRAGMA user_version; bump whenever the schema or a migration changes.
+SCHEMA_VERSION = 2
+
+# Tables read by fetch_catalog. Any write to them bumps the data generation counter.
+CATALOG_TABLES = [
+    'columns', 'rows', 'banks', 'taverns', 'transits', 'userbuildings',
+    'color_mappings', 'shops', 'guilds', 'placesofinterest'
+]
 
 # -----------------------
 # SQLite Setup
@@ -127,6 +137,25 @@ def create_tables(conn: sqlite3.Connection) -> None:
             Row TEXT NOT NULL,
             next_update TIMESTAMP DEFAULT NULL
         )""",
+        """CREATE TABLE IF NOT EXISTS startup_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            label TEXT DEFAULT NULL,
+            stage TEXT NOT NULL,
+            start_ms REAL NOT NULL,
+            duration_ms REAL NOT NULL,
+            item_count INTEGER DEFAULT NULL,
+            recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )""",
+        """CREATE TABLE IF NOT EXISTS page_load_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (session_id, stage, bucket)
+        )""",
         """CREATE TABLE IF NOT EXISTS taverns (
             ID INTEGER PRIMARY KEY,
             Column TEXT NOT NULL,
@@ -162,7 +191,8 @@ def insert_initial_data(conn: sqlite3.Connection) -> None:
         ("INSERT OR IGNORE INTO settings (setting_name, setting_value) VALUES (?, ?)", [
             ('keybind_config', 1),
             ('css_profile', 'Default'),
-            ('log_level', str(DEFAULT_LOG_LEVEL))
+            ('log_level', str(DEFAULT_LOG_LEVEL)),
+            ('data_generation', 0)
         ]),
 
         ("INSERT OR IGNORE INTO banks (ID, Column, Row, Name) VALUES (?, ?, ?, ?)", [
@@ -1251,6 +1281,58 @@ def insert_initial_data(conn: sqlite3.Connection) -> None:
             raise
     conn.commit()
 
+def migrate_database(conn: sqlite3.Connection) -> None:
+    """
+    Upgrade a database created by an older version to SCHEMA_VERSION.
+
+    Runs after create_tables, so every table exists; each step is safe to repeat.
+
+    - 2: cookies get a unique (name, domain, path) key, keeping the newest row of
+      each duplicate (domains without the leading dot, missing paths as '/');
+      startup_metrics gets an item_count column.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < 2:
+        before = conn.execute("SELECT COUNT(*) FROM cookies").fetchone()[0]
+        conn.execute("UPDATE cookies SET domain = ltrim(domain, '.'), path = COALESCE(path, '/')")
+        conn.execute("""
+            DELETE FROM cookies WHERE id NOT IN (
+                SELECT MAX(id) FROM cookies GROUP BY name, domain, path
+            )
+        """)
+        after = conn.execute("SELECT COUNT(*) FROM cookies").fetchone()[0]
+        logging.info(f"Cookie jar compacted: {before} rows -> {after}")
+
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(startup_metrics)")]
+        if 'item_count' not in columns:
+            conn.execute("ALTER TABLE startup_metrics ADD COLUMN item_count INTEGER DEFAULT NULL")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_cookies_name_domain_path ON cookies(name, domain, path)")
+    conn.commit()
+
+def create_generation_triggers(conn: sqlite3.Connection) -> None:
+    """
+    Create triggers that bump the 'data_generation' setting whenever catalog data changes.
+
+    The counter lets the catalog snapshot detect stale data without comparing table contents.
+    """
+    bump = "UPDATE settings SET setting_value = setting_value + 1 WHERE setting_name = 'data_generation';"
+    cursor = conn.cursor()
+    for table in CATALOG_TABLES:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS bump_generation_{table}_{event.lower()}
+                AFTER {event} ON `{table}`
+                BEGIN {bump} END
+            """)
+    for event in ('INSERT', 'UPDATE'):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS bump_generation_settings_{event.lower()}
+            AFTER {event} ON settings
+            WHEN NEW.setting_name IN ('keybind_config', 'css_profile')
+            BEGIN {bump} END
+        """)
+    conn.commit()
+
 def initialize_database(db_path: str = DB_PATH) -> bool:
     """
     Initialize the SQLite database with the required schema and data.
@@ -1265,26 +1347,24 @@ def initialize_database(db_path: str = DB_PATH) -> bool:
         with sqlite3.connect(db_path) as conn:
             conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key support
             create_tables(conn)
+            migrate_database(conn)
             insert_initial_data(conn)
+            create_generation_triggers(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            rebuild_spatial_index(conn)
             logging.info(f"Database initialized successfully at {db_path}")
             return True
     except sqlite3.Error as e:
         logging.error(f"Failed to initialize database at {db_path}: {e}")
         return False
 
-# Call database initialization
-if not ensure_directories_exist():  # Ensure directories exist first
-    logging.error("Required directories could not be created. Aborting database initialization.")
-elif not initialize_database(DB_PATH):
-    logging.warning("Database initialization failed. Application may encounter issues.")
-
 # -----------------------
 # Load Data from Database
 # -----------------------
 
-def load_data(DB_PATH):
+def fetch_catalog(DB_PATH):
     """
-    Load map-related data from the SQLite database efficiently.
+    Fetch map-related data from the SQLite database efficiently.
 
     Retrieves and processes data for columns, rows, banks, taverns, transits, user buildings,
     color mappings, shops, guilds, places of interest, keybind configuration, and current CSS profile.
@@ -1300,7 +1380,7 @@ def load_data(DB_PATH):
             - taverns_coordinates (dict[str, tuple[int, int]]): Tavern names to coordinates.
             - transits_coordinates (dict[str, tuple[int, int]]): Transit names to coordinates.
             - user_buildings_coordinates (dict[str, tuple[int, int]]): User building names to coordinates.
-            - color_mappings (dict[str, QColor]): Element types to QColor values.
+            - color_mappings (dict[str, str]): Element types to color strings.
             - shops_coordinates (dict[str, tuple[int, int]]): Shop names to coordinates.
             - guilds_coordinates (dict[str, tuple[int, int]]): Guild names to coordinates.
             - places_of_interest_coordinates (dict[str, tuple[int, int]]): POI names to coordinates.
@@ -1342,16 +1422,7 @@ def load_data(DB_PATH):
             user_buildings_coordinates = {name: to_coords(col, row) for name, col, row in cursor.fetchall()}
 
             cursor.execute("SELECT Type, Color FROM color_mappings")
-            color_mappings = {}
-            for type_, color in cursor.fetchall():
-                try:
-                    qcolor = QColor(color)
-                    if not qcolor.isValid():
-                        logging.warning(f"Invalid color for type '{type_}': '{color}'")
-                    color_mappings[type_] = qcolor
-                except Exception as e:
-                    logging.error(f"Failed to load QColor for '{type_}' = '{color}': {e}")
-                    color_mappings[type_] = QColor('#000000')  # Fallback
+            color_mappings = dict(cursor.fetchall())
 
             cursor.execute("SELECT Name, `Column`, `Row` FROM shops")
             shops_coordinates = {}
@@ -1389,18 +1460,80 @@ def load_data(DB_PATH):
         logging.error(f"Failed to load data from database {DB_PATH}: {e}")
         raise
 
-# Load data at startup
-try:
-    (
-        columns, rows, banks_coordinates, taverns_coordinates, transits_coordinates,
-        user_buildings_coordinates, color_mappings, shops_coordinates, guilds_coordinates,
-        places_of_interest_coordinates, keybind_config, current_css_profile
-    ) = load_data(DB_PATH)
-except sqlite3.Error:
-    logging.critical("Database load failed. Using fallback empty data.")
-    columns = rows = taverns_coordinates = transits_coordinates = user_buildings_coordinates = \
-        shops_coordinates = guilds_coordinates = places_of_interest_coordinates = {}
-    banks_coordinates = {}
-    color_mappings = {'default': QColor('#000000')}  # Minimal fallback
-    keybind_config = 1
-    current_css_profile = "Default"
\ No newline at end of file
+def build_color_mappings(colors: dict[str, str]) -> dict[str, QColor]:
+    """
+    Convert stored color strings to QColor objects, falling back to black on failure.
+
+    Args:
+        colors (dict[str, str]): Element types to color strings.
+
+    Returns:
+        dict[str, QColor]: Element types to QColor values.
+    """
+    color_mappings = {}
+    for type_, color in colors.items():
+        try:
+            qcolor = QColor(color)
+            if not qcolor.isValid():
+                logging.warning(f"Invalid color for type '{type_}': '{color}'")
+            color_mappings[type_] = qcolor
+        except Exception as e:
+            logging.error(f"Failed to load QColor for '{type_}' = '{color}': {e}")
+            color_mappings[type_] = QColor('#000000')  # Fallback
+    return color_mappings
+
+def catalog_key(db_path: str = DB_PATH) -> tuple[int, int]:
+    """
+    Build the snapshot key for the database: (schema version, data generation).
+
+    Returns:
+        tuple[int, int]: Key identifying the current catalog contents.
+
+    Raises:
+        sqlite3.Error: If the database cannot be read.
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        row = cursor.execute("SELECT setting_value FROM settings WHERE setting_name = 'data_generation'").fetchone()
+        return schema_version, int(row[0]) if row else 0
+
+# Catalog loaded by this process, so fetch_catalog runs at most once per launch
+_catalog = None
+
+def load_catalog(db_path: str = DB_PATH, snapshot_path: str = SNAPSHOT_PATH):
+    """
+    Load the map catalog once per process, using the binary snapshot on warm starts.
+
+    On a snapshot hit the catalog is restored with a single file read. On a miss it is
+    fetched from the database and the snapshot is rewritten for the next launch.
+
+    Args:
+        db_path (str, optional): Path to the SQLite database file. Defaults to DB_PATH.
+        snapshot_path (str, optional): Path to the snapshot file. Defaults to SNAPSHOT_PATH.
+
+    Returns:
+        tuple: Same layout as fetch_catalog, with color mappings as QColor values.
+
+    Raises:
+        sqlite3.Error: If the catalog must be fetched and database access fails.
+    """
+    global _catalog
+    if _catalog is not None:
+        return _catalog
+
+    key = catalog_key(db_path)
+    catalog = read_snapshot(snapshot_path, key)
+    if catalog is not None:
+        logging.debug(f"Catalog restored from snapshot {snapshot_path}")
+    else:
+        catalog = fetch_catalog(db_path)
+        write_snapshot(snapshot_path, key, catalog)
+
+    _catalog = catalog[:6] + (build_color_mappings(catalog[6]),) + catalog[7:]
+    return _catalog
+
+def invalidate_catalog() -> None:
+    """Drop the in-process catalog so the next load_catalog call re-reads it."""
+    global _catalog
+    _catalog = None
@@ -0,0 +1,88 @@
+# app/database/snapshot.py
+"""
+RBCMap Catalog Snapshot
+
+Serializes the processed map catalog returned by fetch_catalog into a compact
+binary file so a warm start can restore it with a single read instead of
+re-running every catalog query.
+
+The snapshot is stored with the key it was built for. A snapshot whose key
+doesn't match the live database (schema version or data generation counter)
+is treated as a miss and rebuilt by the caller.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import marshal
+import os
+
+# -----------------------
+# Snapshot Format
+# -----------------------
+
+# File header; bump the trailing digit when the payload layout changes.
+SNAPSHOT_MAGIC = b'RBCSNAP1'
+
+
+def read_snapshot(path: str, key: tuple) -> tuple | None:
+    """
+    Load a catalog snapshot if it exists and was built for the given key.
+
+    Args:
+        path (str): Snapshot file path.
+        key (tuple): Expected snapshot key (see schema.catalog_key).
+
+    Returns:
+        tuple | None: The stored catalog, or None on a missing, stale or unreadable snapshot.
+    """
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+    except FileNotFoundError:
+        logging.debug(f"No catalog snapshot at {path}")
+        return None
+    except OSError as e:
+        logging.warning(f"Failed to read catalog snapshot {path}: {e}")
+        return None
+
+    if not blob.startswith(SNAPSHOT_MAGIC):
+        logging.warning(f"Ignoring catalog snapshot with unknown header: {path}")
+        return None
+
+    try:
+        stored_key, catalog = marshal.loads(blob[len(SNAPSHOT_MAGIC):])
+    except (EOFError, ValueError, TypeError) as e:
+        logging.warning(f"Ignoring corrupt catalog snapshot {path}: {e}")
+        return None
+
+    if stored_key != key:
+        logging.debug(f"Catalog snapshot is stale: stored {stored_key}, expected {key}")
+        return None
+    return catalog
+
+
+def write_snapshot(path: str, key: tuple, catalog: tuple) -> bool:
+    """
+    Atomically write a catalog snapshot.
+
+    The catalog must only contain marshal-able values (dicts, tuples, str, int).
+
+    Args:
+        path (str): Snapshot file path.
+        key (tuple): Key the catalog was built for.
+        catalog (tuple): Catalog to store.
+
+    Returns:
+        bool: True if the snapshot was written, False otherwise.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC + marshal.dumps((key, catalog)))
+        os.replace(tmp_path, path)
+        logging.debug(f"Catalog snapshot written to {path}")
+        return True
+    except (OSError, ValueError) as e:
+        logging.warning(f"Failed to write catalog snapshot {path}: {e}")
+        return False
@@ -0,0 +1,182 @@
+# app/database/spatial.py
+"""
+RBCMap Spatial Index
+
+Mirrors every known location into an SQLite R*Tree virtual table so that
+viewport ("everything in this 7x7 view") and proximity ("all shops within
+20 AP") lookups run inside SQLite instead of scanning the in-memory
+coordinate dictionaries.
+
+Coordinates use the same +1 offset as fetch_catalog, so results can be drawn
+on the minimap without further adjustment.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import sqlite3
+from typing import Iterable
+
+# -----------------------
+# Index Definition
+# -----------------------
+
+SPATIAL_INDEX_TABLE = 'location_index'
+
+# Location kind -> source table. Kinds match the color_mappings keys used by the minimap.
+LOCATION_TABLES = {
+    'bank': 'banks',
+    'tavern': 'taverns',
+    'transit': 'transits',
+    'user_building': 'userbuildings',
+    'shop': 'shops',
+    'guild': 'guilds',
+    'placesofinterest': 'placesofinterest',
+}
+
+
+def create_spatial_index(conn: sqlite3.Connection) -> None:
+    """
+    Create the R*Tree virtual table if it doesn't exist.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+    """
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {SPATIAL_INDEX_TABLE} USING rtree(
+            id, min_x, max_x, min_y, max_y, +kind TEXT, +name TEXT
+        )
+    """)
+
+
+def rebuild_spatial_index(conn: sqlite3.Connection) -> int:
+    """
+    Repopulate the R*Tree from the location tables in a single transaction.
+
+    Street names are resolved to integer coordinates through the `columns` and `rows`
+    tables. Rows whose street names don't resolve (e.g. shops or guilds at 'NA')
+    are left out of the index.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+
+    Returns:
+        int: Number of locations indexed.
+
+    Raises:
+        sqlite3.Error: If the index cannot be rebuilt (logged and re-raised).
+    """
+    entries = []
+    try:
+        cursor = conn.cursor()
+        for kind, table in LOCATION_TABLES.items():
+            cursor.execute(f"""
+                SELECT t.Name, c.Coordinate + 1, r.Coordinate + 1
+                FROM `{table}` t
+                JOIN `columns` c ON c.Name = t.`Column`
+                JOIN `rows` r ON r.Name = t.`Row`
+            """)
+            entries.extend((kind, name, x, y) for name, x, y in cursor.fetchall())
+
+        create_spatial_index(conn)
+        with conn:
+            conn.execute(f"DELETE FROM {SPATIAL_INDEX_TABLE}")
+            conn.executemany(
+                f"INSERT INTO {SPATIAL_INDEX_TABLE} (id, min_x, max_x, min_y, max_y, kind, name) "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(i, x, x, y, y, kind, name) for i, (kind, name, x, y) in enumerate(entries, start=1)]
+            )
+        logging.debug(f"Spatial index rebuilt with {len(entries)} locations")
+        return len(entries)
+    except sqlite3.Error as e:
+        logging.error(f"Failed to rebuild spatial index: {e}")
+        raise
+
+# -----------------------
+# Query API
+# -----------------------
+
+def _kind_filter(kinds: Iterable[str] | None) -> tuple[str, list[str]]:
+    """Build an optional `kind IN (...)` clause and its parameters."""
+    if not kinds:
+        return "", []
+    kinds = list(kinds)
+    return f" AND kind IN ({', '.join('?' * len(kinds))})", kinds
+
+
+def query_viewport(conn: sqlite3.Connection, min_x: int, min_y: int, max_x: int, max_y: int,
+                   kinds: Iterable[str] | None = None) -> list[tuple[str, str, int, int]]:
+    """
+    Return every location inside an inclusive rectangle.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        min_x (int): Left edge of the rectangle.
+        min_y (int): Top edge of the rectangle.
+        max_x (int): Right edge of the rectangle.
+        max_y (int): Bottom edge of the rectangle.
+        kinds (Iterable[str], optional): Restrict results to these location kinds.
+
+    Returns:
+        list[tuple[str, str, int, int]]: (kind, name, x, y) for each location found.
+    """
+    clause, params = _kind_filter(kinds)
+    cursor = conn.execute(
+        f"SELECT kind, name, CAST(min_x AS INTEGER), CAST(min_y AS INTEGER) FROM {SPATIAL_INDEX_TABLE} "
+        f"WHERE min_x >= ? AND max_x <= ? AND min_y >= ? AND max_y <= ?{clause}",
+        (min_x, max_x, min_y, max_y, *params)
+    )
+    return cursor.fetchall()
+
+
+def query_within_ap(conn: sqlite3.Connection, x: int, y: int, ap: int,
+                    kinds: Iterable[str] | None = None) -> list[tuple[int, str, str, int, int]]:
+    """
+    Return every location reachable within the given AP budget, nearest first.
+
+    Movement is diagonal, so the AP cost is the Chebyshev distance and the
+    search area is exactly the square of side 2 * ap + 1 around (x, y).
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        x (int): Current X coordinate.
+        y (int): Current Y coordinate.
+        ap (int): Maximum AP cost.
+        kinds (Iterable[str], optional): Restrict results to these location kinds.
+
+    Returns:
+        list[tuple[int, str, str, int, int]]: (ap_cost, kind, name, x, y) sorted by AP cost.
+    """
+    results = [
+        (max(abs(lx - x), abs(ly - y)), kind, name, lx, ly)
+        for kind, name, lx, ly in query_viewport(conn, x - ap, y - ap, x + ap, y + ap, kinds)
+    ]
+    results.sort()
+    return results
+
+
+def find_nearest(conn: sqlite3.Connection, x: int, y: int, kind: str,
+                 max_ap: int = 200) -> tuple[int, str, int, int] | None:
+    """
+    Find the nearest location of a kind by growing the search square until something is hit.
+
+    Args:
+        conn (sqlite3.Connection): Open database connection.
+        x (int): Current X coordinate.
+        y (int): Current Y coordinate.
+        kind (str): Location kind (see LOCATION_TABLES).
+        max_ap (int, optional): Give up beyond this AP cost. Defaults to 200.
+
+    Returns:
+        tuple[int, str, int, int] | None: (ap_cost, name, x, y), or None if nothing is in range.
+    """
+    radius = 8
+    while True:
+        radius = min(radius, max_ap)
+        hits = query_within_ap(conn, x, y, radius, (kind,))
+        if hits:
+            ap_cost, _, name, lx, ly = hits[0]
+            return ap_cost, name, lx, ly
+        if radius >= max_ap:
+            return None
+        radius *= 2
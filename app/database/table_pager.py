@@ -0,0 +1,149 @@
+# app/database/table_pager.py
+"""
+RBCMap Table Pager
+
+Keyset pagination over a single SQLite table for the database viewer.
+Rows are fetched a page at a time in (sort column, rowid) order, with
+sorting and text filtering done by SQLite, so opening a table costs one
+page no matter how many rows it holds.
+
+Tables without a rowid fall back to LIMIT/OFFSET paging.
+
+See LICENSE for usage restrictions.
+"""
+
+import sqlite3
+
+# Rows fetched per page
+PAGE_SIZE = 200
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name for use in SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class TablePager:
+    """Fetches pages of one table in a stable order, resuming after the last row seen."""
+
+    def __init__(self, connection: sqlite3.Connection, table_name: str, page_size: int = PAGE_SIZE) -> None:
+        """
+        Args:
+            connection (sqlite3.Connection): Open database connection.
+            table_name (str): Table to page through.
+            page_size (int, optional): Rows per page. Defaults to PAGE_SIZE.
+
+        Raises:
+            sqlite3.Error: If the table cannot be read.
+        """
+        self.connection = connection
+        self.table = quote_identifier(table_name)
+        self.page_size = page_size
+
+        cursor = connection.execute(f"SELECT * FROM {self.table} LIMIT 0")
+        self.columns = [description[0] for description in cursor.description]
+        try:
+            connection.execute(f"SELECT rowid FROM {self.table} LIMIT 0")
+            self.has_rowid = True
+        except sqlite3.OperationalError:
+            self.has_rowid = False  # WITHOUT ROWID table
+
+        self.sort_column: int | None = None
+        self.descending = False
+        self.filter_text = ''
+        self.reset()
+
+    def reset(self) -> None:
+        """Start again from the first page."""
+        self.exhausted = False
+        self._last_key: tuple | None = None
+        self._offset = 0
+
+    def set_sort(self, column: int | None, descending: bool = False) -> None:
+        """
+        Order rows by a column index, or by rowid when column is None or negative.
+        """
+        self.sort_column = column if column is not None and 0 <= column < len(self.columns) else None
+        self.descending = descending
+        self.reset()
+
+    def set_filter(self, text: str) -> None:
+        """Only return rows where any column contains text (case-insensitive for ASCII)."""
+        self.filter_text = text
+        self.reset()
+
+    def _filter_clause(self) -> tuple[str, list]:
+        if not self.filter_text:
+            return '', []
+        pattern = '%' + self.filter_text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        terms = [f"CAST({quote_identifier(column)} AS TEXT) LIKE ? ESCAPE '\\'" for column in self.columns]
+        return '(' + ' OR '.join(terms) + ')', [pattern] * len(terms)
+
+    def _keyset_clause(self) -> tuple[str, list]:
+        """WHERE condition selecting rows strictly after the last one returned."""
+        if self._last_key is None:
+            return '', []
+        value, rowid = self._last_key
+        after = '<' if self.descending else '>'
+        if self.sort_column is None:
+            return f"rowid {after} ?", [rowid]
+
+        column = quote_identifier(self.columns[self.sort_column])
+        # SQLite sorts NULLs first ascending and last descending
+        if value is None:
+            if self.descending:
+                return f"({column} IS NULL AND rowid < ?)", [rowid]
+            return f"({column} IS NOT NULL OR rowid > ?)", [rowid]
+        clause = f"({column} {after} ? OR ({column} = ? AND rowid {after} ?)"
+        if self.descending:
+            clause += f" OR {column} IS NULL"
+        return clause + ")", [value, value, rowid]
+
+    def fetch_page(self) -> list[tuple]:
+        """
+        Fetch the next page of rows.
+
+        Returns:
+            list[tuple]: Up to page_size rows of the table's columns; empty once exhausted.
+
+        Raises:
+            sqlite3.Error: If the query fails.
+        """
+        if self.exhausted:
+            return []
+
+        direction = 'DESC' if self.descending else 'ASC'
+        order = [f"rowid {direction}"] if self.has_rowid else []
+        if self.sort_column is not None:
+            order.insert(0, f"{quote_identifier(self.columns[self.sort_column])} {direction}")
+
+        conditions, params = [], []
+        for clause, clause_params in (self._filter_clause(), self._keyset_clause() if self.has_rowid else ('', [])):
+            if clause:
+                conditions.append(clause)
+                params.extend(clause_params)
+
+        select = ', '.join(quote_identifier(column) for column in self.columns)
+        sql = f"SELECT {select}{', rowid' if self.has_rowid else ''} FROM {self.table}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if order:
+            sql += " ORDER BY " + ", ".join(order)
+        sql += " LIMIT ?"
+        params.append(self.page_size)
+        if not self.has_rowid:
+            sql += " OFFSET ?"
+            params.append(self._offset)
+
+        rows = self.connection.execute(sql, params).fetchall()
+        if len(rows) < self.page_size:
+            self.exhausted = True
+        if not rows:
+            return []
+
+        if not self.has_rowid:
+            self._offset += len(rows)
+            return rows
+        last = rows[-1]
+        self._last_key = (last[self.sort_column] if self.sort_column is not None else None, last[-1])
+        return [row[:-1] for row in rows]
@@ -103,11 +103,8 @@ class CSSCustomizationDialog(QDialog):
         self.update_current_profile(profile)
         # Reload customizations for the new profile in the UI
         self.load_existing_customizations()
-        # Generate and apply the new profile's CSS to the webview
-        css = self.generate_custom_css()
-        if css and self.parent:
-            self.parent.apply_custom_css(css)
-            self.parent.website_frame.reload()
+        # Install the new profile's CSS in the webview
+        self.apply_to_parent()
         logging.info(f"Switched to profile: {profile} and applied CSS")
 
     def load_profiles(self) -> None:
@@ -273,12 +270,14 @@ class CSSCustomizationDialog(QDialog):
             logging.error(f"Failed to load CSS customizations: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load customizations: {e}")
 
-    def save_and_apply_changes(self) -> None:
-        css = self.generate_custom_css()
-        if css and self.parent:
-            self.parent.current_css_profile = self.current_profile
-            self.parent.apply_custom_css(css)
+    def apply_to_parent(self) -> None:
+        """Hand the current profile's compiled CSS to the main window and reload the page with it."""
+        if self.parent:
+            self.parent.update_custom_css(self.current_profile, self.generate_custom_css())
             self.parent.website_frame.reload()
+
+    def save_and_apply_changes(self) -> None:
+        self.apply_to_parent()
         self.accept()
         logging.info("CSS changes saved and applied")
 
@@ -311,9 +310,7 @@ class CSSCustomizationDialog(QDialog):
                     )
                     conn.commit()
                 self.load_existing_customizations()
-                self.parent.apply_custom_css(css)
-                if self.parent:
-                    self.parent.website_frame.reload()
+                self.apply_to_parent()
                 logging.info(f"Uploaded CSS file: {file_path} to profile '{self.current_profile}'")
             except (IOError, sqlite3.Error) as e:
                 logging.error(f"Failed to upload CSS file: {e}")
@@ -343,9 +340,7 @@ class CSSCustomizationDialog(QDialog):
                 cursor.execute("DELETE FROM custom_css WHERE profile_name = ?", (self.current_profile,))
                 conn.commit()
             self.load_existing_customizations()
-            self.parent.apply_custom_css("")
-            if self.parent:
-                self.parent.website_frame.reload()
+            self.apply_to_parent()
             logging.info(f"Cleared all CSS customizations for profile '{self.current_profile}'")
         except sqlite3.Error as e:
             logging.error(f"Failed to clear CSS customizations: {e}")
@@ -1,3 +1,146 @@
+class QueryResultModel(QAbstractTableModel):
+    """
+    Read-only table model over rows that arrive in chunks.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.columns: list[str] = []
+        self.rows: list[tuple] = []
+
+    def set_columns(self, columns: list[str]) -> None:
+        """Clear the model and start a new result set."""
+        self.beginResetModel()
+        self.columns = columns
+        self.rows = []
+        self.endResetModel()
+
+    def append_rows(self, rows: list[tuple]) -> None:
+        """Append a chunk of rows."""
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+            self.rows.extend(rows)
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self.rows[index.row()][index.column()]
+        return "" if value is None else str(value)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section]
+        return section + 1
+
+
+class SQLiteTableModel(QueryResultModel):
+    """
+    Read-only table model that pages rows in from SQLite as the view scrolls.
+
+    Sorting and filtering are pushed down into SQL through TablePager.
+    """
+
+    def __init__(self, db_connection, table_name: str, parent=None) -> None:
+        """
+        Args:
+            db_connection: Active SQLite database connection.
+            table_name: Table to display.
+            parent: Parent object (default is None).
+
+        Raises:
+            sqlite3.Error: If the table cannot be read.
+        """
+        super().__init__(parent)
+        self.pager = TablePager(db_connection, table_name)
+        self.columns = self.pager.columns
+        self.fetchMore()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self.pager.exhausted
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        """Append the next page of rows."""
+        if parent.isValid():
+            return
+        try:
+            rows = self.pager.fetch_page()
+        except sqlite3.Error as e:
+            logging.error(f"Failed to fetch rows from {self.pager.table}: {e}")
+            self.pager.exhausted = True
+            return
+        self.append_rows(rows)
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        """Re-query ordered by column (rowid order for column -1)."""
+        self.pager.set_sort(column, order == Qt.DescendingOrder)
+        self.set_columns(self.pager.columns)
+        self.fetchMore()
+
+    def set_filter(self, text: str) -> None:
+        """Re-query keeping only rows where any column contains text."""
+        self.pager.set_filter(text)
+        self.set_columns(self.pager.columns)
+        self.fetchMore()
+
+
+class QueryWorkerSignals(QObject):
+    """
+    Signals emitted by QueryWorker; delivered on the GUI thread.
+    """
+    plan_ready = Signal(list, list)  # [(depth, detail)], [index suggestion]
+    columns_ready = Signal(list)
+    rows_ready = Signal(list)
+    finished = Signal(dict)
+    failed = Signal(str)
+
+
+class QueryWorker(QRunnable):
+    """
+    Runs one read-only statement from the SQL console on a thread pool thread.
+
+    The worker opens its own read-only connection, so the viewer's connection is never shared across threads.
+    """
+
+    def __init__(self, db_path: str, sql: str) -> None:
+        super().__init__()
+        self.db_path = db_path
+        self.sql = sql
+        self.cancelled = False
+        self.signals = QueryWorkerSignals()
+
+    def cancel(self) -> None:
+        """Interrupt the query at SQLite's next progress callback."""
+        self.cancelled = True
+
+    def run(self) -> None:
+        try:
+            conn = connect_readonly(self.db_path)
+        except sqlite3.Error as e:
+            self.signals.failed.emit(f"Could not open database read-only: {e}")
+            return
+        try:
+            plan = explain_query_plan(conn, self.sql)
+            self.signals.plan_ready.emit(plan, suggest_indexes(conn, self.sql, plan))
+            stats = execute_query(
+                conn, self.sql, self.signals.columns_ready.emit, self.signals.rows_ready.emit, lambda: self.cancelled
+            )
+            stats['full_scan_rows'] = sum(full_scans(conn, self.sql, plan).values())
+            self.signals.finished.emit(stats)
+        except sqlite3.Error as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            conn.close()
+
+
 class DatabaseViewer(QDialog):
     """
     Graphical interface for viewing SQLite database tables in a tabbed layout.
@@ -7,6 +150,8 @@ class DatabaseViewer(QDialog):
         """
         Initialize the DatabaseViewer with a database connection.
 
+        Only the table list is read up front; each tab loads its first page when shown.
+
         Args:
             db_connection: Active SQLite database connection.
             parent: Parent widget (default is None).
@@ -23,59 +168,181 @@ class DatabaseViewer(QDialog):
 
         self.db_connection = db_connection
         self.cursor = db_connection.cursor()
+        self.loaded_tabs: set[int] = set()
 
+        # Tabs start empty; each table is only queried when its tab is first shown
         try:
-            self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
             tables = [row[0] for row in self.cursor.fetchall()]
             for table_name in tables:
-                column_names, data = self.get_table_data(table_name)
-                self.add_table_tab(table_name, column_names, data)
-            logging.debug(f"Loaded {len(tables)} tables into viewer")
+                self.tab_widget.addTab(QWidget(), table_name)
+            logging.debug(f"Listed {len(tables)} tables in viewer")
         except sqlite3.Error as e:
             logging.error(f"Failed to load tables: {e}")
             QMessageBox.critical(self, "Error", "Failed to load database tables.")
 
-    def get_table_data(self, table_name: str) -> tuple[list[str], list[tuple]]:
+        self.query_worker = None
+        self.setup_sql_console()
+
+        self.tab_widget.currentChanged.connect(self.load_tab)
+        self.load_tab(self.tab_widget.currentIndex())
+
+    def load_tab(self, index: int) -> None:
         """
-        Fetch column names and data for a specified table.
+        Build the filter box and paged table view for a tab the first time it is shown.
 
         Args:
-            table_name: Name of the table to query.
-
-        Returns:
-            tuple: (list of column names, list of row data).
+            index: Tab index.
         """
+        if index < 0 or index in self.loaded_tabs:
+            return
+        self.loaded_tabs.add(index)
+        table_name = self.tab_widget.tabText(index)
+
         try:
-            self.cursor.execute(f"PRAGMA table_info(`{table_name}`)")
-            column_names = [col[1] for col in self.cursor.fetchall()]
-            self.cursor.execute(f"SELECT * FROM `{table_name}`")
-            data = self.cursor.fetchall()
-            return column_names, data
+            model = SQLiteTableModel(self.db_connection, table_name, self)
         except sqlite3.Error as e:
-            logging.error(f"Failed to fetch data for table '{table_name}': {e}")
-            return [], []
+            logging.error(f"Failed to open table '{table_name}': {e}")
+            QMessageBox.critical(self, "Error", f"Failed to load table '{table_name}'.")
+            return
+
+        tab = self.tab_widget.widget(index)
+        tab_layout = QVBoxLayout(tab)
+
+        filter_edit = QLineEdit()
+        filter_edit.setPlaceholderText("Filter rows (any column contains)...")
+        filter_timer = QTimer(tab)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(300)  # Debounce typing
+        filter_timer.timeout.connect(lambda: model.set_filter(filter_edit.text()))
+        filter_edit.textChanged.connect(filter_timer.start)
+        tab_layout.addWidget(filter_edit)
+
+        table_view = QTableView()
+        table_view.setModel(model)
+        table_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)  # Start in rowid order
+        table_view.setSortingEnabled(True)
+        table_view.resizeColumnsToContents()  # Only sizes the first page
+        tab_layout.addWidget(table_view)
+        logging.debug(f"Loaded tab for table '{table_name}' with {model.rowCount()} rows (first page)")
+
+    # -----------------------
+    # SQL Console
+    # -----------------------
+
+    def setup_sql_console(self) -> None:
+        """Add the SQL console tab: editor, run/cancel, result table, query plan and index suggestions."""
+        console = QWidget()
+        console_layout = QVBoxLayout(console)
+
+        self.sql_editor = QPlainTextEdit()
+        self.sql_editor.setPlaceholderText("SELECT ... (read-only; one statement)")
+        self.sql_editor.setMaximumHeight(120)
+        console_layout.addWidget(self.sql_editor)
+
+        button_row = QHBoxLayout()
+        self.run_query_button = QPushButton("Run")
+        self.run_query_button.clicked.connect(self.run_console_query)
+        self.cancel_query_button = QPushButton("Cancel")
+        self.cancel_query_button.setEnabled(False)
+        self.cancel_query_button.clicked.connect(self.cancel_console_query)
+        self.query_stats_label = QLabel("")
+        button_row.addWidget(self.run_query_button)
+        button_row.addWidget(self.cancel_query_button)
+        button_row.addWidget(self.query_stats_label, 1)
+        console_layout.addLayout(button_row)
+
+        self.query_model = QueryResultModel(self)
+        result_view = QTableView()
+        result_view.setModel(self.query_model)
+        console_layout.addWidget(result_view, 1)
+
+        self.query_plan_tree = QTreeWidget()
+        self.query_plan_tree.setHeaderLabels(["Query plan"])
+        self.query_plan_tree.setMaximumHeight(140)
+        console_layout.addWidget(self.query_plan_tree)
+
+        self.index_suggestions = QPlainTextEdit()
+        self.index_suggestions.setReadOnly(True)
+        self.index_suggestions.setPlaceholderText("Index suggestions for full scans of large tables appear here.")
+        self.index_suggestions.setMaximumHeight(80)
+        console_layout.addWidget(self.index_suggestions)
+
+        index = self.tab_widget.addTab(console, "SQL Console")
+        self.loaded_tabs.add(index)  # Not a table tab
+
+    def run_console_query(self) -> None:
+        """Run the editor's statement on a background thread against a read-only connection."""
+        sql = self.sql_editor.toPlainText().strip().rstrip(';')
+        if not sql:
+            return
+        try:
+            db_path = next(row[2] for row in self.db_connection.execute("PRAGMA database_list") if row[1] == 'main')
+        except (sqlite3.Error, StopIteration) as e:
+            logging.error(f"Failed to resolve database path for SQL console: {e}")
+            return
+
+        self.query_model.set_columns([])
+        self.query_plan_tree.clear()
+        self.index_suggestions.clear()
+        self.query_stats_label.setText("Running...")
+        self.run_query_button.setEnabled(False)
+        self.cancel_query_button.setEnabled(True)
+
+        self.query_worker = QueryWorker(db_path, sql)
+        self.query_worker.signals.plan_ready.connect(self.show_query_plan)
+        self.query_worker.signals.columns_ready.connect(self.query_model.set_columns)
+        self.query_worker.signals.rows_ready.connect(self.query_model.append_rows)
+        self.query_worker.signals.finished.connect(self.on_console_query_finished)
+        self.query_worker.signals.failed.connect(self.on_console_query_failed)
+        QThreadPool.globalInstance().start(self.query_worker)
+        logging.debug(f"SQL console query started: {sql}")
+
+    def cancel_console_query(self) -> None:
+        """Interrupt the running console query, if any."""
+        if self.query_worker:
+            self.query_worker.cancel()
 
-    def add_table_tab(self, table_name: str, column_names: list[str], data: list[tuple]) -> None:
+    def show_query_plan(self, plan: list, suggestions: list) -> None:
         """
-        Add a tab displaying table data.
+        Show the EXPLAIN QUERY PLAN tree and any index suggestions.
 
         Args:
-            table_name: Name of the table.
-            column_names: List of column names.
-            data: List of row data tuples.
+            plan: (depth, detail) rows in display order.
+            suggestions: CREATE INDEX statements.
         """
-        table_widget = QTableWidget()
-        table_widget.setRowCount(len(data))
-        table_widget.setColumnCount(len(column_names))
-        table_widget.setHorizontalHeaderLabels(column_names)
+        parents = []
+        for depth, detail in plan:
+            del parents[depth:]
+            item = QTreeWidgetItem([detail])
+            if parents:
+                parents[-1].addChild(item)
+            else:
+                self.query_plan_tree.addTopLevelItem(item)
+            parents.append(item)
+        self.query_plan_tree.expandAll()
+        self.index_suggestions.setPlainText("\n".join(suggestions))
 
-        for row_idx, row_data in enumerate(data):
-            for col_idx, value in enumerate(row_data):
-                table_widget.setItem(row_idx, col_idx, QTableWidgetItem(str(value or "")))
+    def on_console_query_finished(self, stats: dict) -> None:
+        """Show timing and work counters for the finished query."""
+        status = "Cancelled" if stats['cancelled'] else "Done"
+        truncated = " (truncated)" if stats['truncated'] else ""
+        self.query_stats_label.setText(
+            f"{status}: {stats['rows']:,} rows{truncated} in {stats['elapsed_ms']:.1f} ms | "
+            f"~{stats['vm_steps']:,} VM steps | {stats['full_scan_rows']:,} rows in fully scanned tables"
+        )
+        self.run_query_button.setEnabled(True)
+        self.cancel_query_button.setEnabled(False)
+        self.query_worker = None
+        logging.debug(f"SQL console query finished: {stats}")
 
-        table_widget.resizeColumnsToContents()  # Improve readability
-        self.tab_widget.addTab(table_widget, table_name)
-        logging.debug(f"Added tab for table '{table_name}' with {len(data)} rows")
+    def on_console_query_failed(self, message: str) -> None:
+        """Report a query error."""
+        self.query_stats_label.setText(f"Error: {message}")
+        self.run_query_button.setEnabled(True)
+        self.cancel_query_button.setEnabled(False)
+        self.query_worker = None
+        logging.warning(f"SQL console query failed: {message}")
 
     def closeEvent(self, event) -> None:
         """
@@ -84,6 +351,7 @@ class DatabaseViewer(QDialog):
         Args:
             event: QCloseEvent object.
         """
+        self.cancel_console_query()
         try:
             self.cursor.close()
             self.db_connection.close()
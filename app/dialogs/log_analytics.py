@@ -0,0 +1,117 @@
+# -----------------------
+# Log Analytics
+# -----------------------
+class LogAnalyticsWorkerSignals(QObject):
+    """
+    Signals emitted by LogAnalyticsWorker; delivered on the GUI thread.
+    """
+    finished = Signal(object, float)  # report (tuple keys, so not a QVariantMap), elapsed seconds
+    failed = Signal(str)
+
+
+class LogAnalyticsWorker(QRunnable):
+    """
+    Analyzes every daily log on a thread pool thread; the analysis itself fans out to a process pool.
+    """
+
+    def __init__(self, log_dir: str) -> None:
+        super().__init__()
+        self.log_dir = log_dir
+        self.signals = LogAnalyticsWorkerSignals()
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        try:
+            report = analyze_logs(self.log_dir, LOG_FORMAT)
+        except (OSError, ValueError, RuntimeError) as e:  # RuntimeError: a worker process died
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(report, time.perf_counter() - start)
+
+
+class LogAnalyticsDialog(QDialog):
+    """Summary of every daily log: page loads, timings, scraper failures, coin events and problems."""
+
+    def __init__(self, parent: QWidget, log_directory: str) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Log Analytics")
+        self.setWindowIcon(APP_ICON)
+        self.resize(700, 600)
+
+        self.log_directory = log_directory
+        self.report: dict | None = None
+        self.worker: LogAnalyticsWorker | None = None
+
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.summary_tree = QTreeWidget()
+        self.summary_tree.setHeaderLabels(["Section / Key", "Value"])
+        layout.addWidget(self.summary_tree)
+
+        buttons = QHBoxLayout()
+        self.refresh_button = QPushButton("Refresh")
+        self.refresh_button.clicked.connect(self.run_analysis)
+        self.export_button = QPushButton("Export CSV...")
+        self.export_button.clicked.connect(self.export_csv)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(self.refresh_button)
+        buttons.addWidget(self.export_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+        self.run_analysis()
+
+    def run_analysis(self) -> None:
+        """Analyze the logs in the background; the summary fills in when done."""
+        self.status_label.setText("Analyzing logs...")
+        self.refresh_button.setEnabled(False)
+        self.export_button.setEnabled(False)
+
+        self.worker = LogAnalyticsWorker(self.log_directory)
+        self.worker.signals.finished.connect(self.show_report)
+        self.worker.signals.failed.connect(self.on_analysis_failed)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def show_report(self, report: dict, elapsed_s: float) -> None:
+        """Fill the summary tree, one top-level item per section."""
+        self.report = report
+        self.summary_tree.clear()
+        sections = {}
+        for section, key, value in summary_rows(report):
+            if section not in sections:
+                sections[section] = QTreeWidgetItem([section])
+                self.summary_tree.addTopLevelItem(sections[section])
+            sections[section].addChild(QTreeWidgetItem([key, value]))
+        self.summary_tree.expandAll()
+        self.summary_tree.resizeColumnToContents(0)
+
+        self.status_label.setText(
+            f"{len(report['files'])} logs, {report['bytes'] / 1e6:.1f} MB analyzed in {elapsed_s:.1f} s"
+        )
+        self.refresh_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+        logging.info(f"Log analytics: {report['bytes'] / 1e6:.1f} MB in {elapsed_s:.1f} s")
+
+    def on_analysis_failed(self, error: str) -> None:
+        self.status_label.setText(f"Analysis failed: {error}")
+        self.refresh_button.setEnabled(True)
+        logging.error(f"Log analytics failed: {error}")
+
+    def export_csv(self) -> None:
+        """Save the summary rows to a CSV file."""
+        if not self.report:
+            return
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Log Analytics", "log_analytics.csv",
+                                                   "CSV Files (*.csv)")
+        if not file_path:
+            return
+        try:
+            write_csv(self.report, file_path)
+            logging.info(f"Log analytics exported to {file_path}")
+        except OSError as e:
+            logging.error(f"Failed to export log analytics: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to export log analytics: {e}")
@@ -1,9 +1,65 @@
 # -----------------------
 # Log Viewer
 # -----------------------
+class LogLineModel(QAbstractListModel):
+    """
+    Virtualized list model over a LogIndex.
+
+    Holds only the line numbers that pass the level filter; the view asks for the
+    text of the rows on screen, which is decoded from the mapped file on demand.
+    """
+
+    LEVEL_COLORS = {'WARNING': QColor('#b36b00'), 'ERROR': QColor('#c00000'), 'CRITICAL': QColor('#c00000')}
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.log_index: LogIndex | None = None
+        self.levels: set[str] = set()
+        self.rows = array('I')
+
+    def set_index(self, log_index: LogIndex | None, levels: set[str]) -> None:
+        """Show another log (or none)."""
+        self.log_index = log_index
+        self.set_levels(levels)
+
+    def set_levels(self, levels: set[str]) -> None:
+        """Re-filter the whole log from the level index."""
+        self.beginResetModel()
+        self.levels = levels
+        self.rows = self.log_index.matching(levels) if self.log_index else array('I')
+        self.endResetModel()
+
+    def append_lines(self, first: int, stop: int) -> None:
+        """Add newly indexed lines first..stop-1 that pass the filter."""
+        new_rows = self.log_index.matching(self.levels, first, stop)
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(new_rows) - 1)
+            self.rows.extend(new_rows)
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.log_index.line(self.rows[index.row()])
+        if role == Qt.ForegroundRole:
+            return self.LEVEL_COLORS.get(self.log_index.level(self.rows[index.row()]))
+        return None
+
+
 class LogViewer(QDialog):
     """A dialog window to view and optionally send application logs."""
 
+    # How often follow mode checks the log for new lines
+    FOLLOW_INTERVAL_MS = 500
+
+    # Search time ranges: label -> how far back, in hours (None = any time)
+    SEARCH_RANGES = {"Any time": None, "Last hour": 1, "Last 24 hours": 24, "Last 7 days": 24 * 7,
+                     "Last 30 days": 24 * 30}
+
     def __init__(self, parent: QWidget, log_directory: str):
         super().__init__(parent)
         self.setWindowTitle("Log Viewer")
@@ -11,7 +67,13 @@ class LogViewer(QDialog):
         self.resize(900, 600)
 
         self.log_directory = LOG_DIR
-        self.current_log_lines = []
+        self.log_index: LogIndex | None = None
+        self.search_connection = None
+
+        # Catch the search index up with the latest lines while the dialog opens
+        self.search_indexer = getattr(parent, 'log_search_indexer', None)
+        if self.search_indexer:
+            self.search_indexer.request()
 
         # Layouts
         main_layout = QHBoxLayout(self)
@@ -24,14 +86,37 @@ class LogViewer(QDialog):
         left_layout.addWidget(QLabel("Available Logs"))
         left_layout.addWidget(self.log_list)
 
-        # Populate Log Files
+        # Populate Log Files (current logs and their gzipped rollovers)
         for file in sorted(os.listdir(log_directory), reverse=True):
-            if file.endswith(".log"):
+            if file.endswith(".log") or (".log." in file and file.endswith(".gz")):
                 self.log_list.addItem(file)
 
-        # Log Viewer Text Area
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        # Log lines, drawn only for the rows on screen
+        self.log_model = LogLineModel(self)
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.log_view.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.line_count_label = QLabel("")
+
+        # Search across every daily log (full-text index, ranked)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search all logs (word, prefix*)...")
+        self.search_range = QComboBox()
+        self.search_range.addItems(list(self.SEARCH_RANGES))
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search_range.currentIndexChanged.connect(self.run_search)
+        self.search_results = QTreeWidget()
+        self.search_results.setHeaderLabels(["Time", "Level", "File", "Message"])
+        self.search_results.setRootIsDecorated(False)
+        self.search_results.setMaximumHeight(200)
+        self.search_results.itemDoubleClicked.connect(self.show_search_result)
+        self.search_results.hide()
 
         # Filter checkboxes
         self.levels = {
@@ -51,7 +136,13 @@ class LogViewer(QDialog):
             filter_layout.addWidget(cb)
         filter_box.setLayout(filter_layout)
 
-        # Buttons
+        # Follow mode: index lines as they are appended and keep the newest in view
+        self.follow_checkbox = QCheckBox("Follow")
+        self.follow_checkbox.toggled.connect(self.set_follow)
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setInterval(self.FOLLOW_INTERVAL_MS)
+        self.follow_timer.timeout.connect(self.tail_log)
+
         # Buttons
         delete_button = QPushButton("Delete Log")
         delete_button.clicked.connect(self.delete_log)
@@ -61,12 +152,22 @@ class LogViewer(QDialog):
 
         button_layout = QHBoxLayout()
         button_layout.addWidget(delete_button)
+        button_layout.addWidget(self.follow_checkbox)
         button_layout.addStretch(1)
         button_layout.addWidget(close_button)
 
         # Assemble Right Layout
-        right_layout.addWidget(QLabel("Log Contents"))
-        right_layout.addWidget(self.log_text)
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel("Log Contents"))
+        header_layout.addStretch(1)
+        header_layout.addWidget(self.line_count_label)
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_input, 1)
+        search_layout.addWidget(self.search_range)
+        right_layout.addLayout(search_layout)
+        right_layout.addWidget(self.search_results)
+        right_layout.addLayout(header_layout)
+        right_layout.addWidget(self.log_view)
         right_layout.addWidget(filter_box)
         right_layout.addLayout(button_layout)
 
@@ -74,22 +175,132 @@ class LogViewer(QDialog):
         main_layout.addLayout(left_layout, 2)
         main_layout.addLayout(right_layout, 5)
 
+    def enabled_levels(self) -> set[str]:
+        return {level for level, cb in self.levels.items() if cb.isChecked()}
+
     def load_log(self, item: QListWidgetItem):
+        """Map and index the selected log; only the visible lines are ever decoded."""
         file_path = os.path.join(self.log_directory, item.text())
+        self.close_log()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.current_log_lines = f.readlines()
-            self.apply_filter()
-        except Exception as e:
+            self.log_index = LogIndex(file_path, following=self.follow_checkbox.isChecked())
+        except (OSError, ValueError) as e:
             QMessageBox.critical(self, "Error", f"Could not open file: {e}")
+            return
+        self.log_model.set_index(self.log_index, self.enabled_levels())
+        self.follow_checkbox.setEnabled(not self.log_index.compressed)
+        self.update_line_count()
+        if self.follow_checkbox.isChecked():
+            self.log_view.scrollToBottom()
+
+    def close_log(self) -> None:
+        """Drop the current log's mapping (needed before it can be deleted on Windows)."""
+        self.log_model.set_index(None, self.enabled_levels())
+        if self.log_index:
+            self.log_index.close()
+            self.log_index = None
+        self.update_line_count()
 
     def apply_filter(self):
-        enabled_levels = [level for level, cb in self.levels.items() if cb.isChecked()]
-        filtered = [
-            line for line in self.current_log_lines
-            if any(level in line for level in enabled_levels)
-        ]
-        self.log_text.setPlainText("".join(filtered))
+        """Re-filter from the level index; no text is read or copied."""
+        self.log_model.set_levels(self.enabled_levels())
+        self.update_line_count()
+
+    def update_line_count(self) -> None:
+        total = len(self.log_index) if self.log_index else 0
+        self.line_count_label.setText(f"{self.log_model.rowCount():,} of {total:,} lines" if self.log_index else "")
+
+    def set_follow(self, enabled: bool) -> None:
+        """Start or stop tailing the open log."""
+        if enabled:
+            if self.log_index:
+                self.log_index.follow()  # Don't hold the live log mapped while it may be rolled over
+            self.tail_log()
+            self.log_view.scrollToBottom()
+            self.follow_timer.start()
+        else:
+            self.follow_timer.stop()
+
+    def tail_log(self) -> None:
+        """Index lines appended since the last check and show the ones that pass the filter."""
+        if not self.log_index or self.log_index.compressed:
+            return
+        try:
+            added = self.log_index.refresh()
+        except OSError as e:
+            logging.warning(f"Stopped following {self.log_index.path}: {e}")
+            self.follow_checkbox.setChecked(False)
+            return
+        if not added:
+            return
+        first, stop = added
+        if first == 0:  # Cleared or rolled over: indexed again from the start
+            self.log_model.set_levels(self.enabled_levels())
+        else:
+            self.log_model.append_lines(first, stop)
+        self.update_line_count()
+        if self.follow_checkbox.isChecked():
+            self.log_view.scrollToBottom()
+
+    def run_search(self) -> None:
+        """Search every indexed log for the search box text, best matches first."""
+        text = self.search_input.text().strip()
+        self.search_results.clear()
+        self.search_results.setVisible(bool(text))
+        if not text:
+            return
+
+        hours = self.SEARCH_RANGES[self.search_range.currentText()]
+        since = (datetime.now() - timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S') if hours else None
+        try:
+            if self.search_connection is None:
+                self.search_connection = connect_log_search(LOG_SEARCH_DB)
+            start = time.perf_counter()
+            results = search_logs(self.search_connection, text, since=since, levels=self.enabled_levels())
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        except sqlite3.Error as e:
+            logging.error(f"Log search failed: {e}")
+            self.search_results.setHeaderLabels(["Time", "Level", "File", f"Search failed: {e}"])
+            return
+
+        for logged_at, level, file, offset, message in results:
+            item = QTreeWidgetItem([logged_at, level, file, message])
+            item.setData(0, Qt.UserRole, (file, offset))
+            self.search_results.addTopLevelItem(item)
+        self.search_results.setHeaderLabels(
+            ["Time", "Level", "File", f"Message ({len(results)} results in {elapsed_ms:.0f} ms)"]
+        )
+
+    def show_search_result(self, item: QTreeWidgetItem) -> None:
+        """Open the log a result came from and select its line."""
+        file, offset = item.data(0, Qt.UserRole)
+        matches = self.log_list.findItems(file, Qt.MatchExactly)
+        if not matches:
+            QMessageBox.warning(self, "Log Not Found", f"{file} is no longer available.")
+            return
+        self.log_list.setCurrentItem(matches[0])
+        if not self.log_index or os.path.basename(self.log_index.path) != file:
+            self.load_log(matches[0])
+        if not self.log_index:
+            return
+
+        line = bisect_right(self.log_index.offsets, offset) - 1
+        if line < 0 or self.log_index.offsets[line] != offset:
+            QMessageBox.warning(self, "Log Changed", f"{file} has changed since this result was indexed.")
+            return
+        row = min(bisect_left(self.log_model.rows, line), self.log_model.rowCount() - 1)
+        if row >= 0:
+            model_index = self.log_model.index(row)
+            self.log_view.setCurrentIndex(model_index)
+            self.log_view.scrollTo(model_index, QAbstractItemView.PositionAtCenter)
+
+    def closeEvent(self, event) -> None:
+        self.follow_timer.stop()
+        self.close_log()
+        if self.search_connection:
+            self.search_connection.close()
+            self.search_connection = None
+        super().closeEvent(event)
 
     def delete_log(self):
         selected_item = self.log_list.currentItem()
@@ -109,19 +320,16 @@ class LogViewer(QDialog):
         if confirm != QMessageBox.StandardButton.Yes:
             return
 
+        self.close_log()
         try:
             os.remove(file_path)
             self.log_list.takeItem(self.log_list.currentRow())
-            self.log_text.clear()
-            self.current_log_lines = []
             QMessageBox.information(self, "Deleted", f"Successfully deleted: {filename}")
 
         except Exception as delete_error:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.truncate(0)
-                self.current_log_lines = []
-                self.log_text.clear()
                 QMessageBox.information(
                     self, "Cleared Instead",
                     f"Could not delete '{filename}' (in use), so its contents were cleared instead."
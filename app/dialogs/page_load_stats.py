@@ -0,0 +1,55 @@
+# -----------------------
+# Page Load Stats
+# -----------------------
+class PageLoadStatsDialog(QDialog):
+    """p50/p95/p99 of each page load stage, for this session and the stored sessions."""
+
+    def __init__(self, parent: QWidget, db_path: str) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Page Load Stats")
+        self.setWindowIcon(APP_ICON)
+        self.resize(600, 450)
+
+        self.db_path = db_path
+
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.stats_tree = QTreeWidget()
+        self.stats_tree.setHeaderLabels(["Stage", "Loads", "p50 (ms)", "p95 (ms)", "p99 (ms)"])
+        layout.addWidget(self.stats_tree)
+
+        buttons = QHBoxLayout()
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(refresh_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Save this session's histograms, then show them and the merged stored sessions."""
+        page_load_telemetry.save(self.db_path)
+        stored, sessions = load_histograms(self.db_path)
+
+        self.stats_tree.clear()
+        for title, histograms in (("This session", page_load_telemetry.histograms),
+                                  (f"Last {sessions} session(s)", stored)):
+            section = QTreeWidgetItem([title])
+            self.stats_tree.addTopLevelItem(section)
+            for stage, samples, percentiles in summary_rows(histograms):
+                section.addChild(QTreeWidgetItem(
+                    [stage, str(samples)] + ['-' if ms is None else f"{ms:.1f}" for ms in percentiles]
+                ))
+        self.stats_tree.expandAll()
+        self.stats_tree.resizeColumnToContents(0)
+
+        self.status_label.setText(
+            f"Percentiles are accurate to within {(BUCKET_GROWTH - 1) * 100:.0f}%. "
+            "A move is traced from its keypress; other page loads from the start of navigation."
+        )
@@ -89,21 +89,41 @@ class SetDestinationDialog(QDialog):
         set_btn.clicked.connect(self.set_destination)
         clear_btn = QPushButton("Clear")
         clear_btn.clicked.connect(self.clear_destination)
-        update_btn = QPushButton("Update Data")
-        update_btn.clicked.connect(self.update_comboboxes)
+        self.update_btn = QPushButton("Update Data")
+        self.update_btn.clicked.connect(self.update_comboboxes)
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(set_btn, 0, 0)
         button_layout.addWidget(clear_btn, 0, 1)
-        button_layout.addWidget(update_btn, 1, 0)
+        button_layout.addWidget(self.update_btn, 1, 0)
         button_layout.addWidget(cancel_btn, 1, 1)
 
+        # Scrape status; updates arrive from the background scraper
+        self.update_status = QLabel("")
+        self.scrape_scheduler = None  # Connected to until the dialog closes (see done)
+        if self.parent:
+            scheduler = self.scrape_scheduler = self.parent.scrape_scheduler
+            scheduler.scrape_progress.connect(self.update_status.setText)
+            scheduler.scrape_finished.connect(self.on_scrape_finished)
+            if scheduler.running:
+                self.update_btn.setEnabled(False)
+                self.update_status.setText("Updating shop and guild data...")
+
         # Final layout
         main_layout.addLayout(dropdown_layout)
         main_layout.addLayout(custom_layout)
         main_layout.addLayout(button_layout)
+        main_layout.addWidget(self.update_status)
         self.setLayout(main_layout)
 
+    def done(self, result: int) -> None:
+        """Stop receiving scraper updates however the dialog closes (accept, reject or the close button)."""
+        if self.scrape_scheduler:
+            self.scrape_scheduler.scrape_progress.disconnect(self.update_status.setText)
+            self.scrape_scheduler.scrape_finished.disconnect(self.on_scrape_finished)
+            self.scrape_scheduler = None
+        super().done(result)
+
     def _populate_initial_dropdowns(self) -> None:
         """Populate predefined destination dropdowns with initial data."""
         if not self.parent:
@@ -161,44 +181,32 @@ class SetDestinationDialog(QDialog):
         logging.debug(f"Populated dropdown with {len(items)} items")
 
     def update_comboboxes(self):
+        """
+        Refresh shop and guild data, scraping in the background only if it is past its next update time.
+
+        The dialog stays responsive; dropdowns are repopulated in on_scrape_finished.
+        """
         logging.info("Updating comboboxes.")
-        self.show_notification("Updating Shop and Guild Data. Please wait...")
+        if self.parent.scrape_scheduler.request_scrape():
+            self.update_btn.setEnabled(False)
+            self.update_status.setText("Updating shop and guild data...")
+        else:
+            logging.info("Shop and guild data is current; not scraping.")
+            self.update_status.setText("Shop and guild data is up to date.")
+            self.refresh_location_dropdowns()
+
+    def on_scrape_finished(self, success: bool) -> None:
+        """Repopulate dropdowns once a background scrape ends; changes already reached the parent via data_refreshed."""
+        self.update_btn.setEnabled(True)
+        if success:
+            self.update_status.setText("Shop and guild data updated.")
+        else:
+            self.update_status.setText("Update failed; showing stored data. Will retry automatically.")
+        self.refresh_location_dropdowns()
+
+    def refresh_location_dropdowns(self) -> None:
+        """Repopulate the location dropdowns from the parent's coordinates."""
         try:
-            # Run scraper to update shops and guilds
-            self.parent.AVITD_scraper.scrape_guilds_and_shops()
-
-            # Update only shops and guilds coordinates from database
-            with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-
-                # Fetch columns and rows for coordinate conversion
-                cursor.execute("SELECT `Name`, `Coordinate` FROM `columns`")
-                columns = {row[0]: row[1] for row in cursor.fetchall()}
-                cursor.execute("SELECT `Name`, `Coordinate` FROM `rows`")
-                rows = {row[0]: row[1] for row in cursor.fetchall()}
-
-                def to_coords(col_name: str, row_name: str) -> tuple[int, int]:
-                    col = columns.get(col_name, 0) + 1
-                    row = rows.get(row_name, 0) + 1
-                    return (col, row)
-
-                # Update shops_coordinates
-                cursor.execute("SELECT Name, `Column`, `Row` FROM shops")
-                self.parent.shops_coordinates = {}
-                for name, col, row in cursor.fetchall():
-                    if col == "NA" or row == "NA":
-                        continue
-                    self.parent.shops_coordinates[name] = to_coords(col, row)
-
-                # Update guilds_coordinates
-                cursor.execute("SELECT Name, `Column`, `Row` FROM guilds")
-                self.parent.guilds_coordinates = {}
-                for name, col, row in cursor.fetchall():
-                    if col == "NA" or row == "NA":
-                        continue
-                    self.parent.guilds_coordinates[name] = to_coords(col, row)
-
-            # Populate dropdowns
             self.populate_dropdown(self.tavern_dropdown, self.parent.taverns_coordinates.keys())
             self.populate_dropdown(self.bank_dropdown, self.parent.banks_coordinates.keys())
             self.populate_dropdown(self.transit_dropdown, self.parent.transits_coordinates.keys())
@@ -206,24 +214,11 @@ class SetDestinationDialog(QDialog):
             self.populate_dropdown(self.guild_dropdown, self.parent.guilds_coordinates.keys())
             self.populate_dropdown(self.poi_dropdown, self.parent.places_of_interest_coordinates.keys())
             self.populate_dropdown(self.user_building_dropdown, self.parent.user_buildings_coordinates.keys())
-            self.parent.update_minimap()
             logging.info("Comboboxes updated successfully.")
         except Exception as e:
             logging.error(f"Failed to update comboboxes: {e}")
             self.show_error_dialog("Update Failed", str(e))
 
-    def show_notification(self, message: str) -> None:
-        """Show a temporary notification."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Notification")
-        dialog.setWindowFlags(Qt.Window | Qt.WindowTitleHint | Qt.WindowCloseButtonHint)
-        layout = QVBoxLayout(dialog)
-        layout.addWidget(QLabel(message, dialog))
-        dialog.setFixedSize(300, 100)
-        QTimer.singleShot(5000, dialog.accept)
-        dialog.exec()
-        logging.debug(f"Notification shown: {message}")
-
     def clear_destination(self) -> None:
         """Clear the current destination for the selected character."""
         if not self.parent or not self.parent.selected_character:
@@ -53,6 +53,23 @@
         zoom_out_action.triggered.connect(self.zoom_out_browser)
         settings_menu.addAction(zoom_out_action)
 
+        # Request Filter Submenu
+        request_filter_menu = settings_menu.addMenu("Request Filter")
+
+        self.request_filter_action = QAction("Block Ads and Trackers", self, checkable=True)
+        self.request_filter_action.triggered.connect(self.set_request_filter)
+        request_filter_menu.addAction(self.request_filter_action)
+
+        self.block_images_action = QAction("Block Images", self, checkable=True)
+        self.block_images_action.triggered.connect(self.set_block_images)
+        request_filter_menu.addAction(self.block_images_action)
+
+        edit_request_rules_action = QAction("Edit Rules...", self)
+        edit_request_rules_action.triggered.connect(self.edit_request_rules)
+        request_filter_menu.addAction(edit_request_rules_action)
+
+        self.update_request_filter_menu()
+
         # Keybindings Submenu
         keybindings_menu = settings_menu.addMenu("Keybindings")
 
@@ -92,6 +109,12 @@
             log_level_menu.addAction(action)
             self.log_level_actions[level] = action
 
+        # Full tracing of the rate-limited, sampled hot paths (minimap drawing, page parsing)
+        log_level_menu.addSeparator()
+        self.trace_hot_paths_action = QAction("Trace Hot Paths", self, checkable=True)
+        self.trace_hot_paths_action.triggered.connect(self.set_hot_path_tracing)
+        log_level_menu.addAction(self.trace_hot_paths_action)
+
         self.update_log_level_menu()
 
         # Tools menu
@@ -117,6 +140,14 @@
         logs_action.triggered.connect(self.open_log_viewer)
         tools_menu.addAction(logs_action)
 
+        log_analytics_action = QAction('Log Analytics', self)
+        log_analytics_action.triggered.connect(self.open_log_analytics)
+        tools_menu.addAction(log_analytics_action)
+
+        page_load_stats_action = QAction('Page Load Stats', self)
+        page_load_stats_action.triggered.connect(self.open_page_load_stats)
+        tools_menu.addAction(page_load_stats_action)
+
         # Help menu
         help_menu = menu_bar.addMenu('Help')
 
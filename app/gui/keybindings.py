@@ -56,9 +56,55 @@
             shortcut.activated.connect(lambda idx=move_index: self.move_character(idx))
             logging.debug(f"Bound key {key} to move index {move_index}")
 
+    # Installed on every web profile at DocumentCreation: caches the forms of the
+    # 3x3 movement grid once the document is parsed, so a move is a single call.
+    MOVE_HELPER = """
+        (function() {
+            var forms = null;
+            function collect() {
+                var table = document.querySelector('table table');
+                var spaces = table ? table.querySelectorAll('td') : [];
+                forms = [];
+                if (spaces.length !== 9) return;
+                for (var i = 0; i < 9; i++) {
+                    forms.push(spaces[i].querySelector('form[action="/blood.pl"][method="POST"]'));
+                }
+            }
+            document.addEventListener('DOMContentLoaded', collect);
+            window.rbcMove = function(index) {
+                if (forms === null) collect();
+                if (forms.length !== 9) return 'Invalid grid';
+                var form = forms[index];
+                if (!form || !form.isConnected) return 'No form';
+                var x = form.querySelector('input[name="x"]').value;
+                var y = form.querySelector('input[name="y"]').value;
+                form.submit();
+                return 'Submitted to x=' + x + ', y=' + y;
+            };
+        })();
+    """
+
+    def install_move_helper(self, profile: QWebEngineProfile) -> None:
+        """
+        Install the movement helper (window.rbcMove) on a web profile, replacing any installed earlier.
+
+        Args:
+            profile (QWebEngineProfile): Profile whose pages get the helper.
+        """
+        scripts = profile.scripts()
+        for script in scripts.find(MOVE_HELPER_SCRIPT_NAME):
+            scripts.remove(script)
+        script = QWebEngineScript()
+        script.setName(MOVE_HELPER_SCRIPT_NAME)
+        script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+        script.setWorldId(QWebEngineScript.ScriptWorldId.MainWorld)
+        script.setRunsOnSubFrames(False)
+        script.setSourceCode(self.MOVE_HELPER)
+        scripts.insert(script)
+
     def move_character(self, move_index: int) -> None:
         """
-        Move character to the specified grid position via JavaScript.
+        Move character to the specified grid position, or queue the move while a page is loading.
 
         Args:
             move_index (int): Index in the 3x3 movement grid (0-8).
@@ -67,26 +113,36 @@
             logging.warning("Cannot move character: website_frame or page not initialized")
             return
 
-        logging.debug(f"Attempting move to grid index: {move_index}")
-        js_code = """
-            (function() {
-                const table = document.querySelector('table table');
-                if (!table) return 'No table';
-                const spaces = Array.from(table.querySelectorAll('td'));
-                if (spaces.length !== 9) return 'Invalid grid size: ' + spaces.length;
-                const targetSpace = spaces[%d];
-                if (!targetSpace) return 'No target space';
-                const form = targetSpace.querySelector('form[action="/blood.pl"][method="POST"]');
-                if (!form) return 'No form';
-                const x = form.querySelector('input[name="x"]').value;
-                const y = form.querySelector('input[name="y"]').value;
-                form.submit();
-                return 'Submitted to x=' + x + ', y=' + y;
-            })();
-        """ % move_index
-        self.website_frame.page().runJavaScript(js_code, lambda result: logging.debug(f"Move result: {result}"))
+        move = self.move_queue.press(move_index)
+        if move is not None:
+            self.submit_move(move)
         self.website_frame.setFocus()
 
+    def submit_move(self, move_index: int) -> None:
+        """
+        Submit a move through the preinjected helper.
+
+        Args:
+            move_index (int): Index in the 3x3 movement grid (0-8).
+        """
+        logging.debug(f"Submitting move to grid index: {move_index}")
+        self.website_frame.page().runJavaScript(
+            f"typeof rbcMove === 'function' ? rbcMove({move_index}) : 'No movement helper'",
+            self.on_move_submitted
+        )
+
+    def on_move_submitted(self, result) -> None:
+        """Drop the move in flight (and any queued ones) if the page had nothing to submit."""
+        logging.debug(f"Move result: {result}")
+        if not str(result).startswith('Submitted'):
+            self.move_queue.not_submitted()
+
+    def on_move_load_finished(self, success: bool) -> None:
+        """Complete the move in flight and submit the next queued one."""
+        move = self.move_queue.load_finished(success)
+        if move is not None:
+            self.submit_move(move)
+
     def toggle_keybind_config(self, mode: int) -> None:
         """
         Switch between keybinding modes (0=Off, 1=WASD, 2=Arrows) and update settings.
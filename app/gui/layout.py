@@ -16,15 +16,7 @@
 
         self.create_menu_bar()
 
-        # Initialize the QWebEngineView before setting up the browser controls
-        self.website_frame = QWebEngineView(self.web_profile)
-
-        # Disable GPU-related features
-        self.website_frame.settings().setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, False)
-        self.website_frame.settings().setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, False)
-        self.website_frame.settings().setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)  # Keep JS enabled
-        self.website_frame.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl'))
-        self.website_frame.loadFinished.connect(self.on_webview_load_finished)
+        # The QWebEngineView is created and already navigating (see _init_webview); it is only placed here
 
         # Add Keybindings
         self.setup_keybindings()
@@ -169,11 +161,11 @@
 
         self.combo_columns = QComboBox()
         self.combo_columns.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.combo_columns.addItems(columns.keys())
+        self.combo_columns.addItems(self.columns.keys())
 
         self.combo_rows = QComboBox()
         self.combo_rows.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.combo_rows.addItems(rows.keys())
+        self.combo_rows.addItems(self.rows.keys())
 
         go_button = QPushButton('Go')
         go_button.setFixedSize(25, 25)
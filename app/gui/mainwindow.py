@@ -7,20 +7,35 @@ class RBCCommunityMap(QMainWindow):
     Main application class for the RBC Community Map.
     """
 
-    def __init__(self):
+    def __init__(self, profile_startup: bool = False):
         """
         Initialize the RBCCommunityMap and its components efficiently.
 
-        Sets up the main window, scraper, cookie handling, data loading, and UI components
-        with proper error handling and asynchronous initialization where possible.
+        Startup is staged so web engine boot overlaps with data loading: database reads
+        (catalog, theme, characters, cookies) start on worker threads first, then the
+        GUI thread creates the web profile and view, injects the saved cookies and issues
+        the single initial navigation. Each later stage waits only for the read it depends on:
+
+            webview       -> web_profile
+            cookie_load   -> web_profile, cookies_read (worker)
+            navigation    -> webview, cookie_load (the first request carries the saved session)
+            data          -> load_data (worker)
+            theme         -> data, theme_read (worker)
+            characters    -> characters_read (worker)
+            ui_build      -> webview, data, ui_state, characters
+
+        Args:
+            profile_startup (bool): Print the startup timeline summary and quit once the first page loads.
         """
         super().__init__()
+        self.profile_startup = profile_startup
 
         # Core state flags
         self.is_updating_minimap = False
-        self.login_needed = True
         self.webview_loaded = False
         self.splash = None
+        self.compiled_css = None  # Active CSS profile's stylesheet, compiled on first use
+        self.move_queue = MoveQueue()
 
         # Initialize character coordinates
         self.character_x = None
@@ -28,28 +43,92 @@ class RBCCommunityMap(QMainWindow):
         self.selected_character = None
         self.destination = None
 
-        # Initialize essential components early
-        self._init_data()
-        self._init_scraper()
-        self._init_window_properties()
-        self._init_web_profile()
+        # Database reads; none of these touch widgets
+        self.startup_graph = StartupGraph()
+        self.startup_graph.add('load_data', lambda: load_catalog(DB_PATH))
+        self.startup_graph.add('theme_read', self.read_theme_settings)
+        self.startup_graph.add('characters_read', self.read_characters)
+        self.startup_graph.add('cookies_read', self.read_stored_cookies)
+
+        # Boot the web engine and start the first navigation while the reads run
+        with startup_timeline.stage('web_profile'):
+            self._init_web_profile()
+        with startup_timeline.stage('webview'):
+            self._init_webview()
+        with startup_timeline.stage('cookie_load'):
+            self.load_cookies(self.startup_graph.result('cookies_read', []))
+        with startup_timeline.stage('navigation'):
+            self.website_frame.setUrl(QUrl('https://quiz.ravenblack.net/blood.pl'))
+        with startup_timeline.stage('window_properties'):
+            self._init_window_properties()
+
+        # Apply worker results as each stage needs them
+        with startup_timeline.stage('data'):
+            self._init_data()
+        with startup_timeline.stage('theme'):
+            self._init_theme()
+        with startup_timeline.stage('scraper_init'):
+            self._init_scraper()
 
         # UI and character setup
-        self._init_ui_state()
-        self._init_characters()
-        self._init_ui_components()
+        with startup_timeline.stage('ui_state'):
+            self._init_ui_state()
+        with startup_timeline.stage('characters'):
+            self._init_characters()
+        with startup_timeline.stage('ui_build'):
+            self._init_ui_components()
+        self.startup_graph.shutdown()
 
         # Final setup steps
-        self._finalize_setup()
+        with startup_timeline.stage('finalize'):
+            self._finalize_setup()
 
     @splash_message(None)
     def _init_scraper(self) -> None:
-        """Initialize the AVITD scraper and start scraping in a separate thread."""
-        self.AVITD_scraper = AVITDScraper()
-        # Use QThread for non-blocking scraping (assuming AVITDScraper supports it)
-        from PySide6.QtCore import QThreadPool
-        QThreadPool.globalInstance().start(lambda: self.AVITD_scraper.scrape_guilds_and_shops())
-        logging.debug("Started scraper in background thread")
+        """Schedule AVITD scrapes from the stored next_update times; nothing is fetched while data is fresh."""
+        self.scrape_scheduler = ScrapeScheduler(self.scrape_avitd, DB_PATH, self)
+        self.scrape_scheduler.data_refreshed.connect(self.apply_location_changes)
+        self.scrape_scheduler.start()
+
+    def scrape_avitd(self, progress=None) -> dict[str, dict[str, list]]:
+        """
+        Ingest AVITD and community location feeds with a scraper owned by the calling thread.
+
+        Runs on a ScrapeWorker thread; touches no widgets, and the scraper's SQLite
+        connection is opened and closed on that thread.
+
+        Args:
+            progress (Callable[[str], None], optional): Receives progress messages.
+
+        Returns:
+            dict[str, dict[str, list]]: Changes per table; empty if the page was unchanged.
+        """
+        scraper = AVITDScraper()
+        try:
+            return scraper.scrape_guilds_and_shops(progress)
+        finally:
+            scraper.close_connection()
+
+    def apply_location_changes(self, changes: dict) -> None:
+        """
+        Apply a scrape's added/moved/removed locations to the in-memory coordinates and redraw the minimap.
+
+        Args:
+            changes (dict): {table: {'added': [...], 'moved': [...], 'removed': [...]}}.
+        """
+        invalidate_catalog()
+        for table, attribute in (('shops', 'shops_coordinates'), ('guilds', 'guilds_coordinates'),
+                                 ('taverns', 'taverns_coordinates'),
+                                 ('userbuildings', 'user_buildings_coordinates'),
+                                 ('placesofinterest', 'places_of_interest_coordinates')):
+            table_changes = changes.get(table, {})
+            coordinates = getattr(self, attribute)
+            for name, col, row in table_changes.get('added', []) + table_changes.get('moved', []):
+                coordinates[name] = (self.columns.get(col, 0) + 1, self.rows.get(row, 0) + 1)
+            for name in table_changes.get('removed', []):
+                coordinates.pop(name, None)
+        self.update_minimap()
+        logging.info(f"Locations updated from scrape: {', '.join(sorted(changes))}")
 
     @splash_message(None)
     def _init_window_properties(self) -> None:
@@ -58,17 +137,23 @@ class RBCCommunityMap(QMainWindow):
             self.setWindowIcon(QIcon('images/favicon.ico'))
             self.setWindowTitle('RBC Community Map')
             self.setGeometry(100, 100, 1200, 800)
-            self.load_theme_settings()
-            self.apply_theme()
         except Exception as e:
             logging.error(f"Failed to set window properties: {e}")
             # Fallback to default icon/title if needed
             self.setWindowTitle('RBC Community Map (Fallback)')
 
+    @splash_message(None)
+    def _init_theme(self) -> None:
+        """Apply the saved theme on top of the catalog color mappings."""
+        self.load_theme_settings(self.startup_graph.result('theme_read', {}))
+        self.apply_theme()
+
     @splash_message(None)
     def _init_web_profile(self) -> None:
-        """Set up QWebEngineProfile for cookie handling."""
+        """Set up QWebEngineProfile for cookie handling, request filtering and the HTTP cache."""
         self.web_profile = QWebEngineProfile.defaultProfile()
+        self.setup_request_filter()
+        self.configure_profile(self.web_profile, 'default')
         cookie_storage_path = os.path.join(os.getcwd(), 'sessions')
         try:
             os.makedirs(cookie_storage_path, exist_ok=True)
@@ -79,18 +164,30 @@ class RBCCommunityMap(QMainWindow):
             logging.error(f"Failed to set up cookie storage at {cookie_storage_path}: {e}")
             # Continue with in-memory cookies if storage fails
 
+    @splash_message(None)
+    def _init_webview(self) -> None:
+        """Create the web view; __init__ starts the single startup navigation once the cookies are in."""
+        # The window owns the page, so it survives being swapped out for another character's
+        page = QWebEnginePage(self.web_profile, self)
+        self.configure_page(page)  # Disables GPU-related features
+        self.website_frame = QWebEngineView()
+        self.website_frame.setPage(page)
+        self.website_frame.loadStarted.connect(self.on_webview_load_started)
+        self.website_frame.loadFinished.connect(self.on_webview_load_finished)
+
     @splash_message(None)
     def _init_data(self) -> None:
         """Load initial data from the database with fallback."""
-        try:
+        catalog = self.startup_graph.result('load_data')
+        if catalog:
             (
                 self.columns, self.rows, self.banks_coordinates, self.taverns_coordinates,
                 self.transits_coordinates, self.user_buildings_coordinates, self.color_mappings,
                 self.shops_coordinates, self.guilds_coordinates, self.places_of_interest_coordinates,
                 self.keybind_config, self.current_css_profile
-            ) = load_data(DB_PATH)
-        except sqlite3.Error as e:
-            logging.critical(f"Failed to load initial data: {e}")
+            ) = catalog
+        else:
+            logging.critical("Failed to load initial data")
             # Use fallback data from load_data (already implemented)
             self.columns, self.rows, self.banks_coordinates, self.taverns_coordinates, \
             self.transits_coordinates, self.user_buildings_coordinates, self.color_mappings, \
@@ -115,7 +212,7 @@ class RBCCommunityMap(QMainWindow):
         self.characters = []
         self.character_list = QListWidget()
         self.selected_character = None
-        self.load_characters()
+        self.load_characters(self.startup_graph.result('characters_read'))
         if not self.characters:
             self.firstrun_character_creation()
 
@@ -130,6 +227,8 @@ class RBCCommunityMap(QMainWindow):
         """Complete initialization with UI display and final configurations."""
         self.show()
         self.update_minimap()
+        self.init_character_sessions()
+        self.init_page_load_telemetry()
         self.load_last_active_character()
         self.setup_keybindings()
         self.setFocusPolicy(Qt.StrongFocus)
@@ -137,17 +236,41 @@ class RBCCommunityMap(QMainWindow):
             self.website_frame.setFocusPolicy(Qt.StrongFocus)
         else:
             logging.warning("website_frame not initialized before focus setup")
-        css = self.load_current_css()
-        self.apply_custom_css(css)
 
-    def load_current_css(self) -> str:
-        """Load CSS for the current profile from the database."""
+        # Index new log lines for LogViewer search in the background
+        self.log_search_indexer = LogSearchIndexer(LOG_DIR, LOG_SEARCH_DB)
+        self.log_search_indexer.start()
+        QApplication.instance().aboutToQuit.connect(self.log_search_indexer.stop)
+        if self.profile_startup:
+            # Don't wait forever for a page that never loads (e.g. offline)
+            QTimer.singleShot(STARTUP_PROFILE_TIMEOUT_MS, self.finish_startup_timeline)
+
+    def finish_startup_timeline(self) -> None:
+        """
+        Persist the startup timeline once startup is complete.
+
+        In --profile-startup mode, also print the timeline summary and quit.
+        """
+        if not startup_timeline.save(DB_PATH):
+            return
+        if self.profile_startup:
+            print(summarize_startup_metrics(DB_PATH))
+            QApplication.quit()
+
+    def load_current_css(self, profile: str | None = None) -> str:
+        """
+        Load CSS for a profile from the database.
+
+        Args:
+            profile (str, optional): CSS profile name; the saved css_profile setting if None.
+        """
         try:
             with sqlite3.connect(DB_PATH) as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT setting_value FROM settings WHERE setting_name = 'css_profile'")
-                result = cursor.fetchone()
-                profile = result[0] if result else "Default"
+                if profile is None:
+                    cursor.execute("SELECT setting_value FROM settings WHERE setting_name = 'css_profile'")
+                    result = cursor.fetchone()
+                    profile = result[0] if result else "Default"
                 cursor.execute("SELECT element, value FROM custom_css WHERE profile_name = ?", (profile,))
                 return "\n".join(f"{elem} {{ {val} }}" for elem, val in cursor.fetchall())
         except sqlite3.Error as e:
@@ -91,6 +91,14 @@
         self.log_viewer = LogViewer(self, LOG_DIR)  # or pass None if you want it fully standalone
         self.log_viewer.show()
 
+    def open_log_analytics(self):
+        self.log_analytics = LogAnalyticsDialog(self, LOG_DIR)
+        self.log_analytics.show()
+
+    def open_page_load_stats(self):
+        self.page_load_stats = PageLoadStatsDialog(self, DB_PATH)
+        self.page_load_stats.show()
+
     def fetch_table_data(self, cursor, table_name):
         """
         Fetch data from the specified table and return it as a list of tuples, including column names.
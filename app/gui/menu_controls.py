@@ -97,6 +97,17 @@
         current_level = get_logging_level_from_db()
         for level, action in self.log_level_actions.items():
             action.setChecked(level == current_level)
+        self.trace_hot_paths_action.setChecked(tracing_enabled())
+
+    def set_hot_path_tracing(self, enabled: bool) -> None:
+        """
+        Turn full tracing of hot paths on or off for this session.
+
+        While on, draw_minimap and page parsing log every message at DEBUG instead of
+        a rate-limited sample.
+        """
+        set_tracing(enabled)
+        self.update_log_level_menu()
 
     def set_log_level(self, level: int) -> None:
         """
@@ -118,3 +129,44 @@
 
         except sqlite3.Error as e:
             logging.error(f"Failed to save log level to database: {e}")
+
+    def update_request_filter_menu(self) -> None:
+        """Update the check state of the request filter actions."""
+        self.request_filter_action.setChecked(self.request_interceptor.enabled)
+        self.block_images_action.setChecked(self.request_interceptor.rules.block_images)
+
+    def set_request_filter(self, enabled: bool) -> None:
+        """
+        Turn request blocking on or off and persist it.
+
+        Page loads are logged with the filter state, so the log analytics report
+        shows load times with and without it.
+        """
+        self.request_interceptor.enabled = enabled
+        self.save_request_filter_setting('request_filter', '1' if enabled else '0')
+        self.update_request_filter_menu()
+        logging.info(f"Request filter {'enabled' if enabled else 'disabled'}")
+
+    def set_block_images(self, enabled: bool) -> None:
+        """Block (or stop blocking) images not allowed by a rule, and persist it."""
+        rules = self.request_interceptor.rules
+        self.request_interceptor.rules = RequestRules(rules.text, enabled)
+        self.save_request_filter_setting('block_images', '1' if enabled else '0')
+        self.update_request_filter_menu()
+        logging.info(f"Image blocking {'enabled' if enabled else 'disabled'}")
+
+    def edit_request_rules(self) -> None:
+        """Edit the allow/block rules; an empty text restores the defaults."""
+        rules = self.request_interceptor.rules
+        text, ok = QInputDialog.getMultiLineText(
+            self, "Request Filter Rules",
+            "One rule per line: 'block <host or URL part>' or 'allow <host or URL part>'.\n"
+            "Allow rules win. Leave empty to restore the defaults.",
+            rules.text
+        )
+        if not ok:
+            return
+        text = text if text.strip() else DEFAULT_REQUEST_RULES
+        self.request_interceptor.rules = RequestRules(text, rules.block_images)
+        self.save_request_filter_setting('request_rules', '' if text == DEFAULT_REQUEST_RULES else text)
+        logging.info("Request filter rules updated")
@@ -6,6 +6,7 @@
         Draws the minimap with various features such as special locations and lines to nearest locations,
         with cell lines and dynamically scaled text size.
         """
+        started = time.perf_counter()
         pixmap = QPixmap(self.minimap_size, self.minimap_size)
         painter = QPainter(pixmap)
         painter.fillRect(0, 0, self.minimap_size, self.minimap_size, QColor('lightgrey'))
@@ -20,7 +21,7 @@
 
         font_metrics = QFontMetrics(font)
 
-        logging.debug(f"Drawing minimap with column_start={self.column_start}, row_start={self.row_start}, "f"zoom_level={self.zoom_level}, block_size={block_size}")
+        MINIMAP_LOG.debug("Drawing minimap with column_start=%s, row_start=%s, zoom_level=%s, block_size=%s", self.column_start, self.row_start, self.zoom_level, block_size)
 
         def draw_label_box(x, y, width, height, bg_color, text):
             """
@@ -50,7 +51,7 @@
                 row_index = self.row_start + i
 
                 x0, y0 = j * block_size, i * block_size
-                logging.debug(f"Drawing grid cell at column_index={column_index}, row_index={row_index}, "f"x0={x0}, y0={y0}")
+                MINIMAP_LOG.debug("Drawing grid cell at column_index=%s, row_index=%s, x0=%s, y0=%s", column_index, row_index, x0, y0)
 
                 # Draw the cell background
                 painter.setPen(QColor('white'))
@@ -200,6 +201,9 @@
 
             painter.end()
             self.minimap_label.setPixmap(pixmap)
+            startup_timeline.mark_once('first_minimap_paint')
+
+        MINIMAP_LOG.info("Minimap rendered in %.1f ms", (time.perf_counter() - started) * 1000)
 
     def update_minimap(self):
         """
@@ -365,7 +369,7 @@
             logging.error("Character position not set. Cannot recenter minimap.")
             return
 
-        logging.debug(f"Before recentering: character_x={self.character_x}, character_y={self.character_y}")
+        MINIMAP_LOG.debug("Before recentering: character_x=%s, character_y=%s", self.character_x, self.character_y)
 
         # Calculate zoom offset (-1 for 5x5, -2 for 7x7, etc.)
         if self.zoom_level == 3:
@@ -376,15 +380,15 @@
             zoom_offset = -3
         else:
             zoom_offset = -(self.zoom_level // 2)  # Safe fallback
-        logging.debug(f"Zoom Level: {self.zoom_level}")
-        logging.debug(f"Zoom Offset: {zoom_offset}")
-        logging.debug(f"Debug: char_y={self.character_y}, row_start={self.row_start}, zoom_offset={zoom_offset}")
-        logging.debug(f"Clamping min: {min(self.character_y + zoom_offset, 200 - self.zoom_level)}")
+        MINIMAP_LOG.debug("Zoom Level: %s", self.zoom_level)
+        MINIMAP_LOG.debug("Zoom Offset: %s", zoom_offset)
+        MINIMAP_LOG.debug("Debug: char_y=%s, row_start=%s, zoom_offset=%s", self.character_y, self.row_start, zoom_offset)
+        MINIMAP_LOG.debug("Clamping min: %s", min(self.character_y + zoom_offset, 200 - self.zoom_level))
 
         self.column_start = self.character_x + 1
         self.row_start = self.character_y + 1
 
-        logging.debug(f"Recentered minimap: x={self.character_x}, y={self.character_y}, col_start={self.column_start}, row_start={self.row_start}")
+        MINIMAP_LOG.debug("Recentered minimap: x=%s, y=%s, col_start=%s, row_start=%s", self.character_x, self.character_y, self.column_start, self.row_start)
         self.update_minimap()
 
     def go_to_location(self):
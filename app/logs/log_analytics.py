@@ -0,0 +1,302 @@
+# app/logs/log_analytics.py
+"""
+RBCMap Log Analytics
+
+Aggregates every daily log into one report:
+
+- lines per level,
+- page loads per hour,
+- page parse, minimap render and character switch timings ("Page parsed
+  in X ms", "Minimap rendered in X ms", "Character switch to ... logged in
+  after X ms"),
+- page load times with the request filter on and off ("Page loaded in
+  X ms (request filter on|off, ...)"),
+- scraper failures,
+- coin events (deposits, withdrawals, gains, losses, updates) and amounts,
+- warnings and errors per component.
+
+Logs are split into byte ranges aligned on line boundaries and analyzed in
+parallel on a process pool; each worker scans its range with regexes built
+from LOG_FORMAT, so only interesting lines reach Python code. The partial
+reports are then merged.
+
+LOG_FORMAT has no module field and most code logs through the root logger,
+so components come from the logger name when the format includes
+%(name)s, and otherwise from keywords in the message (COMPONENT_KEYWORDS).
+
+See LICENSE for usage restrictions.
+"""
+
+import csv
+import os
+import re
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Byte range analyzed by one task; large logs are split so every process has work
+TASK_BYTES = 16 * 1024 * 1024
+
+LOG_FILE_PATTERN = re.compile(r'^rbc_\d{4}-\d\d-\d\d\.log(\.\d+\.gz)?$')
+
+# Field patterns for the LOG_FORMAT placeholders a header may contain
+FORMAT_FIELDS = {
+    'asctime': r'(?P<hour>\d{4}-\d\d-\d\d \d\d):\d\d:\d\d,\d+',
+    'levelname': r'(?P<level>DEBUG|INFO|WARNING|ERROR|CRITICAL)',
+    'name': r'(?P<name>[\w.]+)',
+    'module': r'(?P<name>[\w.]+)',
+}
+
+# First matching keyword wins; checked against the lower-cased message
+COMPONENT_KEYWORDS = (
+    ('scraper', ('scrape', 'avitd', 'fetch failed', 'cache validators', 'next update', 'feed')),
+    ('cookies', ('cookie',)),
+    ('database', ('database', 'sqlite', 'table', 'snapshot', 'catalog')),
+    ('minimap', ('minimap', 'zoom', 'recenter')),
+    ('webview', ('webpage', 'html', 'javascript', 'console', 'webview')),
+    ('characters', ('character', 'login')),
+    ('theme', ('theme', 'css')),
+    ('logging', ('log',)),
+)
+
+# Message patterns for the events counted; each names exactly one group
+EVENT_PATTERNS = {
+    'page_load': r'Webpage loaded successfully',
+    'page_parse_ms': r'Page parsed in (?P<page_parse_ms>[\d.]+) ms',
+    'minimap_render_ms': r'Minimap rendered in (?P<minimap_render_ms>[\d.]+) ms',
+    'page_load_filter_on_ms': r'Page loaded in (?P<page_load_filter_on_ms>[\d.]+) ms \(request filter on',
+    'page_load_filter_off_ms': r'Page loaded in (?P<page_load_filter_off_ms>[\d.]+) ms \(request filter off',
+    'character_switch_ms': r"Character switch to '.*' logged in after (?P<character_switch_ms>[\d.]+) ms",
+    'move_ms': r'Move \d completed in (?P<move_ms>[\d.]+) ms',
+    'deposit': r'Deposit found: (?P<deposit>\d+) coins',
+    'withdrawal': r'Withdrawal found: (?P<withdrawal>\d+) coins',
+    'gained': r'Gained (?P<gained>\d+) coins from',
+    'lost': r'Lost (?P<lost>\d+) coins to',
+    'coin_update': r'Updated coins for character ID',
+    'scrape_failed': r'(?P<scrape_failed>Scrape failed: .*|\S+: fetch failed: .*|Failed to update \w+: .*)',
+}
+COIN_EVENTS = ('deposit', 'withdrawal', 'gained', 'lost', 'coin_update')
+TIMINGS = ('page_parse_ms', 'minimap_render_ms', 'character_switch_ms', 'page_load_filter_on_ms',
+           'page_load_filter_off_ms', 'move_ms')
+
+
+def header_pattern(log_format: str) -> str:
+    """
+    Regex for the part of a LOG_FORMAT line before the message.
+
+    Raises:
+        ValueError: If the format doesn't end with %(message)s or uses an unknown placeholder.
+    """
+    if not log_format.endswith('%(message)s'):
+        raise ValueError(f"LOG_FORMAT must end with %(message)s: {log_format!r}")
+    pattern = ''
+    for literal, field in re.findall(r'(.*?)%\((\w+)\)s', log_format[:-len('%(message)s')] + '%(end)s'):
+        pattern += re.escape(literal)
+        if field == 'end':
+            break
+        if field not in FORMAT_FIELDS:
+            raise ValueError(f"Unsupported LOG_FORMAT field for analytics: {field}")
+        pattern += FORMAT_FIELDS[field]
+    return pattern
+
+
+def compile_patterns(log_format: str) -> tuple[re.Pattern, re.Pattern]:
+    """(problem line pattern, event line pattern) as bytes regexes for one LOG_FORMAT."""
+    header = header_pattern(log_format)
+    problems = header.replace(FORMAT_FIELDS['levelname'], r'(?P<level>WARNING|ERROR|CRITICAL)')
+    events = '|'.join(f'(?:{pattern})' if '(?P<' in pattern else f'(?P<{event}>{pattern})'
+                      for event, pattern in EVENT_PATTERNS.items())
+    return (re.compile(f'^{problems}(?P<message>[^\\n]*)'.encode(), re.M),
+            re.compile(f'^{header}(?:{events})'.encode(), re.M))
+
+
+def level_markers(log_format: str) -> dict[str, bytes]:
+    """
+    Bytes that mark each level in a record line, e.g. b' - INFO - ' for LOG_FORMAT.
+
+    Counting these is much faster than matching every line; continuation lines
+    (tracebacks) never contain them.
+    """
+    before, _, after = log_format.partition('%(levelname)s')
+    before = re.split(r'%\(\w+\)s', before)[-1]
+    after = re.split(r'%\(\w+\)s', after)[0]
+    return {level: f'{before}{level}{after}'.encode()
+            for level in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+
+def component_of(message: str, name: str | None = None) -> str:
+    """Component a warning or error belongs to."""
+    if name and name != 'root':
+        return name
+    lowered = message.lower()
+    for component, keywords in COMPONENT_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return component
+    return 'other'
+
+
+def empty_report() -> dict:
+    return {
+        'files': set(),
+        'bytes': 0,
+        'levels': Counter(),
+        'page_loads_by_hour': Counter(),
+        'timings': {timing: [] for timing in TIMINGS},
+        'coin_events': Counter(),
+        'coin_amounts': Counter(),
+        'scraper_failures': Counter(),
+        'problems': Counter(),  # (component, level) -> count
+    }
+
+
+def analyze_range(path: str, start: int, end: int, log_format: str) -> dict:
+    """
+    Analyze the lines starting in [start, end) of one log (a process pool task).
+
+    Returns:
+        dict: A partial report (see empty_report).
+    """
+    problems_pattern, events_pattern = compile_patterns(log_format)
+    report = empty_report()
+    report['files'].add(os.path.basename(path))
+
+    if path.endswith('.gz'):
+        import gzip
+        with gzip.open(path, 'rb') as f:
+            data = f.read()
+    else:
+        with open(path, 'rb') as f:
+            if start:
+                f.seek(start - 1)
+                if f.read(1) != b'\n':
+                    f.readline()  # Mid-line: that line belongs to the previous range
+            data = f.read(end - f.tell()) if f.tell() < end else b''
+            if data and not data.endswith(b'\n'):
+                data += f.readline()  # Finish the last line started in range
+    report['bytes'] = len(data)
+
+    for level, marker in level_markers(log_format).items():
+        count = data.count(marker)
+        if count:
+            report['levels'][level] = count
+
+    for match in problems_pattern.finditer(data):
+        message = match['message'].decode('utf-8', 'replace')
+        name = match.groupdict().get('name')
+        report['problems'][(component_of(message, name and name.decode()), match['level'].decode())] += 1
+
+    for match in events_pattern.finditer(data):
+        event = match.lastgroup
+        value = match[event]
+        if event == 'page_load':
+            report['page_loads_by_hour'][match['hour'].decode()] += 1
+        elif event in TIMINGS:
+            report['timings'][event].append(float(value))
+        elif event == 'coin_update':
+            report['coin_events'][event] += 1
+        elif event in COIN_EVENTS:
+            report['coin_events'][event] += 1
+            report['coin_amounts'][event] += int(value)
+        elif event == 'scrape_failed':
+            # Group by the failure, not the details after the last colon
+            report['scraper_failures'][value.decode('utf-8', 'replace').rsplit(':', 1)[0]] += 1
+    return report
+
+
+def merge_reports(reports) -> dict:
+    """Merge partial reports into one."""
+    merged = empty_report()
+    for report in reports:
+        merged['files'] |= report['files']
+        merged['bytes'] += report['bytes']
+        for key in ('levels', 'page_loads_by_hour', 'coin_events', 'coin_amounts', 'scraper_failures', 'problems'):
+            merged[key].update(report[key])
+        for timing in TIMINGS:
+            merged['timings'][timing].extend(report['timings'][timing])
+    return merged
+
+
+def plan_tasks(log_dir: str, task_bytes: int = TASK_BYTES) -> list[tuple[str, int, int]]:
+    """Split every daily log (and its rollovers) in log_dir into (path, start, end) byte ranges."""
+    tasks = []
+    for name in sorted(os.listdir(log_dir)):
+        if not LOG_FILE_PATTERN.match(name):
+            continue
+        path = os.path.join(log_dir, name)
+        size = os.path.getsize(path)
+        if name.endswith('.gz'):
+            tasks.append((path, 0, size))  # Compressed: can't seek into it
+            continue
+        for start in range(0, size, task_bytes):
+            tasks.append((path, start, min(start + task_bytes, size)))
+    return tasks
+
+
+def analyze_logs(log_dir: str, log_format: str, max_workers: int | None = None,
+                 task_bytes: int = TASK_BYTES) -> dict:
+    """
+    Analyze every daily log in log_dir on a process pool.
+
+    Args:
+        log_dir (str): Directory of rbc_YYYY-MM-DD.log files.
+        log_format (str): The LOG_FORMAT the logs were written with.
+        max_workers (int, optional): Processes to use; defaults to the CPU count.
+        task_bytes (int, optional): Bytes per task.
+
+    Returns:
+        dict: The merged report.
+    """
+    compile_patterns(log_format)  # Fail here, not in every worker
+    tasks = plan_tasks(log_dir, task_bytes)
+    if not tasks:
+        return empty_report()
+    if max_workers == 1 or len(tasks) == 1:
+        return merge_reports(analyze_range(path, start, end, log_format) for path, start, end in tasks)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        paths, starts, ends = zip(*tasks)
+        return merge_reports(executor.map(analyze_range, paths, starts, ends, [log_format] * len(tasks)))
+
+
+def timing_summary(values: list[float]) -> dict[str, float]:
+    """count, mean, p50, p95 and max of a list of timings (empty dict if none)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        'count': len(ordered),
+        'mean': statistics.fmean(ordered),
+        'p50': ordered[len(ordered) // 2],
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'max': ordered[-1],
+    }
+
+
+def summary_rows(report: dict) -> list[tuple[str, str, str]]:
+    """
+    Flatten a report into (section, key, value) rows, for the summary view and CSV.
+    """
+    rows = [
+        ('Overview', 'Files', str(len(report['files']))),
+        ('Overview', 'Megabytes', f"{report['bytes'] / 1e6:.1f}"),
+        ('Overview', 'Page loads', str(sum(report['page_loads_by_hour'].values()))),
+    ]
+    rows += [('Lines per level', level, str(count)) for level, count in sorted(report['levels'].items())]
+    for timing in TIMINGS:
+        for stat, value in timing_summary(report['timings'][timing]).items():
+            rows.append(('Timings', f"{timing} {stat}", f"{value:.1f}" if stat != 'count' else str(value)))
+    rows += [('Coin events', event, f"{count} ({report['coin_amounts'][event]} coins)"
+              if event in report['coin_amounts'] else str(count))
+             for event, count in sorted(report['coin_events'].items())]
+    rows += [('Scraper failures', failure, str(count)) for failure, count in report['scraper_failures'].most_common()]
+    rows += [('Problems by component', f"{component} {level}", str(count))
+             for (component, level), count in sorted(report['problems'].items())]
+    rows += [('Page loads per hour', hour, str(count)) for hour, count in sorted(report['page_loads_by_hour'].items())]
+    return rows
+
+
+def write_csv(report: dict, path: str) -> None:
+    """Write the summary rows of a report to a CSV file."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['section', 'key', 'value'])
+        writer.writerows(summary_rows(report))
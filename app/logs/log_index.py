@@ -0,0 +1,177 @@
+# app/logs/log_index.py
+"""
+RBCMap Log Index
+
+Memory-maps a log file and indexes it in one pass: the byte offset where
+each line starts and the level of each line (continuation lines such as
+tracebacks take the level of the record they belong to). Lines are
+decoded only when asked for, so a view shows a multi-MB log by reading
+just the rows on screen, and filtering by level works on the index
+without touching the text.
+
+refresh() indexes lines appended since the last call, for following a
+live log. A followed log isn't mapped: each appended range is read into
+memory with a short-lived open, so the file is never held open while the
+log handler renames it on rollover (which fails on Windows if it is).
+Rolled-over '.gz' logs are decompressed into memory and indexed the same
+way.
+
+See LICENSE for usage restrictions.
+"""
+
+import gzip
+import mmap
+import os
+import re
+from array import array
+from itertools import compress
+
+# Level codes stored in the index; 0 is a line with no level of its own
+LEVELS = ('', 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+LEVEL_CODES = {name: code for code, name in enumerate(LEVELS)}
+
+# One match per complete line; group 1 is the level of a LOG_FORMAT record line
+LINE_PATTERN = re.compile(
+    rb'^(?:\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d+ - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - )?[^\n]*\n', re.M
+)
+_CODES_BY_GROUP = {level.encode(): code for level, code in LEVEL_CODES.items() if level}
+
+
+class LogIndex:
+    """Line-offset and level index over a memory-mapped log file."""
+
+    def __init__(self, path: str, following: bool = False) -> None:
+        """
+        Map and index a log file.
+
+        Args:
+            path (str): Log file; names ending in '.gz' are decompressed into memory.
+            following (bool, optional): Read the file into memory instead of mapping it (see follow).
+
+        Raises:
+            OSError: If the file can't be opened or mapped.
+        """
+        self.path = path
+        self.compressed = path.endswith('.gz')
+        self.following = following and not self.compressed
+        self.offsets = array('Q')  # Start of each line, plus the end of the last one
+        self.levels = bytearray()  # Level code of each line
+        self._file = None
+        self._buffer = bytearray() if self.following else b''
+        self._reset()
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def _reset(self) -> None:
+        self.offsets = array('Q', [0])
+        self.levels = bytearray()
+
+    def _map(self) -> int:
+        """(Re)map the file at its current size; returns the size."""
+        if self.compressed:
+            if not self._buffer:
+                with gzip.open(self.path, 'rb') as f:
+                    self._buffer = f.read()
+            return len(self._buffer)
+
+        size = os.path.getsize(self.path)
+        if self.following:
+            if size < len(self._buffer):  # Cleared or rolled over
+                self._buffer = bytearray()
+            if size > len(self._buffer):
+                with open(self.path, 'rb') as f:
+                    f.seek(len(self._buffer))
+                    self._buffer += f.read(size - len(self._buffer))
+            return len(self._buffer)
+        if size != len(self._buffer):
+            self._unmap()
+            if size:
+                self._file = open(self.path, 'rb')
+                self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return size
+
+    def _unmap(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b''
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        """Release the mapping, so the file can be deleted or rolled over."""
+        self._unmap()
+
+    def follow(self) -> None:
+        """
+        Switch to following a live log: drop the mapping and keep the indexed text in memory,
+        reading appended ranges on refresh without holding the file open.
+        """
+        if self.following or self.compressed:
+            return
+        text = bytearray(self._buffer[:self.offsets[-1]])
+        self._unmap()
+        self._buffer = text
+        self.following = True
+
+    def refresh(self) -> tuple[int, int] | None:
+        """
+        Index complete lines added since the last call.
+
+        A file that shrank (cleared or rolled over) is indexed again from the start.
+
+        Returns:
+            tuple[int, int] | None: (first, last + 1) line numbers added, where first == 0
+            means the index was (re)built from the start; None if there is nothing new.
+        """
+        indexed_end = self.offsets[-1]
+        size = self._map()
+        rebuilt = size < indexed_end
+        if rebuilt:
+            self._reset()
+            indexed_end = 0
+        start = len(self.levels)
+
+        previous = self.levels[-1] if self.levels else 0
+        new_offsets, new_levels = [], bytearray()
+        if size > indexed_end:
+            for match in LINE_PATTERN.finditer(self._buffer, indexed_end):
+                level = match.group(1)
+                previous = _CODES_BY_GROUP[level] if level else previous
+                new_offsets.append(match.end())
+                new_levels.append(previous)
+        if not new_levels:
+            return (0, 0) if rebuilt else None
+        self.offsets.extend(new_offsets)
+        self.levels.extend(new_levels)
+        return start, len(self.levels)
+
+    def line(self, number: int) -> str:
+        """Decode one line, without its line ending."""
+        return self._buffer[self.offsets[number]:self.offsets[number + 1]].decode('utf-8', 'replace').rstrip('\r\n')
+
+    def level(self, number: int) -> str:
+        """Level name of a line ('' before the first record)."""
+        return LEVELS[self.levels[number]]
+
+    def matching(self, levels: set[str], start: int = 0, stop: int | None = None) -> array:
+        """
+        Line numbers whose level is in levels, from the index alone.
+
+        Args:
+            levels (set[str]): Level names to keep.
+            start (int, optional): First line to consider.
+            stop (int, optional): Line to stop before; defaults to the end.
+
+        Returns:
+            array: Matching line numbers ('I' typecode), ascending.
+        """
+        keep = bytearray(256)  # translate() table: level code -> 1 to keep the line
+        for code, name in enumerate(LEVELS):
+            keep[code] = 1 if name in levels else 0
+        keep[0] = 1 if levels else 0  # Lines before the first record show with any level
+        stop = len(self.levels) if stop is None else stop
+        mask = self.levels[start:stop].translate(keep)
+        return array('I', compress(range(start, stop), mask))
@@ -0,0 +1,358 @@
+# app/logs/log_search.py
+"""
+RBCMap Log Search
+
+Full-text index over every daily log in LOG_DIR, kept in its own SQLite
+database (FTS5) so weeks of logs can be searched in milliseconds.
+
+- log_fts: FTS5 table of message text, rowid = log_records.id
+- log_records: timestamp, level, file and byte offset of each line,
+  indexed by timestamp for time-range filters
+- log_files: per-file byte offset already indexed, so each pass reads
+  only what was appended since the last one
+- log_backups: the current name of each indexed .gz backup
+
+Each line is one record; continuation lines (tracebacks) carry the
+timestamp and level of the record they belong to. A log that shrinks
+(cleared, or rolled over to a .gz backup) is read again from the start,
+and its earlier lines are dropped from the index: their offsets point
+into a file that no longer holds them. The rolled-over lines come back
+with the backup, which is indexed once by the digest of its content
+(offsets into the decompressed text), since backups are renumbered on
+every rollover (name.log.1.gz becomes name.log.2.gz, ...); each pass
+only updates the name a digest is found under, and drops backups that
+were deleted.
+
+LogSearchIndexer runs the ingestion on a background thread, periodically
+and on request.
+
+See LICENSE for usage restrictions.
+"""
+
+import gzip
+import hashlib
+import io
+import logging
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from typing import Callable
+
+# Bytes read per ingestion step, to bound memory on a first pass over large logs
+INGEST_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Seconds between background ingestion passes
+INDEX_INTERVAL_S = 60
+
+# Longest LogSearchIndexer.stop waits for the pass in progress to reach the next file
+STOP_TIMEOUT_S = 5
+
+# Results returned by a search
+SEARCH_LIMIT = 500
+
+LOG_FILE_PATTERN = re.compile(r'^rbc_\d{4}-\d\d-\d\d\.log$')
+BACKUP_FILE_PATTERN = re.compile(r'^rbc_\d{4}-\d\d-\d\d\.log\.\d+\.gz$')
+RECORD_PATTERN = re.compile(
+    rb'^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),(\d+) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$'
+)
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS log_files (
+        name TEXT PRIMARY KEY,
+        offset INTEGER NOT NULL DEFAULT 0,
+        last_logged_at TEXT,
+        last_level TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS log_records (
+        id INTEGER PRIMARY KEY,
+        logged_at TEXT NOT NULL,
+        level TEXT NOT NULL,
+        file TEXT NOT NULL,
+        offset INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_log_records_logged_at ON log_records(logged_at)",
+    "CREATE INDEX IF NOT EXISTS idx_log_records_file ON log_records(file)",
+    """CREATE TABLE IF NOT EXISTS log_backups (
+        digest TEXT PRIMARY KEY,
+        name TEXT NOT NULL
+    )""",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5(message, tokenize = 'unicode61')",
+)
+
+
+def connect_log_search(db_path: str) -> sqlite3.Connection:
+    """
+    Open (creating if needed) the search database.
+
+    WAL lets the viewer search while the indexer writes.
+    """
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for statement in SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def drop_file(conn: sqlite3.Connection, name: str) -> None:
+    """Remove every indexed line of a file (by name, or digest for a backup) from the index."""
+    with conn:
+        conn.execute("DELETE FROM log_fts WHERE rowid IN (SELECT id FROM log_records WHERE file = ?)", (name,))
+        conn.execute("DELETE FROM log_records WHERE file = ?", (name,))
+        conn.execute("DELETE FROM log_files WHERE name = ?", (name,))
+        conn.execute("DELETE FROM log_backups WHERE digest = ?", (name,))
+
+
+def ingest_file(conn: sqlite3.Connection, path: str, key: str | None = None, data: bytes | None = None) -> int:
+    """
+    Index the complete lines appended to one log since the last call.
+
+    Args:
+        conn (sqlite3.Connection): Search database connection.
+        path (str): Log file.
+        key (str, optional): Name the lines are indexed under; defaults to the file name.
+        data (bytes, optional): The file's content if already read (e.g. a decompressed backup).
+
+    Returns:
+        int: Lines indexed.
+    """
+    name = key or os.path.basename(path)
+    row = conn.execute("SELECT offset, last_logged_at, last_level FROM log_files WHERE name = ?", (name,)).fetchone()
+    offset, logged_at, level = row if row else (0, None, None)
+    size = os.path.getsize(path) if data is None else len(data)
+    if size < offset:
+        logging.info(f"{name} shrank (cleared or rolled over); indexing it again from the start")
+        drop_file(conn, name)
+        offset, logged_at, level = 0, None, None
+    if size == offset:
+        return 0
+
+    # Default for continuation lines before the first record of a file
+    logged_at = logged_at or datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d %H:%M:%S.000')
+    level = level or 'INFO'
+
+    indexed = 0
+    with open(path, 'rb') if data is None else io.BytesIO(data) as f:
+        f.seek(offset)
+        while offset < size:
+            chunk = f.read(min(INGEST_CHUNK_BYTES, size - offset))
+            end = chunk.rfind(b'\n') + 1
+            if not end:
+                if len(chunk) < INGEST_CHUNK_BYTES:
+                    break  # Only a partial line so far
+                end = len(chunk)  # A single line longer than a chunk; index it in pieces
+            records, messages = [], []
+            position = offset
+            for raw in chunk[:end].splitlines(keepends=True):
+                match = RECORD_PATTERN.match(raw.rstrip(b'\r\n'))
+                if match:
+                    logged_at = f"{match[1].decode()}.{match[2].decode()}"
+                    level = match[3].decode()
+                    message = match[4]
+                else:
+                    message = raw.rstrip(b'\r\n')
+                if message.strip():
+                    records.append((logged_at, level, name, position))
+                    messages.append(message.decode('utf-8', 'replace'))
+                position += len(raw)
+
+            with conn:  # Records, their text and the new offset commit together
+                first_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM log_records").fetchone()[0]
+                conn.executemany(
+                    "INSERT INTO log_records (id, logged_at, level, file, offset) VALUES (?, ?, ?, ?, ?)",
+                    [(first_id + i, *record) for i, record in enumerate(records)]
+                )
+                conn.executemany(
+                    "INSERT INTO log_fts (rowid, message) VALUES (?, ?)",
+                    [(first_id + i, message) for i, message in enumerate(messages)]
+                )
+                offset += end
+                conn.execute(
+                    """
+                    INSERT INTO log_files (name, offset, last_logged_at, last_level) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(name) DO UPDATE SET
+                        offset = excluded.offset,
+                        last_logged_at = excluded.last_logged_at,
+                        last_level = excluded.last_level
+                    """,
+                    (name, offset, logged_at, level)
+                )
+            indexed += len(records)
+            f.seek(offset)
+    return indexed
+
+
+def ingest_backup(conn: sqlite3.Connection, path: str) -> tuple[str, int]:
+    """
+    Index a gzipped backup under the digest of its content, unless it already is.
+
+    Args:
+        conn (sqlite3.Connection): Search database connection.
+        path (str): Backup file (rbc_YYYY-MM-DD.log.N.gz).
+
+    Returns:
+        tuple[str, int]: The backup's digest, and the lines indexed (0 if it was indexed before).
+    """
+    name = os.path.basename(path)
+    with open(path, 'rb') as f:
+        compressed = f.read()
+    digest = hashlib.sha1(compressed).hexdigest()
+    known = conn.execute("SELECT name FROM log_backups WHERE digest = ?", (digest,)).fetchone()
+    if known:
+        if known[0] != name:  # Renumbered by a rollover
+            with conn:
+                conn.execute("UPDATE log_backups SET name = ? WHERE digest = ?", (name, digest))
+        return digest, 0
+    indexed = ingest_file(conn, path, key=digest, data=gzip.decompress(compressed))
+    with conn:  # Only once every line is in, so an interrupted pass resumes the backup
+        conn.execute("INSERT INTO log_backups (digest, name) VALUES (?, ?)", (digest, name))
+    return digest, indexed
+
+
+def ingest_directory(conn: sqlite3.Connection, log_dir: str, stopping: Callable[[], bool] | None = None) -> int:
+    """
+    Index new lines in every daily log and gzipped backup in log_dir, and drop deleted backups.
+
+    Args:
+        conn (sqlite3.Connection): Search database connection.
+        log_dir (str): Directory holding the logs.
+        stopping (Callable[[], bool], optional): Checked before each file; True ends the pass early.
+
+    Returns:
+        int: Lines indexed across all files.
+    """
+    indexed = 0
+    backups, complete = set(), True
+    # Sorted, so a log that just rolled over drops its old lines before its new backup is indexed
+    for name in sorted(os.listdir(log_dir)):
+        if stopping and stopping():
+            return indexed
+        try:
+            if LOG_FILE_PATTERN.match(name):
+                indexed += ingest_file(conn, os.path.join(log_dir, name))
+            elif BACKUP_FILE_PATTERN.match(name):
+                digest, count = ingest_backup(conn, os.path.join(log_dir, name))
+                backups.add(digest)
+                indexed += count
+        except (OSError, EOFError, zlib.error, sqlite3.Error) as e:  # EOFError: backup still being written
+            logging.warning(f"Failed to index {name}: {e}")
+            complete = complete and not BACKUP_FILE_PATTERN.match(name)
+
+    # Backups that are gone (past the backup count, or deleted); not after a failed read
+    if complete:
+        for digest, in conn.execute("SELECT digest FROM log_backups").fetchall():
+            if digest not in backups:
+                drop_file(conn, digest)
+    return indexed
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn search box text into an FTS5 query: every word must match, a trailing '*'
+    matches a prefix, and FTS operators typed by the user are taken literally.
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith('*')
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def search_logs(conn: sqlite3.Connection, text: str, since: str | None = None, until: str | None = None,
+                levels: set[str] | None = None, limit: int = SEARCH_LIMIT) -> list[tuple]:
+    """
+    Ranked full-text search over indexed log lines.
+
+    Args:
+        conn (sqlite3.Connection): Search database connection.
+        text (str): Words to find (see fts_query).
+        since (str, optional): Earliest timestamp, 'YYYY-MM-DD HH:MM:SS'.
+        until (str, optional): Latest timestamp, 'YYYY-MM-DD HH:MM:SS'.
+        levels (set[str], optional): Levels to include; all if None.
+        limit (int, optional): Most results returned.
+
+    Returns:
+        list[tuple]: (logged_at, level, file, offset, highlighted message), best match first;
+        file is the current name of the log or backup.
+    """
+    query = fts_query(text)
+    if not query:
+        return []
+    sql = """
+        SELECT r.logged_at, r.level, COALESCE(b.name, r.file), r.offset, highlight(log_fts, 0, '[', ']')
+        FROM log_fts JOIN log_records r ON r.id = log_fts.rowid
+        LEFT JOIN log_backups b ON b.digest = r.file
+        WHERE log_fts MATCH ?
+    """
+    params: list = [query]
+    if since or until:
+        # Lines are ingested in time order per file, so the id range of the time range narrows the
+        # FTS scan itself (rowid constraints are applied inside FTS5); logged_at is still checked exactly.
+        since, until = since or '', until or '9999'
+        first_id, last_id = conn.execute(
+            "SELECT MIN(id), MAX(id) FROM log_records WHERE logged_at >= ? AND logged_at <= ?", (since, until)
+        ).fetchone()
+        if first_id is None:
+            return []
+        sql += " AND log_fts.rowid BETWEEN ? AND ? AND r.logged_at >= ? AND r.logged_at <= ?"
+        params.extend((first_id, last_id, since, until))
+    if levels is not None:
+        sql += f" AND r.level IN ({', '.join('?' * len(levels))})"
+        params.extend(sorted(levels))
+    sql += " ORDER BY log_fts.rank, r.logged_at DESC LIMIT ?"
+    params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+class LogSearchIndexer:
+    """Keeps the search database up to date from a background thread."""
+
+    def __init__(self, log_dir: str, db_path: str, interval_s: float = INDEX_INTERVAL_S) -> None:
+        self.log_dir = log_dir
+        self.db_path = db_path
+        self.interval_s = interval_s
+        self._wake = threading.Event()
+        self._stopping = False
+        self._idle = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='log-search-indexer', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def request(self) -> None:
+        """Run an ingestion pass now instead of waiting for the next interval."""
+        self._idle.clear()
+        self._wake.set()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Wait for a requested pass to finish (for scripts and benchmarks)."""
+        return self._idle.wait(timeout)
+
+    def stop(self, timeout: float = STOP_TIMEOUT_S) -> None:
+        """Stop the thread, waiting up to timeout seconds for the file in progress to finish."""
+        self._stopping = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            conn = connect_log_search(self.db_path)
+        except sqlite3.Error as e:
+            logging.error(f"Log search index unavailable: {e}")
+            return
+        try:
+            while not self._stopping:
+                # Not logged: each pass would add a line for the next one to index
+                ingest_directory(conn, self.log_dir, lambda: self._stopping)
+                self._idle.set()
+                self._wake.wait(self.interval_s)
+                self._wake.clear()
+        finally:
+            conn.close()
@@ -1,14 +1,27 @@
+from app.utils.startup_timeline import startup_timeline  # First import: starts the startup clock
+
+import logging
 import sys
-from PySide6.QtWidgets import QApplication
-from app.gui.mainwindow import RBCCommunityMap
-from app.config.constants import APP_ICON
-from app.config.theme import load_theme_settings
-from app.config.constants import setup_logging, get_logging_level_from_db
-from app.config.constants import SplashScreen
+
+from app.config.dependencies import check_and_install_modules
 
 
 def main() -> None:
     """Run the RBC City Map Application."""
+    # Check dependencies before anything imports PySide6; importing app modules has no side effects
+    with startup_timeline.stage('dependency_check'):
+        if not check_and_install_modules():
+            sys.exit("Missing required modules. Please resolve the issues and try again.")
+
+    with startup_timeline.stage('imports'):
+        from PySide6.QtWidgets import QApplication
+        from app.gui.mainwindow import RBCCommunityMap
+        from app.config.constants import APP_ICON, DB_PATH, DEFAULT_LOG_LEVEL, LOG_FORMAT, VERSION_NUMBER
+        from app.config.constants import setup_logging, get_logging_level_from_db, get_logger_levels_from_db
+        from app.config.constants import ensure_directories_exist, set_tracing
+        from app.config.constants import SplashScreen
+        from app.database.schema import initialize_database
+
     app = QApplication(sys.argv)
     app.setWindowIcon(APP_ICON)
 
@@ -16,32 +29,29 @@ def main() -> None:
     splash.show()
     splash.show_message("Starting up...")
 
-    # Setup logging
-    setup_logging(log_level=get_logging_level_from_db())
+    # Create required directories before logging and the database touch them
+    if not ensure_directories_exist():
+        print("Some directories could not be created. Application may encounter issues.", file=sys.stderr)
+
+    # Setup logging; records are written to disk on a background thread
+    if not setup_logging(log_level=get_logging_level_from_db(), logger_levels=get_logger_levels_from_db()):
+        print("Logging setup failed. Continuing without file logging.", file=sys.stderr)
+        logging.basicConfig(level=DEFAULT_LOG_LEVEL, format=LOG_FORMAT, stream=sys.stderr)  # Fallback to console
+    if '--trace' in sys.argv:
+        set_tracing(True)  # Log every hot-path message, unsampled
+    logging.info(f"Launching app version {VERSION_NUMBER}")
     splash.show_message("Logging ready")
 
-    # Create main window
-    main_window = RBCCommunityMap()
-
-    # Load and apply theme
-    main_window.color_mappings = load_theme_settings()
-    main_window.apply_theme()
-    splash.show_message("Theme applied")
-
-    # Initialize with splash-decorated methods
-    init_methods = [
-        '_init_scraper',
-        '_init_window_properties',
-        '_init_web_profile',
-        '_init_ui_state',
-        '_init_characters',
-        '_init_ui_components',
-        '_finalize_setup'
-    ]
-
-    for name in init_methods:
-        method = getattr(main_window, name)
-        setattr(main_window, name, splash.show_message(name)(method))  # if splash_message is a decorator
+    # Initialize database schema and seed data
+    with startup_timeline.stage('db_init'):
+        db_ready = initialize_database(DB_PATH)
+    if not db_ready:
+        logging.warning("Database initialization failed. Application may encounter issues.")
+    splash.show_message("Database ready")
+
+    # Create main window (it loads and applies the theme itself); stages are recorded on the startup timeline as they run.
+    # With --profile-startup the app prints the timeline summary and exits once startup completes.
+    main_window = RBCCommunityMap(profile_startup='--profile-startup' in sys.argv)
 
     main_window.splash = splash
     main_window.show()
@@ -50,4 +60,6 @@ def main() -> None:
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()  # Log analytics runs a process pool; needed in frozen builds
     main()
@@ -4,48 +4,100 @@
 
     def setup_cookie_handling(self) -> None:
         """
-        Set up cookie handling by connecting the QWebEngineProfile's cookie store and loading saved cookies.
+        Set up cookie handling by connecting the QWebEngineProfile's cookie store.
+
+        Saved cookies are read on a startup worker and injected by load_cookies
+        once the first navigation is under way.
+
+        Cookies the web engine reports are compared against an in-memory copy of
+        the 'cookies' table (self.cookie_cache); changed ones are marked dirty and
+        written in one transaction COOKIE_FLUSH_DELAY_MS after the last change,
+        and at shutdown. Expired cookies are deleted every COOKIE_SWEEP_INTERVAL_MS.
         """
+        self.cookie_cache: dict[tuple[str, str, str], tuple] = {}  # (name, domain, path) -> (value, expiration, secure, httponly)
+        self.dirty_cookies: set[tuple[str, str, str]] = set()
+        self.cookie_flush_timer = QTimer(self)
+        self.cookie_flush_timer.setSingleShot(True)
+        self.cookie_flush_timer.setInterval(COOKIE_FLUSH_DELAY_MS)
+        self.cookie_flush_timer.timeout.connect(self.flush_cookies)
+        QApplication.instance().aboutToQuit.connect(self.flush_cookies)
+
+        self.cookie_sweep_timer = QTimer(self)
+        self.cookie_sweep_timer.setInterval(COOKIE_SWEEP_INTERVAL_MS)
+        self.cookie_sweep_timer.timeout.connect(self.sweep_expired_cookies)
+        self.cookie_sweep_timer.start()
+
         self.cookie_store = self.web_profile.cookieStore()
         self.cookie_store.cookieAdded.connect(self.on_cookie_added)
-        self.load_cookies()
         logging.debug("Cookie handling initialized")
 
-    def load_cookies(self) -> None:
+    def read_stored_cookies(self) -> list[tuple]:
         """
-        Load cookies from the 'cookies' table and inject them into the QWebEngineProfile.
+        Read saved cookies from the 'cookies' table, after deleting expired ones.
+
+        Touches no Qt objects, so it is safe to run on a startup worker thread.
+
+        Returns:
+            list[tuple]: (name, domain, path, value, expiration, secure, httponly) rows.
         """
+        delete_expired_cookies(DB_PATH)
         try:
             with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT name, domain, path, value, expiration, secure, httponly FROM cookies")
-                cookies = cursor.fetchall()
-
-                for name, domain, path, value, expiration, secure, httponly in cookies:
-                    cookie = QNetworkCookie(name.encode('utf-8'), value.encode('utf-8'))
-                    cookie.setDomain(domain)
-                    cookie.setPath(path)
-                    cookie.setSecure(bool(secure))
-                    cookie.setHttpOnly(bool(httponly))
-                    if expiration:
-                        try:
-                            # Handle both string (ISO) and int (epoch) expiration formats
-                            if isinstance(expiration, str):
-                                cookie.setExpirationDate(QDateTime.fromString(expiration, Qt.ISODate))
-                            elif isinstance(expiration, int):
-                                cookie.setExpirationDate(QDateTime.fromSecsSinceEpoch(expiration))
-                            else:
-                                logging.warning(f"Invalid expiration type for cookie '{name}': {type(expiration)}")
-                        except ValueError as e:
-                            logging.warning(f"Failed to parse expiration '{expiration}' for cookie '{name}': {e}")
-                    self.cookie_store.setCookie(cookie, QUrl(f"https://{domain}"))
-                logging.debug(f"Loaded {len(cookies)} cookies from database")
+                return conn.execute("SELECT name, domain, path, value, expiration, secure, httponly FROM cookies").fetchall()
         except sqlite3.Error as e:
             logging.error(f"Failed to load cookies: {e}")
+            return []
+
+    def load_cookies(self, cookies: list[tuple] | None = None) -> None:
+        """
+        Fill the cookie cache and inject saved cookies into the QWebEngineProfile in one pass.
+
+        Runs before the first navigation, so its first request carries the saved session.
+        Cookies already reported by the profile's store are newer than the saved ones,
+        so those are neither cached over nor injected.
+
+        Args:
+            cookies (list[tuple], optional): Rows from read_stored_cookies; read from the database when omitted.
+        """
+        if cookies is None:
+            cookies = self.read_stored_cookies()
+
+        batch = []
+        for name, domain, path, value, expiration, secure, httponly in cookies:
+            key = (name, domain, path)
+            if key in self.cookie_cache:
+                continue
+            # Cached before injecting, so the cookieAdded echo of each one is recognized as unchanged
+            self.cookie_cache[key] = (value, expiration, int(bool(secure)), int(bool(httponly)))
+
+            cookie = QNetworkCookie(name.encode('utf-8'), value.encode('utf-8'))
+            cookie.setDomain(domain)
+            cookie.setPath(path)
+            cookie.setSecure(bool(secure))
+            cookie.setHttpOnly(bool(httponly))
+            if expiration:
+                try:
+                    # Handle both string (ISO) and int (epoch) expiration formats
+                    if isinstance(expiration, str):
+                        cookie.setExpirationDate(QDateTime.fromString(expiration, Qt.ISODate))
+                    elif isinstance(expiration, int):
+                        cookie.setExpirationDate(QDateTime.fromSecsSinceEpoch(expiration))
+                    else:
+                        logging.warning(f"Invalid expiration type for cookie '{name}': {type(expiration)}")
+                except ValueError as e:
+                    logging.warning(f"Failed to parse expiration '{expiration}' for cookie '{name}': {e}")
+            batch.append((cookie, QUrl(f"https://{domain}")))
+
+        for cookie, origin in batch:
+            self.cookie_store.setCookie(cookie, origin)
+        startup_timeline.count('cookie_load', len(batch))
+        logging.debug(f"Loaded {len(batch)} of {len(cookies)} cookies from database")
 
     def on_cookie_added(self, cookie: QNetworkCookie) -> None:
+        """
+        Record a cookie the web engine set; only changes reach the database, on the next flush.
+        """
         name = bytes(cookie.name()).decode()
-        value = bytes(cookie.value()).decode()
         domain = cookie.domain().lstrip('.')  # Normalize domain
 
         # Only process quiz.ravenblack.net
@@ -56,18 +108,51 @@
         if name in ['ip', 'stamp']:
             return
 
+        key = (name, domain, cookie.path())
+        entry = (
+            bytes(cookie.value()).decode(),
+            None if cookie.isSessionCookie() else cookie.expirationDate().toString(Qt.ISODate),
+            int(cookie.isSecure()),
+            int(cookie.isHttpOnly()),
+        )
+        if self.cookie_cache.get(key) == entry:
+            return
+        self.cookie_cache[key] = entry
+        self.dirty_cookies.add(key)
+        self.cookie_flush_timer.start()  # Restart: one write after a burst of changes
+        logging.debug(f"Cookie '{name}' changed for domain '{domain}'")
+
+    def flush_cookies(self) -> None:
+        """
+        Write every changed cookie in one transaction.
+
+        On failure the cookies stay dirty and are retried with the next change or at shutdown.
+        """
+        self.cookie_flush_timer.stop()
+        if not self.dirty_cookies:
+            return
+        dirty = sorted(self.dirty_cookies)
         try:
             with sqlite3.connect(DB_PATH) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT value FROM cookies WHERE name = ? AND domain = ?", (name, domain))
-                row = cursor.fetchone()
-
-                if not row or row[0] != value:
-                    cursor.execute(
-                        "REPLACE INTO cookies (name, value, domain, path, secure, httponly) VALUES (?, ?, ?, ?, ?, ?)",
-                        (name, value, domain, cookie.path(), int(cookie.isSecure()), int(cookie.isHttpOnly()))
-                    )
-                    conn.commit()
-                    logging.debug(f"Cookie '{name}' updated for domain '{domain}'")
-        except Exception as e:
-                logging.error(f"Error updating cookie '{name}': {e}")
+                conn.executemany(
+                    """
+                    INSERT INTO cookies (name, domain, path, value, expiration, secure, httponly)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(name, domain, path) DO UPDATE SET
+                        value = excluded.value,
+                        expiration = excluded.expiration,
+                        secure = excluded.secure,
+                        httponly = excluded.httponly
+                    """,
+                    [key + self.cookie_cache[key] for key in dirty]
+                )
+            self.dirty_cookies.difference_update(dirty)
+            logging.debug(f"Flushed {len(dirty)} changed cookies")
+        except sqlite3.Error as e:
+            logging.error(f"Failed to save {len(dirty)} cookies: {e}")
+
+    def sweep_expired_cookies(self) -> None:
+        """Delete expired cookies from the database and the cookie cache."""
+        for key in delete_expired_cookies(DB_PATH):
+            self.cookie_cache.pop(key, None)
+            self.dirty_cookies.discard(key)
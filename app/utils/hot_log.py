@@ -0,0 +1,123 @@
+# app/utils/hot_log.py
+"""
+RBCMap Hot-Path Logging
+
+Logger wrapper for code that runs per frame, per grid cell or per page
+load (draw_minimap, recenter_minimap, process_html). Compared with calling
+the logger directly:
+
+- messages take %-style arguments and are only formatted when emitted,
+- DEBUG messages are sampled, one in every sample_every per call site,
+- each call site emits at most one DEBUG or INFO message per interval_s;
+  the next one that gets through reports how many were suppressed in between,
+- WARNING and above always pass straight through.
+
+set_tracing(True) (Settings > Logging Level > Trace Hot Paths, or the
+--trace flag) turns sampling and rate limits off and lets every hot-path
+message through, for debugging.
+
+Counters are updated without locking; under concurrent use a few messages
+may be miscounted, never lost from the WARNING and ERROR paths.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import sys
+import time
+
+# At most one message per call site per this many seconds
+HOT_LOG_INTERVAL_S = 1.0
+
+# DEBUG messages emitted per call site: one in this many calls
+HOT_LOG_SAMPLE_EVERY = 50
+
+_tracing = False
+_hot_loggers: list['HotPathLogger'] = []
+
+
+def set_tracing(enabled: bool) -> None:
+    """
+    Turn full tracing of hot paths on or off.
+
+    While on, every hot-path logger is lowered to DEBUG and nothing is sampled or
+    rate limited; turning it off restores the loggers' previous levels.
+    """
+    global _tracing
+    if enabled == _tracing:
+        return
+    _tracing = enabled
+    for hot_logger in _hot_loggers:
+        hot_logger.set_tracing(enabled)
+    logging.info(f"Hot-path tracing {'enabled' if enabled else 'disabled'}")
+
+
+def tracing_enabled() -> bool:
+    return _tracing
+
+
+class HotPathLogger:
+    """Rate-limited, sampled, lazily formatted front end for one logger."""
+
+    def __init__(self, name: str, interval_s: float = HOT_LOG_INTERVAL_S,
+                 sample_every: int = HOT_LOG_SAMPLE_EVERY) -> None:
+        """
+        Args:
+            name (str): Name of the underlying logger (e.g. 'rbc.minimap').
+            interval_s (float, optional): Minimum seconds between messages from one call site.
+            sample_every (int, optional): Emit one DEBUG message in this many per call site.
+        """
+        self.logger = logging.getLogger(name)
+        self.interval_s = interval_s
+        self.sample_every = max(1, sample_every)
+        self._calls: dict[tuple, int] = {}  # Call site -> DEBUG calls seen, for sampling
+        self._last_emit: dict[tuple, float] = {}  # Call site -> monotonic time of the last message
+        self._suppressed: dict[tuple, int] = {}  # Call site -> messages dropped since then
+        self._level_before_trace: int | None = None
+        _hot_loggers.append(self)
+
+    def set_tracing(self, enabled: bool) -> None:
+        if enabled:
+            self._level_before_trace = self.logger.level
+            self.logger.setLevel(logging.DEBUG)
+        elif self._level_before_trace is not None:
+            self.logger.setLevel(self._level_before_trace)
+            self._level_before_trace = None
+
+    def debug(self, msg: str, *args) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, sampled=True)
+
+    def info(self, msg: str, *args) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args)
+
+    def warning(self, msg: str, *args) -> None:
+        self.logger.warning(msg, *args, stacklevel=2)
+
+    def error(self, msg: str, *args, exc_info=None) -> None:
+        self.logger.error(msg, *args, exc_info=exc_info, stacklevel=2)
+
+    def _log(self, level: int, msg: str, args: tuple, sampled: bool = False) -> None:
+        if _tracing:
+            self.logger.log(level, msg, *args, stacklevel=3)
+            return
+
+        frame = sys._getframe(2)
+        site = (frame.f_code, frame.f_lineno)
+        if sampled:
+            calls = self._calls.get(site, 0)
+            self._calls[site] = calls + 1
+            if calls % self.sample_every:
+                return
+
+        now = time.monotonic()
+        if now - self._last_emit.get(site, -self.interval_s) < self.interval_s:
+            self._suppressed[site] = self._suppressed.get(site, 0) + 1
+            return
+        self._last_emit[site] = now
+        suppressed = self._suppressed.pop(site, 0)
+        if suppressed:
+            msg = f"{msg if args else msg.replace('%', '%%')} [%d similar suppressed]"
+            args = (*args, suppressed)
+        self.logger.log(level, msg, *args, stacklevel=3)
@@ -0,0 +1,208 @@
+# app/utils/page_load_telemetry.py
+"""
+RBCMap Page Load Telemetry
+
+Times each stage between a movement keypress and the updated minimap with
+monotonic timers, so it's clear where a page load's time goes:
+
+    submit          keypress (including time queued) -> navigation started
+    navigation      navigation started -> loadFinished
+    load_finished   the loadFinished handler, up to requesting the page's HTML
+    to_html         toHtml serialization -> process_html called
+    parse           extracting the coordinates from the HTML
+    minimap_render  recentering and redrawing the minimap
+    db_write        extracting coins and writing them to the database
+    total           start of the trace -> end of process_html
+
+Loads that don't start with a keypress (links, reloads) are traced from the
+navigation start. Each duration goes into a histogram per stage with
+geometric buckets BUCKET_GROWTH apart, so percentiles are accurate to within
+that factor however long the session runs. Each session's histograms are
+persisted to the `page_load_metrics` table; the last MAX_STORED_SESSIONS are
+kept.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import math
+import sqlite3
+import time
+import uuid
+from collections import Counter
+from typing import Callable
+
+STAGES = ('submit', 'navigation', 'load_finished', 'to_html', 'parse', 'minimap_render', 'db_write', 'total')
+
+# Ratio between neighbouring histogram bucket bounds
+BUCKET_GROWTH = 1.1
+
+# Shortest duration told apart from zero
+MIN_BUCKET_MS = 0.01
+
+# Number of sessions kept in page_load_metrics
+MAX_STORED_SESSIONS = 20
+
+PERCENTILES = (50, 95, 99)
+
+
+def bucket_of(ms: float) -> int:
+    """Histogram bucket of a duration: the smallest n with BUCKET_GROWTH ** n >= ms."""
+    return math.ceil(math.log(max(ms, MIN_BUCKET_MS)) / math.log(BUCKET_GROWTH))
+
+
+def bucket_ms(bucket: int) -> float:
+    """Upper bound of a histogram bucket in ms."""
+    return BUCKET_GROWTH ** bucket
+
+
+def percentile(histogram: Counter, p: float) -> float | None:
+    """
+    The p-th percentile of a histogram, as the upper bound of the bucket it falls in.
+
+    Returns:
+        float | None: Duration in ms, or None if the histogram is empty.
+    """
+    total = sum(histogram.values())
+    if not total:
+        return None
+    rank = p / 100 * total
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= rank:
+            return bucket_ms(bucket)
+    return bucket_ms(max(histogram))
+
+
+class PageLoadTelemetry:
+    """Stage timings of the page loads in one session."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.session_id = uuid.uuid4().hex
+        self.clock = clock
+        self.histograms: dict[str, Counter] = {stage: Counter() for stage in STAGES}
+        self.trace_start: float | None = None
+        self.last_mark: float | None = None
+        self.dirty = False  # Recorded since the last save
+
+    @property
+    def active(self) -> bool:
+        return self.trace_start is not None
+
+    def begin(self, at: float | None = None) -> None:
+        """
+        Start a trace, replacing any unfinished one.
+
+        Args:
+            at (float, optional): Clock time the trace started (e.g. the keypress); now if None.
+        """
+        self.trace_start = self.last_mark = self.clock() if at is None else at
+
+    def navigation_started(self, pressed_at: float | None = None) -> None:
+        """
+        A page load started: start a trace for it.
+
+        Args:
+            pressed_at (float, optional): Clock time of the keypress that caused the load;
+                the trace then starts there, with the time until now as the submit stage.
+        """
+        self.begin(pressed_at)
+        if pressed_at is not None:
+            self.mark('submit')
+
+    def mark(self, stage: str) -> None:
+        """Record the time since the previous mark as a stage of the current trace, if any."""
+        if not self.active:
+            return
+        now = self.clock()
+        self.record(stage, (now - self.last_mark) * 1000)
+        self.last_mark = now
+
+    def finish(self) -> None:
+        """Record the whole trace as 'total' and end it."""
+        if not self.active:
+            return
+        self.record('total', (self.clock() - self.trace_start) * 1000)
+        self.cancel()
+
+    def cancel(self) -> None:
+        """End the current trace without recording a total (e.g. the load failed)."""
+        self.trace_start = self.last_mark = None
+
+    def record(self, stage: str, ms: float) -> None:
+        self.histograms[stage][bucket_of(ms)] += 1
+        self.dirty = True
+
+    def save(self, db_path: str) -> bool:
+        """
+        Persist this session's histograms to the page_load_metrics table, if anything changed.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+
+        Returns:
+            bool: True if the histograms were written, False otherwise.
+        """
+        if not self.dirty:
+            return False
+        try:
+            with sqlite3.connect(db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO page_load_metrics (session_id, stage, bucket, count)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(session_id, stage, bucket) DO UPDATE SET
+                        count = excluded.count, recorded_at = CURRENT_TIMESTAMP
+                    """,
+                    [(self.session_id, stage, bucket, count)
+                     for stage, histogram in self.histograms.items() for bucket, count in histogram.items()]
+                )
+                conn.execute("""
+                    DELETE FROM page_load_metrics WHERE session_id NOT IN (
+                        SELECT session_id FROM page_load_metrics GROUP BY session_id ORDER BY MAX(id) DESC LIMIT ?
+                    )
+                """, (MAX_STORED_SESSIONS,))
+                conn.commit()
+            self.dirty = False
+            logging.debug(f"Page load metrics saved for session {self.session_id}")
+            return True
+        except sqlite3.Error as e:
+            logging.error(f"Failed to save page load metrics: {e}")
+            return False
+
+
+# Telemetry for the current process
+page_load_telemetry = PageLoadTelemetry()
+
+# -----------------------
+# Reporting
+# -----------------------
+
+def load_histograms(db_path: str) -> tuple[dict[str, Counter], int]:
+    """
+    Merge the stored histograms of every kept session.
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+
+    Returns:
+        tuple[dict[str, Counter], int]: Histograms per stage, and the number of sessions merged.
+    """
+    histograms = {stage: Counter() for stage in STAGES}
+    try:
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT stage, bucket, SUM(count) FROM page_load_metrics GROUP BY stage, bucket")
+            for stage, bucket, count in rows:
+                histograms.setdefault(stage, Counter())[bucket] = count
+            sessions = conn.execute("SELECT COUNT(DISTINCT session_id) FROM page_load_metrics").fetchone()[0]
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read page load metrics: {e}")
+        return histograms, 0
+    return histograms, sessions
+
+
+def summary_rows(histograms: dict[str, Counter]) -> list[tuple[str, int, list[float | None]]]:
+    """(stage, samples, [p50, p95, p99]) for each stage, in pipeline order."""
+    return [(stage, sum(histogram.values()), [percentile(histogram, p) for p in PERCENTILES])
+            for stage, histogram in histograms.items()]
@@ -0,0 +1,177 @@
+# app/utils/startup_timeline.py
+"""
+RBCMap Startup Timeline
+
+Records monotonic timestamps for each startup stage (imports, database
+init, catalog load, web profile, cookies, UI build, first minimap paint,
+first page load) and persists them to the `startup_metrics` table so
+cold and warm starts can be compared across runs.
+
+All times are milliseconds since this module was first imported, which
+main() does before anything else.
+
+See LICENSE for usage restrictions.
+"""
+
+import logging
+import os
+import sqlite3
+import statistics
+import time
+import uuid
+from contextlib import contextmanager
+
+# Captured at import; main.py imports this module first
+PROCESS_START = time.perf_counter()
+
+# Optional run label (e.g. 'cold' / 'warm'), set by the headless startup harness
+STARTUP_LABEL_ENV = 'RBC_STARTUP_LABEL'
+
+# Number of runs kept in startup_metrics
+MAX_STORED_RUNS = 50
+
+
+def _elapsed_ms() -> float:
+    return (time.perf_counter() - PROCESS_START) * 1000
+
+
+class StartupTimeline:
+    """Collects startup stage timings for a single launch."""
+
+    def __init__(self) -> None:
+        self.run_id = uuid.uuid4().hex
+        self.label = os.environ.get(STARTUP_LABEL_ENV)
+        self.stages: list[tuple[str, float, float]] = []  # (stage, start_ms, duration_ms)
+        self.counts: dict[str, int] = {}  # stage -> items it handled (e.g. cookies injected)
+        self.finished = False
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as a named stage."""
+        start = _elapsed_ms()
+        try:
+            yield
+        finally:
+            self.stages.append((name, start, _elapsed_ms() - start))
+
+    def mark(self, name: str) -> None:
+        """Record an instantaneous event (duration 0) such as 'first_minimap_paint'."""
+        self.stages.append((name, _elapsed_ms(), 0.0))
+
+    def mark_once(self, name: str) -> bool:
+        """
+        Record an event only the first time it happens during startup.
+
+        Returns:
+            bool: True if the event was recorded by this call.
+        """
+        if self.finished or any(stage == name for stage, _, _ in self.stages):
+            return False
+        self.mark(name)
+        return True
+
+    def count(self, stage: str, items: int) -> None:
+        """Record how many items a stage handled, saved alongside its timing."""
+        if not self.finished:
+            self.counts[stage] = items
+
+    def save(self, db_path: str) -> bool:
+        """
+        Persist the recorded stages to the startup_metrics table and stop recording.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+
+        Returns:
+            bool: True if the metrics were written, False otherwise.
+        """
+        if self.finished:
+            return False
+        self.finished = True
+        try:
+            with sqlite3.connect(db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO startup_metrics (run_id, label, stage, start_ms, duration_ms, item_count)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [(self.run_id, self.label, stage, start, duration, self.counts.get(stage))
+                     for stage, start, duration in self.stages]
+                )
+                conn.execute("""
+                    DELETE FROM startup_metrics WHERE run_id NOT IN (
+                        SELECT run_id FROM startup_metrics GROUP BY run_id ORDER BY MAX(id) DESC LIMIT ?
+                    )
+                """, (MAX_STORED_RUNS,))
+                conn.commit()
+            logging.info(f"Startup metrics saved for run {self.run_id} ({len(self.stages)} stages)")
+            return True
+        except sqlite3.Error as e:
+            logging.error(f"Failed to save startup metrics: {e}")
+            return False
+
+
+# Timeline for the current process
+startup_timeline = StartupTimeline()
+
+# -----------------------
+# Reporting
+# -----------------------
+
+def summarize_startup_metrics(db_path: str, runs: int = 10) -> str:
+    """
+    Summarize the most recent startup runs, per label and stage.
+
+    For every stage the latest value and the median over the last `runs`
+    runs with the same label are reported, in the order the stages happen,
+    with the latest item count of stages that record one (see count).
+
+    Args:
+        db_path (str): Path to the SQLite database file.
+        runs (int, optional): Number of recent runs per label to include. Defaults to 10.
+
+    Returns:
+        str: Plain-text report.
+    """
+    try:
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("""
+                SELECT COALESCE(label, 'default'), run_id, stage, start_ms, duration_ms, item_count
+                FROM startup_metrics
+                WHERE run_id IN (
+                    SELECT run_id FROM startup_metrics
+                    GROUP BY run_id
+                    ORDER BY MAX(id) DESC
+                    LIMIT ?
+                )
+                ORDER BY id
+            """, (runs * 4,)).fetchall()
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read startup metrics: {e}")
+        return f"Failed to read startup metrics: {e}"
+
+    if not rows:
+        return "No startup metrics recorded yet."
+
+    by_label: dict[str, dict[str, list[tuple[str, float, float, int | None]]]] = {}
+    for label, run_id, stage, start, duration, items in rows:
+        by_label.setdefault(label, {}).setdefault(run_id, []).append((stage, start, duration, items))
+
+    lines = []
+    for label, label_runs in by_label.items():
+        recent = list(label_runs.values())[-runs:]
+        latest = {stage: (start, duration, items) for stage, start, duration, items in recent[-1]}
+        order = sorted(latest, key=lambda stage: latest[stage][0])
+        lines.append(f"Startup timeline [{label}] - {len(recent)} run(s), times in ms")
+        lines.append(f"  {'stage':<24}{'at':>10}{'took':>10}{'median at':>12}{'median took':>13}{'items':>8}")
+        for stage in order:
+            starts = [start for run in recent for s, start, _, _ in run if s == stage]
+            durations = [duration for run in recent for s, _, duration, _ in run if s == stage]
+            start, duration, items = latest[stage]
+            lines.append(
+                f"  {stage:<24}{start:>10.1f}{duration:>10.1f}"
+                f"{statistics.median(starts):>12.1f}{statistics.median(durations):>13.1f}"
+                f"{'' if items is None else items:>8}"
+            )
+        lines.append("")
+    return "\n".join(lines).rstrip()